@@ -0,0 +1,68 @@
+"""
+Shared dependencies for the V1 API routes.
+"""
+
+import asyncio
+import logging
+from typing import cast
+
+from fastapi import Depends, HTTPException, Request, status
+
+from src.embedding.local_store import create_vector_client
+from src.embedding.weaviate import WeaviateClient
+from src.summarization.batch import SummaryBatchManager
+from src.utils.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_summary_batch_manager(request: Request) -> SummaryBatchManager:
+    """
+    Get the process-wide summary batch manager created at startup.
+    
+    Args:
+        request: Incoming request
+    
+    Returns:
+        SummaryBatchManager: Summary batch manager
+    """
+    return request.app.state.summary_batch_manager
+
+
+
+async def get_weaviate_client(
+    request: Request, settings: Settings = Depends(get_settings)
+) -> WeaviateClient:
+    """
+    Get the process-wide pooled Weaviate client.
+    
+    The client is created at startup; if Weaviate was unreachable then, it is
+    created on first use instead. With ``vector_backend`` set to ``local`` this
+    is the embedded LocalVectorStore, which has the same interface.
+    
+    Args:
+        request: Incoming request
+        settings: Application settings
+        
+    Returns:
+        WeaviateClient: Shared Weaviate client
+        
+    Raises:
+        HTTPException: If Weaviate is unavailable
+    """
+    state = request.app.state
+    if state.weaviate_client is not None:
+        return cast(WeaviateClient, state.weaviate_client)
+    
+    async with state.weaviate_client_lock:
+        if state.weaviate_client is None:
+            try:
+                state.weaviate_client = await asyncio.to_thread(create_vector_client, settings)
+            except Exception as e:
+                logger.error(f"Weaviate is unavailable: {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=f"Weaviate is unavailable: {str(e)}",
+                )
+    
+    return cast(WeaviateClient, state.weaviate_client)
@@ -8,8 +8,11 @@ from typing import Dict, List, Optional, Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field, HttpUrl
 
+from src.api.v1.dependencies import get_weaviate_client
 from src.crawl4ai.client import Crawl4AIClient
 from src.crawl4ai.service import DocumentationCrawlerService
+from src.embedding.service import EmbeddingService
+from src.embedding.weaviate import WeaviateClient
 from src.utils.config import Settings, get_settings
 
 router = APIRouter()
@@ -52,8 +55,14 @@ class CrawlResponse(BaseModel):
         status: Current status of the crawl job
         url: URL that was crawled
         page_count: Number of pages crawled
+        duplicate_count: Number of near-duplicate pages stored as aliases
+        skipped_count: Number of pages unchanged since the last crawl
+        updated_count: Number of changed pages replaced
+        deleted_count: Number of pages deleted because they were not found
         embedded_count: Number of pages embedded
+        embed_failed_count: Number of pages that failed to embed
         summarized_count: Number of pages summarized
+        summary_failed_count: Number of pages whose summary failed
     """
     
     job_id: str = Field(..., description="Unique identifier for the crawl job")
@@ -62,12 +71,30 @@ class CrawlResponse(BaseModel):
     page_count: Optional[int] = Field(
         default=None, description="Number of pages crawled"
     )
+    duplicate_count: Optional[int] = Field(
+        default=None, description="Number of near-duplicate pages stored as aliases"
+    )
+    skipped_count: Optional[int] = Field(
+        default=None, description="Number of pages unchanged since the last crawl"
+    )
+    updated_count: Optional[int] = Field(
+        default=None, description="Number of changed pages replaced"
+    )
+    deleted_count: Optional[int] = Field(
+        default=None, description="Number of pages deleted because they were not found"
+    )
     embedded_count: Optional[int] = Field(
         default=None, description="Number of pages embedded"
     )
+    embed_failed_count: Optional[int] = Field(
+        default=None, description="Number of pages that failed to embed"
+    )
     summarized_count: Optional[int] = Field(
         default=None, description="Number of pages summarized"
     )
+    summary_failed_count: Optional[int] = Field(
+        default=None, description="Number of pages whose summary failed"
+    )
 
 
 class Crawl4AIDocRequest(BaseModel):
@@ -184,6 +211,7 @@ async def get_crawl_status(
 async def crawl_crawl4ai_docs(
     request: Crawl4AIDocRequest = Crawl4AIDocRequest(),
     settings: Settings = Depends(get_settings),
+    weaviate_client: WeaviateClient = Depends(get_weaviate_client),
 ) -> CrawlResponse:
     """
     Crawl Crawl4AI documentation and store it in the vector database.
@@ -191,6 +219,7 @@ async def crawl_crawl4ai_docs(
     Args:
         request: Optional request parameters
         settings: Application settings
+        weaviate_client: Shared Weaviate client
         
     Returns:
         CrawlResponse: Information about the crawl operation
@@ -199,7 +228,10 @@ async def crawl_crawl4ai_docs(
         HTTPException: If there is an error during crawling or storing
     """
     try:
-        crawler_service = DocumentationCrawlerService(settings)
+        embedding_service = EmbeddingService(settings, weaviate_client=weaviate_client)
+        crawler_service = DocumentationCrawlerService(
+            settings, embedding_service=embedding_service
+        )
         
         # Define patterns specific to Crawl4AI documentation
         url = "https://crawl4ai.com/mkdocs/"
@@ -235,8 +267,14 @@ async def crawl_crawl4ai_docs(
             status=result["status"],
             url=url,
             page_count=result["page_count"],
+            duplicate_count=result["duplicate_count"],
+            skipped_count=result["skipped_count"],
+            updated_count=result["updated_count"],
+            deleted_count=result["deleted_count"],
             embedded_count=result["embedded_count"],
+            embed_failed_count=result["embed_failed_count"],
             summarized_count=result["summarized_count"],
+            summary_failed_count=result["summary_failed_count"],
         )
     except Exception as e:
         logger.error(f"Error crawling Crawl4AI documentation: {e}")
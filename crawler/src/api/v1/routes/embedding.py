@@ -3,12 +3,17 @@ API routes for handling document embeddings.
 """
 
 import logging
-from typing import Dict, List, Optional
+import math
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
+from src.api.v1.dependencies import get_weaviate_client
 from src.embedding.service import EmbeddingService
+from src.embedding.tenants import tenant_name
+from src.embedding.weaviate import WeaviateClient
+from src.utils.circuit_breaker import CircuitOpenError
 from src.utils.config import Settings, get_settings
 
 router = APIRouter()
@@ -36,11 +41,17 @@ class DocumentEmbedResponse(BaseModel):
     
     Attributes:
         id: Unique identifier for the embedded document
-        vector_id: ID of the vector in the vector database
+        vector_id: ID of the first chunk's vector in the vector database
+        vector_ids: IDs of the vectors of all chunks of the document
     """
     
     id: str = Field(..., description="Unique identifier for the embedded document")
-    vector_id: str = Field(..., description="ID of the vector in the vector database")
+    vector_id: str = Field(
+        ..., description="ID of the first chunk's vector in the vector database"
+    )
+    vector_ids: List[str] = Field(
+        default=[], description="IDs of the vectors of all chunks of the document"
+    )
 
 
 class SearchRequest(BaseModel):
@@ -51,12 +62,114 @@ class SearchRequest(BaseModel):
         query: Search query
         limit: Maximum number of results to return
         filters: Optional filters to apply to search results
+        group_by_page: Whether to return one result per page instead of per chunk
+        mode: Search mode (vector, keyword or hybrid)
+        alpha: Weight of the vector score in hybrid mode
+        fields: Fields to return for each result (defaults to all)
+        snippet: Whether to return a highlighted snippet instead of the full content
+        snippet_length: Snippet length in characters
+        mmr_lambda: Rerank results for diversity with MMR, weighting relevance
+            against diversity (1 is pure relevance)
+        collapsed_tree: Whether to search RAPTOR summary nodes of every level
+            together with the page chunks
     """
     
     query: str = Field(..., description="Search query")
     limit: int = Field(default=10, description="Maximum number of results to return")
-    filters: Optional[Dict[str, str]] = Field(
-        default={}, description="Filters to apply to search results"
+    filters: Optional[Dict[str, Any]] = Field(
+        default={},
+        description=(
+            "Filters per metadata field: a value (Equal), a list of values "
+            "(ContainsAny) or an {operator, value} condition; 'any' and 'all' "
+            "nest lists of filters"
+        ),
+    )
+    group_by_page: bool = Field(
+        default=False, description="Whether to return one result per page instead of per chunk"
+    )
+    mode: Literal["vector", "keyword", "hybrid"] = Field(
+        default="vector",
+        description="Search mode: semantic vector, BM25 keyword, or hybrid of both",
+    )
+    alpha: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Weight of the vector score in hybrid mode (0 is pure keyword)",
+    )
+    fields: Optional[List[Literal["content", "title", "url", "source", "version"]]] = Field(
+        default=None, description="Fields to return for each result (defaults to all)"
+    )
+    snippet: bool = Field(
+        default=False,
+        description="Whether to return a highlighted snippet instead of the full content",
+    )
+    snippet_length: int = Field(
+        default=300, ge=20, le=5000, description="Snippet length in characters"
+    )
+    mmr_lambda: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Rerank results for diversity with MMR, weighting relevance against "
+            "diversity (1 is pure relevance)"
+        ),
+    )
+    collapsed_tree: bool = Field(
+        default=False,
+        description=(
+            "Whether to search RAPTOR summary nodes of every level together with "
+            "the page chunks"
+        ),
+    )
+
+
+class ChunkMatch(BaseModel):
+    """
+    Model for a matching chunk of a grouped search result.
+    
+    Attributes:
+        id: Unique identifier for the chunk
+        chunk_index: Position of the chunk within its page
+        start_offset: Character offset where the chunk starts in its page
+        end_offset: Character offset where the chunk ends in its page
+        score: Similarity score
+    """
+    
+    id: str = Field(..., description="Unique identifier for the chunk")
+    chunk_index: Optional[int] = Field(
+        default=None, description="Position of the chunk within its page"
+    )
+    start_offset: Optional[int] = Field(
+        default=None, description="Character offset where the chunk starts in its page"
+    )
+    end_offset: Optional[int] = Field(
+        default=None, description="Character offset where the chunk ends in its page"
+    )
+    score: float = Field(..., description="Similarity score")
+
+
+class Snippet(BaseModel):
+    """
+    Model for the best-matching window of a search result.
+    
+    Attributes:
+        text: Snippet text
+        start_offset: Character offset where the snippet starts in the content
+        end_offset: Character offset where the snippet ends in the content
+        highlights: Start and end offsets of query terms within the snippet
+    """
+    
+    text: str = Field(..., description="Snippet text")
+    start_offset: int = Field(
+        ..., description="Character offset where the snippet starts in the content"
+    )
+    end_offset: int = Field(
+        ..., description="Character offset where the snippet ends in the content"
+    )
+    highlights: List[Tuple[int, int]] = Field(
+        default=[], description="Start and end offsets of query terms within the snippet"
     )
 
 
@@ -66,15 +179,60 @@ class SearchResult(BaseModel):
     
     Attributes:
         id: Unique identifier for the document
-        content: Document content
+        content: Document content, unless excluded by the projection or snippet mode
         metadata: Metadata about the document
-        score: Similarity score
+        score: Similarity score (certainty in vector mode, fused score otherwise)
+        parent_url: URL of the page the chunk belongs to
+        chunk_index: Position of the chunk within its page
+        start_offset: Character offset where the chunk starts in its page
+        end_offset: Character offset where the chunk ends in its page
+        node_type: ``summary`` for RAPTOR summary nodes, None for page chunks
+        level: Level of the summary node in its tree (1 is the root)
+        topic: Topic of the summary node
+        summary_id: ID of the summary of the page or node
+        parent_id: ID of the parent summary node
+        chunks: Matching chunks of the page, when grouped by page
+        snippet: Best-matching window of the content, in snippet mode
     """
     
     id: str = Field(..., description="Unique identifier for the document")
-    content: str = Field(..., description="Document content")
-    metadata: Dict[str, str] = Field(..., description="Metadata about the document")
+    content: Optional[str] = Field(
+        default=None,
+        description="Document content, unless excluded by the projection or snippet mode",
+    )
+    metadata: Dict[str, str] = Field(default={}, description="Metadata about the document")
     score: float = Field(..., description="Similarity score")
+    parent_url: Optional[str] = Field(
+        default=None, description="URL of the page the chunk belongs to"
+    )
+    chunk_index: Optional[int] = Field(
+        default=None, description="Position of the chunk within its page"
+    )
+    start_offset: Optional[int] = Field(
+        default=None, description="Character offset where the chunk starts in its page"
+    )
+    end_offset: Optional[int] = Field(
+        default=None, description="Character offset where the chunk ends in its page"
+    )
+    node_type: Optional[str] = Field(
+        default=None, description="summary for RAPTOR summary nodes, None for page chunks"
+    )
+    level: Optional[int] = Field(
+        default=None, description="Level of the summary node in its tree (1 is the root)"
+    )
+    topic: Optional[str] = Field(default=None, description="Topic of the summary node")
+    summary_id: Optional[str] = Field(
+        default=None, description="ID of the summary of the page or node"
+    )
+    parent_id: Optional[str] = Field(
+        default=None, description="ID of the parent summary node"
+    )
+    chunks: Optional[List[ChunkMatch]] = Field(
+        default=None, description="Matching chunks of the page, when grouped by page"
+    )
+    snippet: Optional[Snippet] = Field(
+        default=None, description="Best-matching window of the content, in snippet mode"
+    )
 
 
 class SearchResponse(BaseModel):
@@ -90,13 +248,159 @@ class SearchResponse(BaseModel):
     total: int = Field(..., description="Total number of results")
 
 
+class BatchSearchRequest(BaseModel):
+    """
+    Request model for running several searches at once.
+    
+    Attributes:
+        searches: Searches to run, each with its own limit and filters
+    """
+    
+    searches: List[SearchRequest] = Field(
+        ..., description="Searches to run, each with its own limit and filters"
+    )
+
+
+class BatchSearchResponse(BaseModel):
+    """
+    Response model for a batch search.
+    
+    Attributes:
+        results: Search responses in request order
+    """
+    
+    results: List[SearchResponse] = Field(
+        ..., description="Search responses in request order"
+    )
+
+
+class DeleteByFilterRequest(BaseModel):
+    """
+    Request model for deleting all documents matching metadata filters.
+    
+    Attributes:
+        source: Delete documents from this source
+        version: Delete documents of this version
+        url_prefix: Delete documents whose URL starts with this prefix
+        dry_run: Whether to count matching documents without deleting them
+    """
+    
+    source: Optional[str] = Field(
+        default=None, description="Delete documents from this source"
+    )
+    version: Optional[str] = Field(
+        default=None, description="Delete documents of this version"
+    )
+    url_prefix: Optional[str] = Field(
+        default=None, description="Delete documents whose URL starts with this prefix"
+    )
+    dry_run: bool = Field(
+        default=False,
+        description="Whether to count matching documents without deleting them",
+    )
+
+
+class DeleteByFilterResponse(BaseModel):
+    """
+    Response model for a bulk delete.
+    
+    Attributes:
+        matched: Number of stored objects (chunks) matching the filters, None
+            if an inactive source was dropped
+        deleted: Number of objects deleted, None if an inactive source was dropped
+        failed: Number of objects that could not be deleted
+        dry_run: Whether this was a dry run
+        dropped_tenant: Tenant removed with all its objects, when a whole
+            partitioned source was deleted
+        skipped_tenants: Inactive tenants whose documents were not deleted
+    """
+    
+    matched: Optional[int] = Field(
+        ...,
+        description=(
+            "Number of stored objects matching the filters, null if an inactive "
+            "source was dropped"
+        ),
+    )
+    deleted: Optional[int] = Field(
+        ..., description="Number of objects deleted, null if an inactive source was dropped"
+    )
+    failed: int = Field(..., description="Number of objects that could not be deleted")
+    dry_run: bool = Field(..., description="Whether this was a dry run")
+    dropped_tenant: Optional[str] = Field(
+        default=None,
+        description="Tenant removed with all its objects, when a whole source was deleted",
+    )
+    skipped_tenants: List[str] = Field(
+        default=[], description="Inactive tenants whose documents were not deleted"
+    )
+
+
+class SourcePartition(BaseModel):
+    """
+    Model for the partition (tenant) of a documentation source.
+    
+    Attributes:
+        name: Tenant name derived from the source
+        active: Whether the source is loaded and searchable
+    """
+    
+    name: str = Field(..., description="Tenant name derived from the source")
+    active: bool = Field(..., description="Whether the source is loaded and searchable")
+
+
+class SourceListResponse(BaseModel):
+    """
+    Response model for listing source partitions.
+    
+    Attributes:
+        sources: Partitions of the stored sources
+    """
+    
+    sources: List[SourcePartition] = Field(
+        ..., description="Partitions of the stored sources"
+    )
+
+
+class SourceStatusRequest(BaseModel):
+    """
+    Request model for loading or archiving a source partition.
+    
+    Attributes:
+        active: Whether the source should be loaded and searchable
+    """
+    
+    active: bool = Field(
+        ..., description="Whether the source should be loaded and searchable"
+    )
+
+
+def _degraded(error: CircuitOpenError) -> HTTPException:
+    """
+    Build the response for a search rejected by the Weaviate circuit breaker.
+    
+    Args:
+        error: Rejection raised by the circuit breaker
+    
+    Returns:
+        HTTPException: 503 response with a Retry-After header
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"Search is degraded: {str(error)}",
+        headers={"Retry-After": str(max(1, math.ceil(error.retry_after)))},
+    )
+
+
 @router.post(
     "/", 
     response_model=DocumentEmbedResponse, 
     status_code=status.HTTP_201_CREATED
 )
 async def embed_document(
-    request: DocumentEmbedRequest, settings: Settings = Depends(get_settings)
+    request: DocumentEmbedRequest,
+    settings: Settings = Depends(get_settings),
+    weaviate_client: WeaviateClient = Depends(get_weaviate_client),
 ) -> DocumentEmbedResponse:
     """
     Embed a document in the vector database.
@@ -104,6 +408,7 @@ async def embed_document(
     Args:
         request: Document embed request
         settings: Application settings
+        weaviate_client: Shared Weaviate client
         
     Returns:
         DocumentEmbedResponse: Information about the embedded document
@@ -112,15 +417,16 @@ async def embed_document(
         HTTPException: If there is an error embedding the document
     """
     try:
-        service = EmbeddingService(settings)
-        doc_id, vector_id = await service.embed_document(
+        service = EmbeddingService(settings, weaviate_client=weaviate_client)
+        doc_id, vector_ids = await service.embed_document(
             content=request.content, 
             metadata=request.metadata
         )
         
         return DocumentEmbedResponse(
             id=doc_id,
-            vector_id=vector_id,
+            vector_id=vector_ids[0],
+            vector_ids=vector_ids,
         )
     except Exception as e:
         logger.error(f"Error embedding document: {e}")
@@ -132,7 +438,9 @@ async def embed_document(
 
 @router.post("/search", response_model=SearchResponse)
 async def search_embeddings(
-    request: SearchRequest, settings: Settings = Depends(get_settings)
+    request: SearchRequest,
+    settings: Settings = Depends(get_settings),
+    weaviate_client: WeaviateClient = Depends(get_weaviate_client),
 ) -> SearchResponse:
     """
     Search for documents by semantic similarity.
@@ -140,28 +448,222 @@ async def search_embeddings(
     Args:
         request: Search request
         settings: Application settings
+        weaviate_client: Shared Weaviate client
         
     Returns:
         SearchResponse: Search results
         
     Raises:
-        HTTPException: If there is an error searching for documents
+        HTTPException: If there is an error searching for documents, or 503
+            while Weaviate is unavailable
     """
     try:
-        service = EmbeddingService(settings)
+        service = EmbeddingService(settings, weaviate_client=weaviate_client)
         results, total = await service.search(
             query=request.query,
             limit=request.limit,
             filters=request.filters,
+            group_by_page=request.group_by_page,
+            mode=request.mode,
+            alpha=request.alpha,
+            fields=request.fields,
+            snippet_length=request.snippet_length if request.snippet else None,
+            mmr_lambda=request.mmr_lambda,
+            collapsed_tree=request.collapsed_tree,
         )
         
         return SearchResponse(
             results=results,
             total=total,
         )
+    except CircuitOpenError as e:
+        raise _degraded(e)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(f"Error searching embeddings: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error searching embeddings: {str(e)}",
+        )
+
+
+@router.post("/search/batch", response_model=BatchSearchResponse)
+async def batch_search_embeddings(
+    request: BatchSearchRequest,
+    settings: Settings = Depends(get_settings),
+    weaviate_client: WeaviateClient = Depends(get_weaviate_client),
+) -> BatchSearchResponse:
+    """
+    Run several searches in one request and one Weaviate round-trip.
+    
+    Args:
+        request: Batch search request
+        settings: Application settings
+        weaviate_client: Shared Weaviate client
+    
+    Returns:
+        BatchSearchResponse: Search results per search, in request order
+    
+    Raises:
+        HTTPException: If the batch is invalid or there is an error searching,
+            or 503 while Weaviate is unavailable
+    """
+    try:
+        service = EmbeddingService(settings, weaviate_client=weaviate_client)
+        responses = await service.search_batch([
+            {
+                **search.model_dump(exclude={"snippet"}),
+                "snippet_length": search.snippet_length if search.snippet else None,
+            }
+            for search in request.searches
+        ])
+        
+        return BatchSearchResponse(
+            results=[
+                SearchResponse(results=results, total=total)
+                for results, total in responses
+            ]
+        )
+    except CircuitOpenError as e:
+        raise _degraded(e)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error running batch search: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error running batch search: {str(e)}",
+        )
+
+
+@router.post("/delete", response_model=DeleteByFilterResponse)
+async def delete_embeddings_by_filter(
+    request: DeleteByFilterRequest,
+    settings: Settings = Depends(get_settings),
+    weaviate_client: WeaviateClient = Depends(get_weaviate_client),
+) -> DeleteByFilterResponse:
+    """
+    Delete all documents of a source, version or URL prefix in one call.
+    
+    Args:
+        request: Bulk delete request
+        settings: Application settings
+        weaviate_client: Shared Weaviate client
+    
+    Returns:
+        DeleteByFilterResponse: Matched and deleted object counts
+    
+    Raises:
+        HTTPException: If no filter is given or there is an error deleting
+    """
+    try:
+        service = EmbeddingService(settings, weaviate_client=weaviate_client)
+        result = await service.delete_by_filter(
+            source=request.source,
+            version=request.version,
+            url_prefix=request.url_prefix,
+            dry_run=request.dry_run,
+        )
+        
+        return DeleteByFilterResponse(**result)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error deleting embeddings: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error deleting embeddings: {str(e)}",
+        )
+
+
+@router.get("/sources", response_model=SourceListResponse)
+async def list_sources(
+    settings: Settings = Depends(get_settings),
+    weaviate_client: WeaviateClient = Depends(get_weaviate_client),
+) -> SourceListResponse:
+    """
+    List the per-source partitions of the documentation.
+    
+    Args:
+        settings: Application settings
+        weaviate_client: Shared Weaviate client
+    
+    Returns:
+        SourceListResponse: Source partitions and their status
+    
+    Raises:
+        HTTPException: If documents are not partitioned by source
+    """
+    try:
+        service = EmbeddingService(settings, weaviate_client=weaviate_client)
+        sources = await service.list_sources()
+        
+        return SourceListResponse(
+            sources=[SourcePartition(**partition) for partition in sources]
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error listing sources: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing sources: {str(e)}",
+        )
+
+
+@router.put("/sources/{source}", response_model=SourcePartition)
+async def set_source_status(
+    source: str,
+    request: SourceStatusRequest,
+    settings: Settings = Depends(get_settings),
+    weaviate_client: WeaviateClient = Depends(get_weaviate_client),
+) -> SourcePartition:
+    """
+    Load a source partition, or archive it by offloading it from memory.
+    
+    Args:
+        source: Documentation source
+        request: Source status request
+        settings: Application settings
+        weaviate_client: Shared Weaviate client
+    
+    Returns:
+        SourcePartition: The updated partition
+    
+    Raises:
+        HTTPException: If documents are not partitioned or the source is not found
+    """
+    try:
+        service = EmbeddingService(settings, weaviate_client=weaviate_client)
+        await service.set_source_active(source, request.active)
+        
+        return SourcePartition(name=tenant_name(source), active=request.active)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Source {source} not found",
+        )
+    except Exception as e:
+        logger.error(f"Error updating source {source}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error updating source: {str(e)}",
         )
\ No newline at end of file
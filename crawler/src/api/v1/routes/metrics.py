@@ -0,0 +1,29 @@
+"""
+API routes for exposing crawler service metrics.
+"""
+
+import logging
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from src.utils.metrics import MetricsRegistry, get_metrics
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/")
+async def get_service_metrics(
+    metrics: MetricsRegistry = Depends(get_metrics),
+) -> Dict[str, Any]:
+    """
+    Get a snapshot of the crawler service metrics.
+    
+    Args:
+        metrics: Metrics registry
+    
+    Returns:
+        Dict[str, Any]: Counters, gauges and component statistics
+    """
+    return metrics.snapshot()
@@ -2,12 +2,16 @@
 API routes for generating RAPTOR summaries.
 """
 
+import json
 import logging
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from src.api.v1.dependencies import get_summary_batch_manager
+from src.summarization.batch import SummaryBatchManager
 from src.summarization.service import SummarizationService
 from src.utils.config import Settings, get_settings
 
@@ -23,6 +27,7 @@ class SummaryRequest(BaseModel):
         documents: List of documents to summarize
         max_tokens: Maximum tokens in the summary
         hierarchy_levels: Number of hierarchical levels
+        force: Whether to regenerate an already stored summary
     """
     
     documents: List[str] = Field(..., description="List of documents to summarize")
@@ -32,6 +37,9 @@ class SummaryRequest(BaseModel):
     hierarchy_levels: Optional[int] = Field(
         default=3, description="Number of hierarchical levels"
     )
+    force: bool = Field(
+        default=False, description="Whether to regenerate an already stored summary"
+    )
 
 
 class HierarchicalSummary(BaseModel):
@@ -68,6 +76,59 @@ class SummaryResponse(BaseModel):
     )
 
 
+class SummaryBatchRequest(BaseModel):
+    """
+    Request model for summarizing many independent document sets.
+    
+    Attributes:
+        items: Summary requests, one per document set
+    """
+    
+    items: List[SummaryRequest] = Field(
+        ..., description="Summary requests, one per document set"
+    )
+
+
+class SummaryBatchItem(BaseModel):
+    """
+    Model for the status of one item in a summary batch.
+    
+    Attributes:
+        index: Position of the item in the batch request
+        status: Item status (pending, running, completed, failed)
+        summary_id: ID of the generated summary, once completed
+        error: Error message, if the item failed
+    """
+    
+    index: int = Field(..., description="Position of the item in the batch request")
+    status: str = Field(..., description="Item status")
+    summary_id: Optional[str] = Field(
+        default=None, description="ID of the generated summary"
+    )
+    error: Optional[str] = Field(default=None, description="Error message")
+
+
+class SummaryBatchResponse(BaseModel):
+    """
+    Response model for a summary batch.
+    
+    Attributes:
+        batch_id: Unique identifier for the batch
+        status: Batch status (pending, running, completed)
+        total: Number of items in the batch
+        completed: Number of items completed successfully
+        failed: Number of failed items
+        items: Status of each item, in request order
+    """
+    
+    batch_id: str = Field(..., description="Unique identifier for the batch")
+    status: str = Field(..., description="Batch status")
+    total: int = Field(..., description="Number of items in the batch")
+    completed: int = Field(..., description="Number of items completed successfully")
+    failed: int = Field(..., description="Number of failed items")
+    items: List[SummaryBatchItem] = Field(..., description="Status of each item")
+
+
 @router.post(
     "/", 
     response_model=SummaryResponse, 
@@ -95,6 +156,7 @@ async def generate_summary(
             documents=request.documents,
             max_tokens=request.max_tokens,
             hierarchy_levels=request.hierarchy_levels,
+            force=request.force,
         )
         
         return SummaryResponse(
@@ -146,4 +208,140 @@ async def get_summary(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving summary: {str(e)}",
-        )
\ No newline at end of file
+        )
+
+
+@router.put("/{summary_id}/aliases/{alias_id}", response_model=SummaryResponse)
+async def add_summary_alias(
+    summary_id: str, alias_id: str, settings: Settings = Depends(get_settings)
+) -> SummaryResponse:
+    """
+    Make an additional ID resolve to a stored summary.
+    
+    Args:
+        summary_id: Summary ID or alias
+        alias_id: Alias ID, e.g. a random ID issued before summaries were
+            content-addressed
+        settings: Application settings
+    
+    Returns:
+        SummaryResponse: Summary the alias resolves to
+    
+    Raises:
+        HTTPException: If the summary is not found or there is an error
+    """
+    try:
+        service = SummarizationService(settings)
+        service.add_alias(alias_id, summary_id)
+        summary_info = await service.get_summary(alias_id)
+        
+        return SummaryResponse(
+            id=summary_info["id"],
+            summary=summary_info["summary"],
+            hierarchical_summary=summary_info.get("hierarchical_summary"),
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Summary {summary_id} not found",
+        )
+    except Exception as e:
+        logger.error(f"Error adding summary alias: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error adding summary alias: {str(e)}",
+        )
+
+
+@router.post(
+    "/batch",
+    response_model=SummaryBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_summary_batch(
+    request: SummaryBatchRequest,
+    manager: SummaryBatchManager = Depends(get_summary_batch_manager),
+) -> SummaryBatchResponse:
+    """
+    Queue a batch of independent summary requests.
+    
+    Args:
+        request: Summary batch request
+        manager: Summary batch manager
+        
+    Returns:
+        SummaryBatchResponse: The queued batch
+        
+    Raises:
+        HTTPException: If the batch is invalid
+    """
+    try:
+        batch = manager.submit([item.model_dump() for item in request.items])
+        
+        return SummaryBatchResponse(**batch.to_dict())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/batch/{batch_id}", response_model=SummaryBatchResponse)
+async def get_summary_batch(
+    batch_id: str,
+    manager: SummaryBatchManager = Depends(get_summary_batch_manager),
+) -> SummaryBatchResponse:
+    """
+    Get the status of a summary batch.
+    
+    Args:
+        batch_id: Unique identifier for the batch
+        manager: Summary batch manager
+        
+    Returns:
+        SummaryBatchResponse: Batch status
+        
+    Raises:
+        HTTPException: If the batch is not found
+    """
+    try:
+        return SummaryBatchResponse(**manager.get(batch_id).to_dict())
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Summary batch {batch_id} not found",
+        )
+
+
+@router.get("/batch/{batch_id}/stream")
+async def stream_summary_batch(
+    batch_id: str,
+    manager: SummaryBatchManager = Depends(get_summary_batch_manager),
+) -> StreamingResponse:
+    """
+    Stream batch items as newline-delimited JSON as they finish.
+    
+    Args:
+        batch_id: Unique identifier for the batch
+        manager: Summary batch manager
+        
+    Returns:
+        StreamingResponse: One JSON line per finished item
+        
+    Raises:
+        HTTPException: If the batch is not found
+    """
+    try:
+        batch = manager.get(batch_id)
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Summary batch {batch_id} not found",
+        )
+    
+    async def item_lines() -> AsyncIterator[str]:
+        """Serialize finished items as NDJSON lines."""
+        async for item in batch.stream():
+            yield json.dumps(item) + "\n"
+    
+    return StreamingResponse(item_lines(), media_type="application/x-ndjson")
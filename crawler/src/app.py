@@ -2,6 +2,7 @@
 RAPTOR Documentation Crawler FastAPI application.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -9,6 +10,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.v1.router import api_router
+from src.embedding.local_store import create_vector_client
+from src.summarization.batch import SummaryBatchManager
+from src.summarization.retention import SummaryRetentionManager
 from src.utils.config import get_settings
 
 settings = get_settings()
@@ -30,9 +34,32 @@ async def lifespan(app: FastAPI):
         app: FastAPI application instance
     """
     logger.info("Starting up RAPTOR Documentation Crawler service")
-    # Add startup code here (database connections, etc.)
+    
+    # One pooled Weaviate client for the process; the schema is verified once here
+    app.state.weaviate_client_lock = asyncio.Lock()
+    try:
+        app.state.weaviate_client = await asyncio.to_thread(create_vector_client, settings)
+    except Exception as e:
+        app.state.weaviate_client = None
+        logger.warning(f"Weaviate unavailable at startup, will retry on demand: {e}")
+    
+    # One shared summarization pipeline for all summary batches
+    app.state.summary_batch_manager = SummaryBatchManager(settings)
+    app.state.summary_batch_manager.start()
+    
+    # Keep the summary store bounded in the background
+    retention_manager = None
+    if settings.summary_retention_enabled:
+        retention_manager = SummaryRetentionManager(settings)
+        retention_manager.start()
+    
     yield
-    # Add shutdown code here (close connections, etc.)
+    
+    if retention_manager is not None:
+        await retention_manager.stop()
+    await app.state.summary_batch_manager.stop()
+    if app.state.weaviate_client is not None:
+        app.state.weaviate_client.close()
     logger.info("Shutting down RAPTOR Documentation Crawler service")
 
 
@@ -61,11 +88,25 @@ async def health_check():
     """
     Health check endpoint.
     
+    The status is ``degraded`` while the Weaviate circuit breaker rejects
+    queries. The embedded vector store has no breaker and reports ``local``.
+    
     Returns:
         dict: Status information
     """
-    return {
+    health = {
         "status": "ok",
         "version": "0.1.0",
         "environment": settings.environment,
-    }
\ No newline at end of file
+    }
+    
+    weaviate_client = getattr(app.state, "weaviate_client", None)
+    if weaviate_client is not None and settings.vector_backend == "local":
+        health["weaviate"] = "local"
+    elif weaviate_client is not None:
+        breaker = weaviate_client.breaker.stats()
+        health["weaviate"] = breaker["state"]
+        if breaker["state"] == "open":
+            health["status"] = "degraded"
+    
+    return health
\ No newline at end of file
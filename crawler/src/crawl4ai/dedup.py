@@ -0,0 +1,189 @@
+"""
+Near-duplicate detection of crawled pages with SimHash.
+
+Documentation sites serve the same page under several URLs (trailing slashes,
+anchors, versioned aliases, print views). Each page gets a 64-bit SimHash of
+its word shingles; pages whose fingerprints differ in at most
+``dedup_max_distance`` bits are grouped, only one canonical copy per group is
+embedded, and the URLs of the other copies are stored as its ``aliases``.
+
+Candidate pairs are found by splitting fingerprints into ``max_distance + 1``
+bands: two fingerprints within that distance agree exactly on at least one
+band, so only pages sharing a band are compared.
+"""
+
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bits per fingerprint
+SIMHASH_BITS = 64
+
+# Words per shingle
+SHINGLE_WORDS = 3
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def simhash(text: str) -> int:
+    """
+    Compute the SimHash fingerprint of a text.
+    
+    Args:
+        text: Page content
+    
+    Returns:
+        int: 64-bit fingerprint
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    shingles = [
+        " ".join(words[i:i + SHINGLE_WORDS])
+        for i in range(max(1, len(words) - SHINGLE_WORDS + 1))
+    ]
+    
+    hashes = np.array(
+        [
+            int.from_bytes(
+                hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+            )
+            for shingle in shingles
+        ],
+        dtype=np.uint64,
+    )
+    # Each bit is set if most shingle hashes have it set
+    bits = (hashes[:, None] >> np.arange(SIMHASH_BITS, dtype=np.uint64)) & np.uint64(1)
+    majority = bits.sum(axis=0) * 2 > len(shingles)
+    
+    return sum(1 << int(bit) for bit in np.flatnonzero(majority))
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """
+    Count the bits two fingerprints differ in.
+    
+    Args:
+        a: First fingerprint
+        b: Second fingerprint
+    
+    Returns:
+        int: Hamming distance
+    """
+    return (a ^ b).bit_count()
+
+
+def _bands(fingerprint: int, count: int) -> List[Tuple[int, int]]:
+    """
+    Split a fingerprint into bands.
+    
+    Args:
+        fingerprint: Fingerprint to split
+        count: Number of bands
+    
+    Returns:
+        List[Tuple[int, int]]: Band index and value of each band
+    """
+    bands = []
+    start = 0
+    for index in range(count):
+        width = SIMHASH_BITS // count + (1 if index < SIMHASH_BITS % count else 0)
+        bands.append((index, (fingerprint >> start) & ((1 << width) - 1)))
+        start += width
+    
+    return bands
+
+
+def _canonical_rank(url: str) -> Tuple[int, int, int]:
+    """
+    Rank URLs so the cleanest copy of a page becomes canonical.
+    
+    Args:
+        url: Page URL
+    
+    Returns:
+        Tuple[int, int, int]: Sort key; URLs without a query or fragment and
+            with shorter paths come first
+    """
+    parsed = urlparse(url)
+    return (1 if parsed.query else 0, 1 if parsed.fragment else 0, len(parsed.path))
+
+
+def deduplicate(
+    documents: List[Dict[str, Any]], max_distance: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Keep one canonical copy of each group of near-duplicate documents.
+    
+    Args:
+        documents: Documents with content and metadata (including ``url``)
+        max_distance: Maximum Hamming distance between near-duplicates
+    
+    Returns:
+        Tuple[List[Dict[str, Any]], int]: Canonical documents in input order,
+            with the URLs of their duplicates in ``metadata["aliases"]``, and
+            the number of duplicates dropped
+    """
+    if len(documents) < 2:
+        return documents, 0
+    
+    fingerprints = [simhash(doc["content"]) for doc in documents]
+    
+    # Union-find over documents
+    parents = list(range(len(documents)))
+    
+    def find(index: int) -> int:
+        """Find the representative of a document's group."""
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+    
+    buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for index, fingerprint in enumerate(fingerprints):
+        for band in _bands(fingerprint, min(max_distance + 1, SIMHASH_BITS)):
+            for other in buckets[band]:
+                if find(index) != find(other) and (
+                    hamming_distance(fingerprint, fingerprints[other]) <= max_distance
+                ):
+                    parents[find(index)] = find(other)
+            buckets[band].append(index)
+    
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for index in range(len(documents)):
+        groups[find(index)].append(index)
+    
+    kept = {}
+    for members in groups.values():
+        canonical = min(
+            members,
+            key=lambda index: (
+                _canonical_rank(documents[index]["metadata"].get("url", "")),
+                index,
+            ),
+        )
+        aliases = [
+            documents[index]["metadata"].get("url", "")
+            for index in members
+            if index != canonical
+        ]
+        
+        document = documents[canonical]
+        if aliases:
+            document = {
+                **document,
+                "metadata": {**document["metadata"], "aliases": aliases},
+            }
+            logger.debug(f"Page {document['metadata'].get('url')} has duplicates {aliases}")
+        kept[canonical] = document
+    
+    duplicates = len(documents) - len(kept)
+    if duplicates:
+        logger.info(f"Dropped {duplicates} near-duplicate pages of {len(documents)}")
+    
+    return [kept[index] for index in sorted(kept)], duplicates
@@ -0,0 +1,323 @@
+"""
+Per-source crawl manifest for incremental re-ingestion.
+
+The manifest records, for every page a source's last crawl stored, the hash of
+the page document, the IDs of its vector database objects and its summary ID.
+A re-crawl diffs its pages against the manifest: unchanged pages are skipped,
+changed pages are re-embedded and their stale objects deleted, and pages that
+disappeared from the site are deleted, so a re-crawl costs in proportion to
+what changed.
+
+A source is often crawled piecewise (one start URL or pattern set at a time),
+so a page missing from a crawl only counts as removed if it lies in that
+crawl's scope. Crawls of one source may also overlap, so a manifest only
+writes back the pages it recorded or removed, merged into the saved file.
+
+Deleting documents outside a crawl (bulk deletes, dropped tenants) forgets
+their pages, so the next crawl stores them again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from urllib.parse import urldefrag
+
+from src.embedding.tenants import tenant_name
+
+logger = logging.getLogger(__name__)
+
+# Serializes the read-merge-write of each manifest file within the process
+_save_locks: Dict[str, threading.Lock] = {}
+_save_locks_guard = threading.Lock()
+
+
+def _save_lock(path: str) -> threading.Lock:
+    """
+    Get the lock guarding writes to a manifest file.
+    
+    Args:
+        path: Manifest file path
+    
+    Returns:
+        threading.Lock: Lock of the file
+    """
+    with _save_locks_guard:
+        return _save_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def _read_pages(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the pages of a saved manifest.
+    
+    Args:
+        path: Manifest file path
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: Entry per page URL (empty if not saved yet)
+    """
+    if not os.path.exists(path):
+        return {}
+    
+    with open(path, "r") as f:
+        pages: Dict[str, Dict[str, Any]] = json.load(f)["pages"]
+    return pages
+
+
+def content_hash(document: Dict[str, Any]) -> str:
+    """
+    Hash a page document as it would be stored.
+    
+    Args:
+        document: Document with content and metadata
+    
+    Returns:
+        str: SHA-256 hex digest of the content and metadata
+    """
+    payload = json.dumps(
+        {"content": document["content"], "metadata": document.get("metadata", {})},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def in_crawl_scope(
+    url: str,
+    start_url: str,
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+) -> bool:
+    """
+    Check whether a crawl could have returned a page.
+    
+    Args:
+        url: Page URL
+        start_url: URL the crawl started from
+        include_patterns: URL patterns the crawl was limited to
+        exclude_patterns: URL patterns the crawl skipped
+    
+    Returns:
+        bool: True if the page is under the start URL, matches an include
+            pattern (if any) and matches no exclude pattern
+    """
+    prefix = urldefrag(start_url)[0].split("?", 1)[0]
+    if not url.startswith(prefix):
+        return False
+    if include_patterns and not any(fnmatchcase(url, p) for p in include_patterns):
+        return False
+    
+    return not any(fnmatchcase(url, p) for p in exclude_patterns or [])
+
+
+class CrawlManifest:
+    """
+    Record of the pages stored by a source's last crawl.
+    
+    Attributes:
+        source: Documentation source
+        path: JSON file holding the manifest
+        pages: Entry per page URL with ``content_hash``, ``vector_ids``,
+            ``summary_id`` and ``version``
+    """
+    
+    def __init__(self, directory: str, source: str):
+        """
+        Load the manifest of a source, or start an empty one.
+        
+        Args:
+            directory: Directory holding the manifests
+            source: Documentation source
+        """
+        self.source = source
+        # Tenant names are safe, distinct file names for any source
+        self.path = os.path.join(directory, f"{tenant_name(source)}.json")
+        self.pages = _read_pages(self.path)
+        # Changes since loading, merged into the file on save
+        self._recorded: Dict[str, Dict[str, Any]] = {}
+        self._removed: Set[str] = set()
+        
+    @classmethod
+    def load_all(cls, directory: str) -> List["CrawlManifest"]:
+        """
+        Load the manifests of every source.
+        
+        Args:
+            directory: Directory holding the manifests
+        
+        Returns:
+            List[CrawlManifest]: One manifest per saved source
+        """
+        if not os.path.isdir(directory):
+            return []
+        
+        manifests = []
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(directory, name), "r") as f:
+                manifests.append(cls(directory, json.load(f)["source"]))
+        return manifests
+    
+    def diff(
+        self,
+        documents: List[Dict[str, Any]],
+        require_summary: bool = False,
+        in_scope: Optional[Callable[[str], bool]] = None,
+    ) -> Dict[str, List[Any]]:
+        """
+        Compare crawled pages with the manifest.
+        
+        Args:
+            documents: Crawled page documents with content and metadata
+            require_summary: Whether a page without a stored summary counts as
+                changed
+            in_scope: Whether the crawl could have returned a page URL; pages
+                outside the scope are never removed (defaults to all pages)
+        
+        Returns:
+            Dict[str, List[Any]]: ``new``, ``changed`` and ``unchanged``
+                documents, and the URLs of ``removed`` pages
+        """
+        result: Dict[str, List[Any]] = {
+            "new": [], "changed": [], "unchanged": [], "removed": []
+        }
+        crawled = set()
+        
+        for document in documents:
+            url = document["metadata"]["url"]
+            crawled.add(url)
+            entry = self.pages.get(url)
+            
+            if entry is None:
+                result["new"].append(document)
+            elif entry["content_hash"] != content_hash(document):
+                result["changed"].append(document)
+            elif require_summary and not entry.get("summary_id"):
+                result["changed"].append(document)
+            else:
+                result["unchanged"].append(document)
+        
+        result["removed"] = sorted(
+            page_url for page_url in set(self.pages) - crawled
+            if in_scope is None or in_scope(page_url)
+        )
+        return result
+    
+    def record(
+        self,
+        document: Dict[str, Any],
+        vector_ids: List[str],
+        summary_id: Optional[str] = None,
+    ) -> None:
+        """
+        Record a stored page.
+        
+        Args:
+            document: Page document
+            vector_ids: IDs of the page's vector database objects
+            summary_id: ID of the page's summary, if any
+        """
+        url = document["metadata"]["url"]
+        self.pages[url] = {
+            "content_hash": content_hash(document),
+            "vector_ids": list(vector_ids),
+            "summary_id": summary_id,
+            "version": document["metadata"].get("version"),
+        }
+        self._recorded[url] = self.pages[url]
+        self._removed.discard(url)
+    
+    def vector_ids(self, url: str) -> List[str]:
+        """
+        Get the stored object IDs of a page.
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            List[str]: Object IDs (empty for unknown pages)
+        """
+        return list(self.pages.get(url, {}).get("vector_ids", []))
+    
+    def remove(self, url: str) -> None:
+        """
+        Forget a page.
+        
+        Args:
+            url: Page URL
+        """
+        self.pages.pop(url, None)
+        self._recorded.pop(url, None)
+        self._removed.add(url)
+    
+    def forget(
+        self, url_prefix: Optional[str] = None, version: Optional[str] = None
+    ) -> int:
+        """
+        Forget the pages a bulk delete removed from the vector database.
+        
+        Entries recorded before versions were tracked match any version.
+        
+        Args:
+            url_prefix: Only forget pages whose URL starts with this prefix
+            version: Only forget pages of this version
+        
+        Returns:
+            int: Number of forgotten pages
+        """
+        urls = [
+            url for url, entry in self.pages.items()
+            if (url_prefix is None or url.startswith(url_prefix))
+            and (version is None or entry.get("version") in (None, version))
+        ]
+        for url in urls:
+            self.remove(url)
+        return len(urls)
+    
+    def forget_objects(self, vector_ids: Iterable[str]) -> int:
+        """
+        Forget the pages holding any of the given objects.
+        
+        Args:
+            vector_ids: IDs of deleted vector database objects
+        
+        Returns:
+            int: Number of forgotten pages
+        """
+        deleted = set(vector_ids)
+        urls = [
+            url for url, entry in self.pages.items()
+            if deleted.intersection(entry.get("vector_ids", []))
+        ]
+        for url in urls:
+            self.remove(url)
+        return len(urls)
+    
+    def save(self) -> None:
+        """
+        Atomically write the manifest, merged with the saved one.
+        
+        Only the pages recorded or removed since loading are written over the
+        saved manifest, so overlapping crawls of a source keep each other's
+        pages.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        
+        with _save_lock(self.path):
+            pages = _read_pages(self.path)
+            for url in self._removed:
+                pages.pop(url, None)
+            pages.update(self._recorded)
+
+            with open(tmp_path, "w") as f:
+                json.dump({"source": self.source, "pages": pages}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        
+        self.pages = pages
+        self._recorded = {}
+        self._removed = set()
+        logger.info(f"Saved crawl manifest of {self.source} with {len(pages)} pages")
@@ -4,10 +4,14 @@ Service for crawling and processing documentation from Crawl4AI.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from src.crawl4ai.client import Crawl4AIClient
+from src.crawl4ai.dedup import deduplicate
+from src.crawl4ai.manifest import CrawlManifest, in_crawl_scope
 from src.embedding.service import EmbeddingService
+from src.summarization.raptor import RAPTORProcessor
+from src.summarization.scheduler import PRIORITY_BULK
 from src.summarization.service import SummarizationService
 from src.utils.config import Settings
 
@@ -38,13 +42,25 @@ class DocumentationCrawlerService:
         Args:
             settings: Application settings
             crawl4ai_client: Optional Crawl4AI client
-            embedding_service: Optional embedding service
+            embedding_service: Optional embedding service; without one, an
+                embedding service owning its own vector client is created
             summarization_service: Optional summarization service
         """
         self.settings = settings
         self.crawl4ai_client = crawl4ai_client or Crawl4AIClient(settings)
+        self._owns_embedding_service = embedding_service is None
         self.embedding_service = embedding_service or EmbeddingService(settings)
-        self.summarization_service = summarization_service or SummarizationService(settings)
+        # Crawl summaries are bulk work and yield to interactive requests
+        self.summarization_service = summarization_service or SummarizationService(
+            settings, raptor=RAPTORProcessor(settings, priority=PRIORITY_BULK)
+        )
+    
+    def close(self) -> None:
+        """
+        Close the embedding service if this service created it.
+        """
+        if self._owns_embedding_service:
+            self.embedding_service.close()
     
     async def crawl_and_store(
         self,
@@ -57,6 +73,14 @@ class DocumentationCrawlerService:
         """
         Crawl documentation and store it in the vector database.
         
+        Pages served under several URLs are detected by their SimHash and
+        embedded once, with the other URLs recorded as ``aliases``. With the
+        crawl manifest enabled, pages unchanged since the source's last crawl
+        are skipped unless their objects went missing from the vector
+        database, changed pages are replaced and pages of the crawl's scope
+        that are no longer found are deleted. The nodes of each page's summary
+        tree are indexed next to the page's chunks for collapsed-tree search.
+        
         Args:
             url: URL to crawl
             max_pages: Maximum number of pages to crawl
@@ -102,8 +126,14 @@ class DocumentationCrawlerService:
                     "status": status,
                     "url": url,
                     "page_count": 0,
+                    "duplicate_count": 0,
+                    "skipped_count": 0,
+                    "updated_count": 0,
+                    "deleted_count": 0,
                     "embedded_count": 0,
+                    "embed_failed_count": 0,
                     "summarized_count": 0,
+                    "summary_failed_count": 0,
                 }
             
             # Process pages in parallel
@@ -137,85 +167,309 @@ class DocumentationCrawlerService:
                     "metadata": metadata,
                 })
             
+            # Embed one canonical copy of pages served under several URLs
+            duplicate_count = 0
+            if self.settings.dedup_enabled:
+                batch_documents, duplicate_count = deduplicate(
+                    batch_documents, self.settings.dedup_max_distance
+                )
+            
+            # Only store what changed since the source's last crawl
+            manifest = None
+            changed_urls = set()
+            removed_urls: List[str] = []
+            skipped_count = 0
+            if self.settings.crawl_manifest_enabled:
+                manifest = CrawlManifest(self.settings.crawl_manifest_dir, source)
+                # Pages of the source outside this crawl's URL and patterns stay
+                changes = manifest.diff(
+                    batch_documents,
+                    require_summary=generate_summaries,
+                    in_scope=lambda page_url: in_crawl_scope(
+                        page_url, url, include_patterns, exclude_patterns
+                    ),
+                )
+                missing = await self._missing_pages(
+                    manifest, source, changes["unchanged"]
+                )
+                batch_documents = changes["new"] + changes["changed"] + missing
+                changed_urls = {doc["metadata"]["url"] for doc in changes["changed"]}
+                removed_urls = changes["removed"]
+                skipped_count = len(changes["unchanged"]) - len(missing)
+                
+                # A crawl cut off by max_pages says nothing about missing pages
+                if removed_urls and len(pages) >= max_pages:
+                    logger.info(
+                        f"Crawl of {source} reached max_pages={max_pages}; "
+                        f"keeping {len(removed_urls)} pages it did not return"
+                    )
+                    removed_urls = []
+                
+                logger.info(
+                    f"Crawl manifest of {source}: {len(changes['new'])} new, "
+                    f"{len(changed_urls)} changed, {skipped_count} unchanged, "
+                    f"{len(missing)} missing from the store, "
+                    f"{len(removed_urls)} removed pages"
+                )
+            
             # Batch embed documents
+            embedded_pages = []
+            embed_failed_count = 0
             if batch_documents:
                 logger.info(f"Embedding {len(batch_documents)} documents in batch")
                 embedding_results = await self.embedding_service.batch_embed_documents(batch_documents)
-                embedded_count = len(embedding_results)
-                logger.info(f"Successfully embedded {embedded_count} documents")
+                
+                for doc, result in zip(batch_documents, embedding_results):
+                    if result["success"]:
+                        embedded_pages.append((doc, result["vector_ids"]))
+                    else:
+                        embed_failed_count += 1
+                        logger.warning(
+                            f"Failed to embed page {doc['metadata']['url']}: {result['error']}"
+                        )
+                
+                embedded_count = len(embedded_pages)
+                logger.info(
+                    f"Successfully embedded {embedded_count} documents, "
+                    f"{embed_failed_count} failed"
+                )
             
             # Generate summaries if requested
-            if generate_summaries and batch_documents:
-                # Create summaries for top-level documents
-                logger.info(f"Generating summaries for {len(batch_documents)} documents")
+            summary_failed_count = 0
+            summaries: Dict[str, Tuple[Optional[str], List[str]]] = {}
+            if generate_summaries and embedded_pages:
+                logger.info(f"Generating summaries for {len(embedded_pages)} documents")
                 
-                # Process in batches of 10 to avoid overloading the system
-                batch_size = 10
+                summaries = await self._summarize_pages(embedded_pages)
+                summarized_count = sum(1 for summary_id, _ in summaries.values() if summary_id)
+                summary_failed_count = len(summaries) - summarized_count
                 
-                for i in range(0, len(batch_documents), batch_size):
-                    batch = batch_documents[i:i+batch_size]
-                    
-                    # Process each document in parallel
-                    tasks = []
-                    for doc in batch:
-                        task = asyncio.create_task(self._generate_summary(
-                            content=doc["content"],
-                            metadata=doc["metadata"],
-                        ))
-                        tasks.append(task)
-                    
-                    # Wait for all tasks to complete
-                    summary_results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    # Count successful summaries
-                    for result in summary_results:
-                        if not isinstance(result, Exception) and result:
-                            summarized_count += 1
-                    
-                    logger.info(f"Generated {summarized_count} summaries")
+                logger.info(
+                    f"Generated {summarized_count} summaries, "
+                    f"{summary_failed_count} failed"
+                )
+            
+            updated_count = 0
+            deleted_count = 0
+            if manifest is not None:
+                updated_count, deleted_count = await self._apply_manifest(
+                    manifest, source, embedded_pages, changed_urls, removed_urls, summaries
+                )
             
             return {
                 "job_id": job_id,
                 "status": status,
                 "url": url,
                 "page_count": page_count,
+                "duplicate_count": duplicate_count,
+                "skipped_count": skipped_count,
+                "updated_count": updated_count,
+                "deleted_count": deleted_count,
                 "embedded_count": embedded_count,
+                "embed_failed_count": embed_failed_count,
                 "summarized_count": summarized_count,
+                "summary_failed_count": summary_failed_count,
             }
         except Exception as e:
             logger.error(f"Error during crawl and store: {str(e)}")
             raise
     
-    async def _generate_summary(self, content: str, metadata: Dict[str, str]) -> bool:
+    async def _apply_manifest(
+        self,
+        manifest: CrawlManifest,
+        source: str,
+        embedded_pages: List[Tuple[Dict[str, Any], List[str]]],
+        changed_urls: Set[str],
+        removed_urls: List[str],
+        summaries: Dict[str, Tuple[Optional[str], List[str]]],
+    ) -> Tuple[int, int]:
+        """
+        Delete stale objects and record the stored pages in the manifest.
+        
+        The stale objects of all pages are deleted with a single batch delete.
+        If it fails, the pages with stale objects keep their old manifest
+        entries, so the next crawl retries them.
+        
+        Args:
+            manifest: Crawl manifest of the source
+            source: Documentation source
+            embedded_pages: Stored documents paired with their object IDs
+            changed_urls: URLs of pages whose content changed
+            removed_urls: URLs of pages no longer found on the site
+            summaries: Summary ID (None if summarization failed) and summary
+                node IDs per page URL
+        
+        Returns:
+            Tuple[int, int]: Number of updated and deleted pages
+        """
+        pages = []
+        for doc, vector_ids in embedded_pages:
+            page_url = doc["metadata"]["url"]
+            summary_id, node_ids = summaries.get(page_url, (None, []))
+            vector_ids = [*vector_ids, *node_ids]
+            # Object IDs derive from the content, so unchanged chunks keep theirs
+            stale = set(manifest.vector_ids(page_url)) - set(vector_ids)
+            pages.append((doc, vector_ids, summary_id, stale))
+        
+        stale_ids = {vector_id for *_, stale in pages for vector_id in stale}
+        stale_ids.update(
+            vector_id
+            for page_url in removed_urls
+            for vector_id in manifest.vector_ids(page_url)
+        )
+        deleted = await self._delete_objects(stale_ids, source)
+        
+        updated_count = 0
+        for doc, vector_ids, summary_id, stale in pages:
+            if stale and not deleted:
+                continue
+            
+            manifest.record(doc, vector_ids, summary_id)
+            if doc["metadata"]["url"] in changed_urls:
+                updated_count += 1
+        
+        deleted_count = 0
+        if deleted:
+            for page_url in removed_urls:
+                manifest.remove(page_url)
+            deleted_count = len(removed_urls)
+        
+        manifest.save()
+        return updated_count, deleted_count
+    
+    async def _delete_objects(self, vector_ids: Set[str], source: str) -> bool:
+        """
+        Delete vector database objects with a single batch delete.
+        
+        Args:
+            vector_ids: Object IDs
+            source: Documentation source
+        
+        Returns:
+            bool: True if every object was deleted
+        """
+        if not vector_ids:
+            return True
+        
+        try:
+            await self.embedding_service.delete_documents(sorted(vector_ids), source)
+        except Exception as e:
+            logger.warning(
+                f"Failed to delete {len(vector_ids)} stale objects: {str(e)}"
+            )
+            return False
+        
+        return True
+    
+    async def _missing_pages(
+        self, manifest: CrawlManifest, source: str, documents: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Find unchanged pages whose objects are no longer in the vector database.
+        
+        Objects may be deleted outside a crawl, so the manifest alone does not
+        prove an unchanged page is still stored.
+        
+        Args:
+            manifest: Crawl manifest of the source
+            source: Documentation source
+            documents: Documents of the unchanged pages
+        
+        Returns:
+            List[Dict[str, Any]]: Documents of the pages to store again
+        """
+        vector_ids = [
+            vector_id
+            for doc in documents
+            for vector_id in manifest.vector_ids(doc["metadata"]["url"])
+        ]
+        if not vector_ids:
+            return []
+        
+        existing = await self.embedding_service.existing_ids(vector_ids, source)
+        return [
+            doc for doc in documents
+            if not existing.issuperset(manifest.vector_ids(doc["metadata"]["url"]))
+        ]
+    
+    async def _summarize_pages(
+        self, pages: List[Tuple[Dict[str, Any], List[str]]]
+    ) -> Dict[str, Tuple[Optional[str], List[str]]]:
         """
-        Generate a summary for a document and store it.
+        Summarize pages through a work queue at a steady concurrency limit.
+        
+        A fixed pool of workers pulls pages from the queue, so a slow page
+        only occupies one slot instead of holding back a whole batch.
         
         Args:
-            content: Document content
-            metadata: Document metadata
+            pages: Documents paired with the vector IDs of their Weaviate objects
             
         Returns:
-            bool: True if successful
+            Dict[str, Tuple[Optional[str], List[str]]]: Summary ID (None where
+                summarization failed) and summary node IDs per page URL
+        """
+        queue: "asyncio.Queue[Tuple[Dict[str, Any], List[str]]]" = asyncio.Queue()
+        for page in pages:
+            queue.put_nowait(page)
+        
+        summaries: Dict[str, Tuple[Optional[str], List[str]]] = {}
+        
+        async def worker() -> None:
+            """Summarize queued pages until the queue is empty."""
+            while True:
+                try:
+                    doc, vector_ids = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                summaries[doc["metadata"]["url"]] = await self._generate_summary(
+                    doc["content"], doc["metadata"], vector_ids
+                )
+        
+        concurrency = max(1, min(self.settings.page_summary_concurrency, len(pages)))
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        
+        return summaries
+    
+    async def _generate_summary(
+        self, content: str, metadata: Dict[str, str], vector_ids: List[str]
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Generate a summary for a page and link it to the page's Weaviate objects.
+        
+        With ``page_summary_index_nodes`` enabled, every node of the summary
+        tree is also stored as a searchable object.
+        
+        Args:
+            content: Page content
+            metadata: Page metadata
+            vector_ids: Weaviate object IDs of the page's chunks
             
-        Raises:
-            Exception: If there is an error generating the summary
+        Returns:
+            Tuple[Optional[str], List[str]]: Summary ID and summary node IDs,
+                or None and no IDs if the summary could not be generated,
+                indexed and linked
         """
         try:
-            # Generate the summary
-            summary = await self.summarization_service.generate_summary(
-                text=content,
-                title=metadata.get("title", "Untitled Document"),
-                url=metadata.get("url", ""),
+            summary_id, _, hierarchical = await self.summarization_service.generate_summary(
+                documents=[content],
+                max_tokens=self.settings.page_summary_max_tokens,
+                hierarchy_levels=self.settings.page_summary_hierarchy_levels,
             )
             
-            # Store the summary
-            await self.summarization_service.store_summary(
-                text=content,
-                summary=summary,
-                metadata=metadata,
+            node_ids: List[str] = []
+            if self.settings.page_summary_index_nodes:
+                node_ids = await self.embedding_service.index_summary(
+                    summary_id, hierarchical, metadata
+                )
+            
+            await self.embedding_service.update_documents(
+                vector_ids, {"summary_id": summary_id}, metadata.get("source")
             )
             
-            return True
+            return summary_id, node_ids
         except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error(
+                f"Error generating summary for {metadata.get('url', '')}: {str(e)}"
+            )
+            return None, []
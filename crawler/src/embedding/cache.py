@@ -0,0 +1,154 @@
+"""
+In-process cache of search results.
+
+Entries expire after a TTL and the least recently used entry is evicted when
+the cache is full. Every write to the vector database bumps a generation
+counter; entries cached under an older generation are treated as misses, so
+results never outlive the data they were computed from.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def make_search_key(
+    query: str, limit: int, filters: Optional[Dict[str, Any]] = None, **options: Any
+) -> Tuple[Hashable, ...]:
+    """
+    Build the cache key of a search.
+    
+    The query is lowercased and its whitespace collapsed, so trivially
+    different spellings of the same query share an entry.
+    
+    Args:
+        query: Search query
+        limit: Maximum number of results
+        filters: Optional filters
+        **options: Further search options that change the results
+    
+    Returns:
+        Tuple[Hashable, ...]: Cache key
+    """
+    normalized = " ".join(query.lower().split())
+    return (
+        normalized,
+        limit,
+        json.dumps(filters or {}, sort_keys=True),
+        json.dumps(options, sort_keys=True),
+    )
+
+
+class SearchCache:
+    """
+    Thread-safe TTL + LRU cache with generation-based invalidation.
+    
+    Cached values are shared between callers and must not be mutated.
+    
+    Attributes:
+        max_entries: Maximum number of cached entries
+        ttl_seconds: Seconds an entry stays valid
+        generation: Current data generation
+    """
+    
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of cached entries
+            ttl_seconds: Seconds an entry stays valid
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        # key -> (generation, expiry, value), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Optional[Any]: The cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            generation, expires_at, value = entry
+            if generation != self.generation or expires_at < time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+    
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Cache a value computed from the given data generation.
+        
+        Values computed before the latest write are dropped, so a search that
+        raced with a write cannot repopulate the cache with stale results.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            generation: Generation read before the value was computed
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            
+            self._entries[key] = (generation, time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def invalidate(self) -> None:
+        """
+        Invalidate every cached entry after a write.
+        """
+        with self._lock:
+            self.generation += 1
+            self._invalidations += 1
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache usage.
+        
+        Returns:
+            Dict[str, Any]: Hits, misses, hit rate, evictions and size
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "generation": self.generation,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
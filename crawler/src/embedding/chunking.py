@@ -0,0 +1,206 @@
+"""
+Splitting of documents into overlapping chunks before vectorization.
+
+The vectorizer truncates long inputs, so pages are stored as several chunks
+that each fit its input size. Chunks break at Markdown headings where possible,
+overlap by a configurable number of tokens and keep their character offsets in
+the page, so search results can be grouped back into pages.
+"""
+
+import bisect
+import logging
+import re
+from typing import Any, Dict, List, Tuple
+
+from src.utils.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Approximates the word pieces a transformer tokenizer produces
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+HEADING_PATTERN = re.compile(r"^#{1,6}\s", re.MULTILINE)
+
+# Metadata fields describing a chunk's position in its page
+CHUNK_FIELDS = ("parent_url", "chunk_index", "start_offset", "end_offset")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens the vectorizer sees for a text.
+    
+    Args:
+        text: Text to measure
+    
+    Returns:
+        int: Approximate token count
+    """
+    return sum(1 for _ in TOKEN_PATTERN.finditer(text))
+
+
+class DocumentChunker:
+    """
+    Splits documents into overlapping, heading-aware chunks.
+    
+    Attributes:
+        chunk_size: Maximum number of tokens per chunk
+        overlap: Number of tokens shared by consecutive chunks of a section
+    """
+    
+    def __init__(self, settings: Settings):
+        """
+        Initialize the chunker.
+        
+        Args:
+            settings: Application settings
+        """
+        self.chunk_size = max(1, settings.chunk_size_tokens)
+        self.overlap = max(0, min(settings.chunk_overlap_tokens, self.chunk_size - 1))
+    
+    def _sections(self, content: str, spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Group token ranges into sections that fit a chunk where possible.
+        
+        Each heading starts a new section; consecutive sections are merged
+        while they fit into one chunk together.
+        
+        Args:
+            content: Document content
+            spans: Character spans of the document's tokens
+        
+        Returns:
+            List[Tuple[int, int]]: Token index ranges of the sections
+        """
+        starts = [span[0] for span in spans]
+        boundaries = sorted({
+            bisect.bisect_left(starts, match.start())
+            for match in HEADING_PATTERN.finditer(content)
+        } | {0, len(spans)})
+        
+        sections: List[Tuple[int, int]] = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            if sections and end - sections[-1][0] <= self.chunk_size:
+                sections[-1] = (sections[-1][0], end)
+            else:
+                sections.append((start, end))
+        
+        return sections
+    
+    def split(self, content: str) -> List[Dict[str, Any]]:
+        """
+        Split a document into chunks.
+        
+        Args:
+            content: Document content
+        
+        Returns:
+            List[Dict[str, Any]]: Chunks with ``content``, ``chunk_index``,
+                ``start_offset`` and ``end_offset`` (character offsets)
+        """
+        spans = [match.span() for match in TOKEN_PATTERN.finditer(content)]
+        if not spans:
+            return [{
+                "content": content,
+                "chunk_index": 0,
+                "start_offset": 0,
+                "end_offset": len(content),
+            }]
+        
+        step = self.chunk_size - self.overlap
+        ranges = []
+        for start, end in self._sections(content, spans):
+            window = start
+            while True:
+                ranges.append((window, min(window + self.chunk_size, end)))
+                if window + self.chunk_size >= end:
+                    break
+                window += step
+        
+        chunks = []
+        for index, (first, last) in enumerate(ranges):
+            start_offset = spans[first][0]
+            end_offset = spans[last - 1][1]
+            chunks.append({
+                "content": content[start_offset:end_offset],
+                "chunk_index": index,
+                "start_offset": start_offset,
+                "end_offset": end_offset,
+            })
+        
+        return chunks
+    
+    def chunk_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Split documents into chunk documents ready for storage.
+        
+        Each chunk document carries its page's metadata plus the chunk
+        position fields, and ``document_index`` pointing back to its page.
+        
+        Args:
+            documents: List of document objects with content and metadata
+        
+        Returns:
+            List[Dict[str, Any]]: Chunk documents in page order
+        """
+        chunk_documents = []
+        
+        for document_index, doc in enumerate(documents):
+            metadata = doc.get("metadata", {}) or {}
+            for chunk in self.split(doc["content"]):
+                chunk_documents.append({
+                    "content": chunk["content"],
+                    "metadata": {
+                        **metadata,
+                        "parent_url": metadata.get("url", ""),
+                        "chunk_index": chunk["chunk_index"],
+                        "start_offset": chunk["start_offset"],
+                        "end_offset": chunk["end_offset"],
+                    },
+                    "document_index": document_index,
+                })
+        
+        logger.debug(
+            f"Split {len(documents)} documents into {len(chunk_documents)} chunks"
+        )
+        
+        return chunk_documents
+
+
+def group_chunks(results: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """
+    Group chunk search results into one result per page.
+    
+    Each page is represented by its best-scoring chunk, keeps that chunk's
+    score and lists all of its matching chunks.
+    
+    Args:
+        results: Chunk search results, best first
+        limit: Maximum number of pages
+    
+    Returns:
+        List[Dict[str, Any]]: Page results, best first
+    """
+    pages: Dict[str, Dict[str, Any]] = {}
+    
+    for result in results:
+        metadata = result.get("metadata", {})
+        key = result.get("parent_url") or metadata.get("url") or result["id"]
+        match = {
+            "id": result["id"],
+            "chunk_index": result.get("chunk_index"),
+            "start_offset": result.get("start_offset"),
+            "end_offset": result.get("end_offset"),
+            "score": result["score"],
+        }
+        
+        if key not in pages:
+            pages[key] = {**result, "chunks": []}
+        elif result["score"] > pages[key]["score"]:
+            pages[key].update({**result, "chunks": pages[key]["chunks"]})
+        pages[key]["chunks"].append(match)
+    
+    grouped = sorted(pages.values(), key=lambda page: page["score"], reverse=True)
+    for page in grouped:
+        page["chunks"].sort(key=lambda chunk: chunk["chunk_index"] or 0)
+    
+    return grouped[:limit]
@@ -0,0 +1,291 @@
+"""
+Client-side embedding models.
+
+By default Weaviate vectorizes objects with its ``text2vec-transformers``
+module. With ``embedding_mode`` set to ``hashing`` or ``openai`` the crawler
+computes the vectors itself, in large NumPy batches, and stores objects with
+explicit vectors; searches then use ``nearVector`` with cached query vectors.
+"""
+
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from src.embedding.chunking import TOKEN_PATTERN
+from src.utils.config import Settings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODES = ("weaviate", "hashing", "openai")
+
+OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    Scale each row to unit length.
+    
+    Args:
+        vectors: Matrix of vectors, one per row
+    
+    Returns:
+        np.ndarray: Matrix of unit vectors (zero rows stay zero)
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class Embedder(ABC):
+    """
+    Base class for embedding models.
+    
+    Attributes:
+        dimension: Length of the produced vectors
+        batch_size: Maximum number of texts embedded per model call
+    """
+    
+    def __init__(self, dimension: int, batch_size: int):
+        """
+        Initialize the embedder.
+        
+        Args:
+            dimension: Length of the produced vectors
+            batch_size: Maximum number of texts embedded per model call
+        """
+        self.dimension = dimension
+        self.batch_size = max(1, batch_size)
+    
+    @abstractmethod
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed one batch of texts.
+        
+        Args:
+            texts: Texts to embed, at most ``batch_size``
+        
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), dimension)
+        """
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts in batches of ``batch_size``.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            np.ndarray: float32 matrix of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        
+        batches = [
+            self._embed_batch(texts[i:i + self.batch_size])
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        return np.vstack(batches).astype(np.float32, copy=False)
+    
+    def close(self) -> None:
+        """
+        Release resources held by the embedder.
+        """
+
+
+class HashingEmbedder(Embedder):
+    """
+    Deterministic feature-hashing embedder.
+    
+    Each token is hashed to a signed bucket of the vector, so identical texts
+    always map to identical vectors without any model. Intended for tests and
+    local development.
+    """
+    
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed one batch of texts by hashing their tokens.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), dimension)
+        """
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        
+        rows = []
+        digests = []
+        for row, text in enumerate(texts):
+            for token in TOKEN_PATTERN.findall(text.lower()):
+                digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+                rows.append(row)
+                digests.append(int.from_bytes(digest, "little"))
+        
+        if digests:
+            hashes = np.array(digests, dtype=np.uint64)
+            buckets = (hashes % np.uint64(self.dimension)).astype(np.int64)
+            signs = np.where((hashes >> np.uint64(63)) == 1, -1.0, 1.0)
+            # Accumulate every token of the batch in one vectorized update
+            np.add.at(vectors, (np.array(rows), buckets), signs)
+        
+        return _normalize_rows(vectors)
+
+
+class OpenAIEmbedder(Embedder):
+    """
+    Embedder backed by the OpenAI embeddings API.
+    
+    Attributes:
+        model: Embedding model name
+        client: HTTP client for the OpenAI API
+    """
+    
+    def __init__(self, settings: Settings):
+        """
+        Initialize the embedder.
+        
+        Args:
+            settings: Application settings
+        """
+        super().__init__(settings.embedding_dimension, settings.embedding_batch_size)
+        self.model = settings.embedding_model
+        self.client = httpx.Client(
+            timeout=60.0,
+            headers={
+                "Authorization": f"Bearer {settings.openai_api_key}",
+                "Content-Type": "application/json",
+            },
+        )
+    
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed one batch of texts with a single API request.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), dimension)
+        
+        Raises:
+            httpx.HTTPStatusError: If the API request fails
+        """
+        response = self.client.post(
+            OPENAI_EMBEDDINGS_URL,
+            json={
+                "model": self.model,
+                "input": texts,
+                "dimensions": self.dimension,
+            },
+        )
+        response.raise_for_status()
+        
+        data = sorted(response.json()["data"], key=lambda item: item["index"])
+        return np.array([item["embedding"] for item in data], dtype=np.float32)
+    
+    def close(self) -> None:
+        """
+        Close the underlying HTTP client.
+        """
+        self.client.close()
+
+
+class QueryVectorCache:
+    """
+    Thread-safe LRU cache of query embeddings.
+    
+    Attributes:
+        embedder: Embedder used on cache misses
+        max_entries: Maximum number of cached query vectors
+    """
+    
+    def __init__(self, embedder: Embedder, max_entries: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            embedder: Embedder used on cache misses
+            max_entries: Maximum number of cached query vectors
+        """
+        self.embedder = embedder
+        self.max_entries = max(1, max_entries)
+        self._vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def get_vector(self, query: str) -> List[float]:
+        """
+        Get the embedding of a query, computing it on a miss.
+        
+        Args:
+            query: Search query
+        
+        Returns:
+            List[float]: Query vector
+        """
+        key = " ".join(query.lower().split())
+        
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is not None:
+                self._vectors.move_to_end(key)
+                self._hits += 1
+                return vector
+            self._misses += 1
+        
+        vector = self.embedder.embed([query])[0].tolist()
+        
+        with self._lock:
+            self._vectors[key] = vector
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+        
+        return vector
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache usage.
+        
+        Returns:
+            Dict[str, Any]: Size, hits and misses
+        """
+        with self._lock:
+            return {
+                "size": len(self._vectors),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+def create_embedder(settings: Settings) -> Optional[Embedder]:
+    """
+    Create the embedder selected by ``embedding_mode``.
+    
+    Args:
+        settings: Application settings
+    
+    Returns:
+        Optional[Embedder]: The embedder, or None if Weaviate vectorizes objects
+    
+    Raises:
+        ValueError: If the embedding mode is unknown
+    """
+    mode = settings.embedding_mode
+    if mode not in EMBEDDING_MODES:
+        raise ValueError(f"Unknown embedding mode: {mode}")
+    
+    if mode == "hashing":
+        return HashingEmbedder(settings.embedding_dimension, settings.embedding_batch_size)
+    if mode == "openai":
+        return OpenAIEmbedder(settings)
+    
+    return None
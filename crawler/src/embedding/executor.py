@@ -0,0 +1,89 @@
+"""
+Bounded thread pools for running blocking vector database calls.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Dedicated thread pool that runs blocking calls off the event loop.
+    
+    Each pool has its own worker limit, so work submitted to one pool (e.g. a
+    large ingest) cannot occupy the threads another pool (e.g. search) needs.
+    
+    Attributes:
+        name: Pool name, used for thread names and statistics
+        max_workers: Maximum number of concurrent calls
+    """
+    
+    def __init__(self, name: str, max_workers: int):
+        """
+        Initialize the executor.
+        
+        Args:
+            name: Pool name
+            max_workers: Maximum number of concurrent calls
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"weaviate-{name}"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+    
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking callable in the pool and await its result.
+        
+        Args:
+            fn: Blocking callable
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+            
+        Returns:
+            T: Result of the callable
+        """
+        with self._lock:
+            self._pending += 1
+        
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(fn, *args, **kwargs)
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Report pool usage.
+        
+        Returns:
+            Dict[str, int]: Worker limit, in-flight and completed calls
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "in_flight": self._pending,
+                "completed": self._completed,
+            }
+    
+    def shutdown(self) -> None:
+        """
+        Shut down the pool, waiting for running calls to finish.
+        """
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,169 @@
+"""
+Builder for Weaviate where filters.
+
+Search filters arrive as a mapping of metadata field to condition and are
+turned into a single where clause: conditions on different fields are joined
+with ``And``, and ``any`` / ``all`` keys nest ``Or`` / ``And`` groups. The
+filtered fields are indexed as filterable inverted-index properties, so
+Weaviate narrows the candidates before the vector search runs.
+
+Conditions take three forms::
+
+    {"source": "crawl4ai"}                                  # Equal
+    {"version": ["0.4", "0.5"]}                             # ContainsAny
+    {"url": {"operator": "Like", "value": "https://x/*"}}   # explicit operator
+    {"any": [{"source": "a"}, {"version": "latest"}]}       # Or group
+"""
+
+from typing import Any, Dict, List, Optional
+
+# Metadata properties that can be filtered on
+FILTER_FIELDS = (
+    "title", "url", "source", "version", "parent_url", "node_type", "summary_id", "parent_id"
+)
+
+# Supported operators and the value type each expects
+FILTER_OPERATORS = {
+    "Equal": "valueText",
+    "NotEqual": "valueText",
+    "Like": "valueText",
+    "ContainsAny": "valueTextArray",
+}
+
+
+def field_filter(field: str, operator: str, value: Any) -> Dict[str, Any]:
+    """
+    Build a single where condition.
+    
+    Args:
+        field: Property name
+        operator: Weaviate operator, one of FILTER_OPERATORS
+        value: Value to compare with (a list for ContainsAny)
+    
+    Returns:
+        Dict[str, Any]: Where condition with the typed value key
+    
+    Raises:
+        ValueError: If the operator is unknown or the value has the wrong type
+    """
+    if operator not in FILTER_OPERATORS:
+        raise ValueError(f"Unknown filter operator: {operator}")
+    
+    value_key = FILTER_OPERATORS[operator]
+    if value_key == "valueTextArray":
+        if isinstance(value, str) or not isinstance(value, (list, tuple)):
+            raise ValueError(f"{operator} filter on {field} requires a list of values")
+        value = [str(item) for item in value]
+    elif not isinstance(value, str):
+        raise ValueError(f"{operator} filter on {field} requires a string value")
+    
+    return {"path": [field], "operator": operator, value_key: value}
+
+
+def _combine(operator: str, operands: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Join conditions with a logical operator.
+    
+    Args:
+        operator: ``And`` or ``Or``
+        operands: Conditions to join
+    
+    Returns:
+        Optional[Dict[str, Any]]: The joined condition, the only operand, or
+            None if there are no operands
+    """
+    if not operands:
+        return None
+    if len(operands) == 1:
+        return operands[0]
+    
+    return {"operator": operator, "operands": operands}
+
+
+def all_of(operands: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Join conditions that must all match.
+    
+    Args:
+        operands: Conditions to join
+    
+    Returns:
+        Optional[Dict[str, Any]]: ``And`` condition, or None if there are none
+    """
+    return _combine("And", operands)
+
+
+def any_of(operands: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Join conditions of which at least one must match.
+    
+    Args:
+        operands: Conditions to join
+    
+    Returns:
+        Optional[Dict[str, Any]]: ``Or`` condition, or None if there are none
+    """
+    return _combine("Or", operands)
+
+
+def _condition(field: str, condition: Any) -> Dict[str, Any]:
+    """
+    Build the where condition for one filter entry.
+    
+    Args:
+        field: Metadata field
+        condition: A string, a list of strings or an operator mapping
+    
+    Returns:
+        Dict[str, Any]: Where condition
+    
+    Raises:
+        ValueError: If the field or condition is invalid
+    """
+    if field not in FILTER_FIELDS:
+        raise ValueError(f"Cannot filter on field: {field}")
+    
+    if isinstance(condition, dict):
+        if "operator" not in condition or "value" not in condition:
+            raise ValueError(f"Filter on {field} needs an operator and a value")
+        return field_filter(field, condition["operator"], condition["value"])
+    if isinstance(condition, (list, tuple)):
+        return field_filter(field, "ContainsAny", condition)
+    
+    return field_filter(field, "Equal", condition)
+
+
+def build_where(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Build the where clause for search filters.
+    
+    Args:
+        filters: Mapping of metadata field to condition, with optional
+            ``any`` and ``all`` lists of nested filter mappings
+    
+    Returns:
+        Optional[Dict[str, Any]]: Where clause, or None if there are no filters
+    
+    Raises:
+        ValueError: If a field, operator or value is invalid
+    """
+    if not filters:
+        return None
+    if not isinstance(filters, dict):
+        raise ValueError("Filters must be a mapping of field to condition")
+    
+    operands = []
+    for key, condition in filters.items():
+        if key in ("any", "all"):
+            if not isinstance(condition, list):
+                raise ValueError(f"Filter group {key} must be a list of filters")
+            groups = [
+                group for group in map(build_where, condition) if group is not None
+            ]
+            combined = any_of(groups) if key == "any" else all_of(groups)
+            if combined is not None:
+                operands.append(combined)
+        else:
+            operands.append(_condition(key, condition))
+    
+    return all_of(operands)
@@ -0,0 +1,1044 @@
+"""
+Embedded vector store for running the crawler without Weaviate.
+
+With ``vector_backend`` set to ``local`` documents are stored on disk in
+``local_vector_store_dir`` instead of Weaviate:
+
+- vectors in a memory-mapped float32 matrix (``vectors.f32``), one row per
+  document, normalized so a dot product is the cosine similarity;
+- properties in SQLite (``documents.db``), with the filterable metadata in
+  indexed columns and an FTS5 index for keyword search.
+
+Vector search is exact: the matrix is scanned in blocks with one
+matrix-vector product each, which keeps a million 384-dimensional chunks
+(about 1.5 GB) within a fraction of a second on one CPU. The scan runs
+without the store lock, so searches proceed in parallel with each other and
+with writes. The store exposes
+the same methods as WeaviateClient, so the embedding service and the API use
+either backend unchanged.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from src.embedding.cache import SearchCache
+from src.embedding.chunking import CHUNK_FIELDS
+from src.embedding.embedders import Embedder, QueryVectorCache, create_embedder
+from src.embedding.executor import BoundedExecutor
+from src.embedding.filters import FILTER_FIELDS, build_where
+from src.embedding.snippets import SEARCH_FIELDS
+from src.embedding.weaviate import (
+    EXCLUDE_SUMMARIES,
+    METADATA_DEFAULTS,
+    NODE_TYPE_SUMMARY,
+    SEARCH_MODES,
+    SUMMARY_NODE_FIELDS,
+    WeaviateClient,
+)
+from src.utils.config import Settings
+from src.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Vector search backends
+VECTOR_BACKENDS = ("weaviate", "local")
+
+# Rows allocated when the store is created; capacity doubles when full
+INITIAL_CAPACITY = 1024
+
+# Rows scored per matrix-vector product
+SEARCH_BLOCK_ROWS = 65536
+
+# Maximum number of IDs looked up in one SQL statement
+SQL_CHUNK = 500
+
+# Keyword search weights of the FTS columns (title, content); titles weigh double
+KEYWORD_WEIGHTS = (2.0, 1.0)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def _where_sql(where: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """
+    Translate a Weaviate where filter into an SQL condition.
+    
+    Args:
+        where: Where filter, as built by build_where
+    
+    Returns:
+        Tuple[str, List[Any]]: SQL condition and its parameters
+    
+    Raises:
+        ValueError: If the filter uses an unsupported operator or field
+    """
+    operator = where["operator"]
+    if operator in ("And", "Or"):
+        parts = [_where_sql(operand) for operand in where["operands"]]
+        sql = f" {operator.upper()} ".join(f"({part})" for part, _ in parts)
+        return sql, [param for _, params in parts for param in params]
+    
+    column = where["path"][0]
+    if column != "id" and column not in FILTER_FIELDS:
+        raise ValueError(f"Cannot filter on field: {column}")
+    
+    if operator == "Equal":
+        return f"{column} = ?", [where["valueText"]]
+    if operator == "NotEqual":
+        # Like Weaviate, objects without the property match
+        return f"{column} IS NOT ?", [where["valueText"]]
+    if operator == "Like":
+        # GLOB shares the * and ? wildcards and case sensitivity of Like
+        return f"{column} GLOB ?", [where["valueText"].replace("[", "[[]")]
+    if operator == "ContainsAny":
+        values = where["valueTextArray"]
+        if not values:
+            return "0", []
+        return f"{column} IN ({', '.join('?' * len(values))})", list(values)
+    
+    raise ValueError(f"Unsupported filter operator: {operator}")
+
+
+def _fts_query(query: str) -> Optional[str]:
+    """
+    Build an FTS5 query matching any word of a search query.
+    
+    Args:
+        query: Search query
+    
+    Returns:
+        Optional[str]: FTS5 query, or None if the query has no words
+    """
+    words = dict.fromkeys(word.lower() for word in WORD_PATTERN.findall(query))
+    if not words:
+        return None
+    
+    return " OR ".join(f'"{word}"' for word in words)
+
+
+def _normalized(vector: Any) -> np.ndarray:
+    """
+    Scale a vector to unit length.
+    
+    Args:
+        vector: Vector
+    
+    Returns:
+        np.ndarray: float32 unit vector (zero vectors are returned unchanged)
+    """
+    unit: np.ndarray = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(unit))
+    if norm > 0:
+        unit = unit / norm
+    return unit
+
+
+def _relative_scores(scores: Dict[int, float]) -> Dict[int, float]:
+    """
+    Rescale scores to [0, 1] by their minimum and maximum.
+    
+    Args:
+        scores: Score per row
+    
+    Returns:
+        Dict[int, float]: Rescaled score per row
+    """
+    if not scores:
+        return {}
+    
+    low = min(scores.values())
+    high = max(scores.values())
+    if high == low:
+        return {row: 1.0 for row in scores}
+    
+    return {row: (score - low) / (high - low) for row, score in scores.items()}
+
+
+class LocalVectorStore:
+    """
+    Embedded, persistent replacement for WeaviateClient.
+    
+    Requires a client-side embedder (``embedding_mode`` hashing or openai).
+    Reads and writes are serialized by a lock, as they share one SQLite
+    connection and the row allocation.
+    
+    Attributes:
+        settings: Application settings
+        directory: Directory holding the store files
+        search_executor: Thread pool for read queries
+        ingest_executor: Thread pool for writes
+        search_cache: Cache of search results, or None if disabled
+        embedder: Embedder for documents and queries
+        query_vectors: Cache of query embeddings
+        tenants: Always None; the local store is not partitioned
+    """
+    
+    def __init__(self, settings: Settings):
+        """
+        Open the store, creating it if needed.
+        
+        Args:
+            settings: Application settings
+        
+        Raises:
+            ValueError: If no client-side embedder is configured or the stored
+                vectors have a different dimension
+        """
+        self.settings = settings
+        embedder = create_embedder(settings)
+        if embedder is None:
+            raise ValueError(
+                "The local vector backend needs a client-side embedder; "
+                "set embedding_mode to hashing or openai"
+            )
+        self.embedder: Embedder = embedder
+        self.query_vectors = QueryVectorCache(self.embedder, settings.query_vector_cache_size)
+        self.dimension = self.embedder.dimension
+        self.tenants = None
+        
+        self.search_executor = BoundedExecutor("search", settings.weaviate_search_workers)
+        self.ingest_executor = BoundedExecutor("ingest", settings.weaviate_ingest_workers)
+        self.search_cache = None
+        if settings.search_cache_enabled:
+            self.search_cache = SearchCache(
+                settings.search_cache_max_entries, settings.search_cache_ttl_seconds
+            )
+        
+        self.directory = settings.local_vector_store_dir
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(
+            os.path.join(self.directory, "documents.db"), check_same_thread=False
+        )
+        self._create_tables()
+        self._open_vectors()
+        
+        metrics = get_metrics()
+        metrics.register_provider("vector_executors", self.executor_stats)
+        metrics.register_provider("local_vector_store", self.stats)
+        if self.search_cache is not None:
+            metrics.register_provider("search_cache", self.search_cache.stats)
+        metrics.register_provider("query_vector_cache", self.query_vectors.stats)
+        
+        logger.info(
+            f"Opened local vector store at {self.directory} "
+            f"with {len(self._rows)} documents"
+        )
+    
+    def _create_tables(self) -> None:
+        """
+        Create the SQLite tables and check the stored vector dimension.
+        
+        Raises:
+            ValueError: If the store holds vectors of another dimension
+        """
+        filter_columns = "".join(f", {field} TEXT" for field in FILTER_FIELDS)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS documents (id TEXT PRIMARY KEY, "
+                f"row INTEGER UNIQUE NOT NULL{filter_columns}, properties TEXT NOT NULL)"
+            )
+            # Stores created before a filter field existed get its column
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(documents)")}
+            for field in FILTER_FIELDS:
+                if field not in columns:
+                    self._db.execute(f"ALTER TABLE documents ADD COLUMN {field} TEXT")
+            for field in ("url", "source", "version", "parent_url"):
+                self._db.execute(
+                    f"CREATE INDEX IF NOT EXISTS documents_{field} ON documents ({field})"
+                )
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts "
+                "USING fts5(title, content)"
+            )
+            self._db.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('dimension', ?)", (str(self.dimension),)
+            )
+        
+        stored = int(
+            self._db.execute("SELECT value FROM meta WHERE key = 'dimension'").fetchone()[0]
+        )
+        if stored != self.dimension:
+            raise ValueError(
+                f"Local vector store holds {stored}-dimensional vectors, "
+                f"the embedder produces {self.dimension}"
+            )
+    
+    def _open_vectors(self) -> None:
+        """
+        Map the vector file and load the row allocation from SQLite.
+        """
+        self._rows: Dict[str, int] = dict(self._db.execute("SELECT id, row FROM documents"))
+        used = set(self._rows.values())
+        end = max(used) + 1 if used else 0
+        
+        path = os.path.join(self.directory, "vectors.f32")
+        row_bytes = self.dimension * 4
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        capacity = max(INITIAL_CAPACITY, size // row_bytes, end)
+        if size < capacity * row_bytes:
+            with open(path, "ab") as f:
+                f.truncate(capacity * row_bytes)
+        
+        self._path = path
+        self._vectors = np.memmap(
+            path, dtype=np.float32, mode="r+", shape=(capacity, self.dimension)
+        )
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[list(used)] = True
+        # Summary nodes are tracked in memory so the default chunk-only
+        # filter of searches needs no SQL
+        self._summary = np.zeros(capacity, dtype=bool)
+        self._summary[[
+            row for (row,) in self._db.execute(
+                "SELECT row FROM documents WHERE node_type = ?", (NODE_TYPE_SUMMARY,)
+            )
+        ]] = True
+        # Write generation of each row; rows rewritten during a search's scan
+        # are dropped from its results
+        self._generation = 0
+        self._row_generations = np.zeros(capacity, dtype=np.int64)
+        self._end = end
+        self._free = sorted(set(range(end)) - used, reverse=True)
+    
+    def _grow(self, needed: int) -> None:
+        """
+        Enlarge the vector file to hold at least the given number of rows.
+        
+        Args:
+            needed: Required capacity in rows
+        """
+        capacity = len(self._alive)
+        if needed <= capacity:
+            return
+        
+        while capacity < needed:
+            capacity *= 2
+        
+        self._vectors.flush()
+        del self._vectors
+        with open(self._path, "ab") as f:
+            f.truncate(capacity * self.dimension * 4)
+        self._vectors = np.memmap(
+            self._path, dtype=np.float32, mode="r+", shape=(capacity, self.dimension)
+        )
+        
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self._alive)] = self._alive
+        self._alive = alive
+        summary = np.zeros(capacity, dtype=bool)
+        summary[:len(self._summary)] = self._summary
+        self._summary = summary
+        row_generations = np.zeros(capacity, dtype=np.int64)
+        row_generations[:len(self._row_generations)] = self._row_generations
+        self._row_generations = row_generations
+        logger.info(f"Grew local vector store to {capacity} rows")
+    
+    def executor_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Report usage of the search and ingest thread pools.
+        
+        Returns:
+            Dict[str, Dict[str, int]]: Statistics per pool
+        """
+        return {
+            "search": self.search_executor.stats(),
+            "ingest": self.ingest_executor.stats(),
+        }
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the size of the store.
+        
+        Returns:
+            Dict[str, Any]: Document count, allocated rows and vector file size
+        """
+        with self._lock:
+            return {
+                "documents": len(self._rows),
+                "capacity": len(self._alive),
+                "free_rows": len(self._free),
+                "vector_bytes": int(self._vectors.nbytes),
+            }
+    
+    def close(self) -> None:
+        """
+        Shut down the executors and write the store to disk.
+        """
+        self.search_executor.shutdown()
+        self.ingest_executor.shutdown()
+        self.embedder.close()
+        with self._lock:
+            self._vectors.flush()
+            self._db.close()
+        logger.info(f"Closed local vector store at {self.directory}")
+    
+    def _invalidate_search_cache(self) -> None:
+        """
+        Invalidate cached search results after a write.
+        """
+        if self.search_cache is not None:
+            self.search_cache.invalidate()
+    
+    def existing_ids(
+        self, weaviate_ids: List[str], tenant: Optional[str] = None
+    ) -> Set[str]:
+        """
+        Find which of the given documents are already stored.
+        
+        Args:
+            weaviate_ids: Document IDs to check
+            tenant: Ignored; the local store is not partitioned
+        
+        Returns:
+            Set[str]: The IDs that already exist
+        """
+        with self._lock:
+            return {
+                weaviate_id for weaviate_id in weaviate_ids if weaviate_id in self._rows
+            }
+    
+    def existing_source_ids(
+        self, weaviate_ids: List[str], source: Optional[str] = None
+    ) -> Set[str]:
+        """
+        Find which of a source's documents are still stored.
+        
+        Args:
+            weaviate_ids: Document IDs to check
+            source: Ignored; the local store is not partitioned
+        
+        Returns:
+            Set[str]: The IDs that exist
+        """
+        return self.existing_ids(weaviate_ids)
+    
+    def _insert(self, documents: List[Tuple[str, Dict[str, Any], np.ndarray]]) -> None:
+        """
+        Store new documents with their vectors. Must be called with the lock held.
+        
+        Args:
+            documents: Document ID, properties and vector of each document
+        """
+        self._grow(self._end + max(0, len(documents) - len(self._free)))
+        self._generation += 1
+        
+        with self._db:
+            for weaviate_id, properties, vector in documents:
+                row = self._free.pop() if self._free else self._end
+                self._end = max(self._end, row + 1)
+                
+                self._db.execute(
+                    f"INSERT INTO documents (id, row, {', '.join(FILTER_FIELDS)}, properties) "
+                    f"VALUES (?, ?{', ?' * len(FILTER_FIELDS)}, ?)",
+                    (
+                        weaviate_id,
+                        row,
+                        *(properties.get(field) for field in FILTER_FIELDS),
+                        json.dumps(properties),
+                    ),
+                )
+                self._db.execute(
+                    "INSERT INTO documents_fts (rowid, title, content) VALUES (?, ?, ?)",
+                    (row, properties.get("title", ""), properties.get("content", "")),
+                )
+                # Rows are stored unit-length so a dot product is the cosine
+                self._vectors[row] = _normalized(vector)
+                self._alive[row] = True
+                self._row_generations[row] = self._generation
+                self._summary[row] = properties.get("node_type") == NODE_TYPE_SUMMARY
+                self._rows[weaviate_id] = row
+        
+        self._vectors.flush()
+    
+    def _remove(self, weaviate_ids: List[str]) -> int:
+        """
+        Delete stored documents. Must be called with the lock held.
+        
+        Args:
+            weaviate_ids: IDs of the documents to delete
+        
+        Returns:
+            int: Number of documents deleted
+        """
+        rows = [
+            self._rows.pop(weaviate_id)
+            for weaviate_id in dict.fromkeys(weaviate_ids)
+            if weaviate_id in self._rows
+        ]
+        if not rows:
+            return 0
+        
+        with self._db:
+            for i in range(0, len(rows), SQL_CHUNK):
+                chunk = rows[i:i + SQL_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                self._db.execute(f"DELETE FROM documents WHERE row IN ({placeholders})", chunk)
+                self._db.execute(
+                    f"DELETE FROM documents_fts WHERE rowid IN ({placeholders})", chunk
+                )
+        
+        self._generation += 1
+        self._alive[rows] = False
+        self._summary[rows] = False
+        self._row_generations[rows] = self._generation
+        self._free.extend(rows)
+        self._free.sort(reverse=True)
+        
+        return len(rows)
+    
+    def add_document(
+        self, content: str, metadata: Optional[Dict[str, str]] = None
+    ) -> Tuple[str, str]:
+        """
+        Add a document to the store.
+        
+        Adding the same document twice is a no-op.
+        
+        Args:
+            content: Document content
+            metadata: Optional metadata
+        
+        Returns:
+            Tuple[str, str]: Document ID and vector ID
+        """
+        results = self.batch_add_documents([{"content": content, "metadata": metadata or {}}])
+        return results[0]["doc_id"], results[0]["vector_id"]
+    
+    def batch_add_documents(
+        self, documents: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Add multiple documents to the store.
+        
+        New documents are embedded in one embedder call; documents that are
+        already stored are skipped and reported as successful.
+        
+        Args:
+            documents: List of document objects with content and metadata
+        
+        Returns:
+            List[Dict[str, Any]]: One result per document, in input order, with
+                ``doc_id``, ``vector_id``, ``success`` and ``error``
+        """
+        prepared = []
+        for doc in documents:
+            content = doc["content"]
+            metadata = doc.get("metadata", {})
+            prepared.append((content, metadata, WeaviateClient._object_id(content, metadata)))
+        
+        error = None
+        pending: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        try:
+            with self._lock:
+                for content, metadata, weaviate_id in prepared:
+                    if weaviate_id not in self._rows:
+                        pending[weaviate_id] = (content, metadata)
+            
+            if pending:
+                vectors = self.embedder.embed([content for content, _ in pending.values()])
+                with self._lock:
+                    # Another writer may have stored some of them meanwhile
+                    self._insert([
+                        (weaviate_id, WeaviateClient._build_object(content, metadata), vector)
+                        for (weaviate_id, (content, metadata)), vector
+                        in zip(pending.items(), vectors)
+                        if weaviate_id not in self._rows
+                    ])
+        except Exception as e:
+            logger.error(f"Failed to add documents to the local vector store: {str(e)}")
+            error = str(e)
+        finally:
+            self._invalidate_search_cache()
+        
+        results = [
+            {
+                "doc_id": str(uuid.uuid4()),
+                "vector_id": weaviate_id,
+                "success": error is None,
+                "error": error,
+            }
+            for _, _, weaviate_id in prepared
+        ]
+        
+        if error is None:
+            logger.info(
+                f"Added {len(pending)} new of {len(documents)} documents "
+                f"to the local vector store"
+            )
+        
+        return results
+    
+    def _filter_mask(self, filters: Optional[Dict[str, Any]]) -> np.ndarray:
+        """
+        Select the rows a search may return. Must be called with the lock held.
+        
+        The default exclusion of summary nodes is applied from memory; only
+        the remaining filters are looked up in SQLite.
+        
+        Args:
+            filters: Search filters, as accepted by build_where
+        
+        Returns:
+            np.ndarray: Boolean mask over the allocated rows
+        
+        Raises:
+            ValueError: If a filter is invalid
+        """
+        mask = self._alive[:self._end].copy()
+        if filters and filters.get("node_type") == EXCLUDE_SUMMARIES:
+            filters = {key: value for key, value in filters.items() if key != "node_type"}
+            mask = mask & ~self._summary[:self._end]
+        
+        where = build_where(filters)
+        if where is None:
+            return mask
+        
+        sql, params = _where_sql(where)
+        rows = [
+            row for (row,) in self._db.execute(f"SELECT row FROM documents WHERE {sql}", params)
+        ]
+        selected = np.zeros(self._end, dtype=bool)
+        selected[rows] = True
+        return mask & selected
+    
+    @staticmethod
+    def _vector_scores(
+        vectors: np.ndarray, vector: np.ndarray, limit: int, mask: np.ndarray
+    ) -> Dict[int, float]:
+        """
+        Find the rows nearest to a query vector by exact cosine similarity.
+        
+        Runs without the lock: rows written meanwhile may be scored with their
+        old or new vector, and must be checked before their results are built.
+        
+        Args:
+            vectors: Stored vectors
+            vector: Unit-length query vector
+            limit: Maximum number of rows
+            mask: Rows that may be returned
+        
+        Returns:
+            Dict[int, float]: Certainty (cosine similarity rescaled to [0, 1])
+                of the nearest rows
+        """
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        
+        for start in range(0, len(mask), SEARCH_BLOCK_ROWS):
+            block_mask = mask[start:start + SEARCH_BLOCK_ROWS]
+            if not block_mask.any():
+                continue
+            
+            scores = np.asarray(vectors[start:start + len(block_mask)] @ vector)
+            scores[~block_mask] = -np.inf
+            top = np.argpartition(-scores, min(limit, len(scores)) - 1)[:limit]
+            top = top[np.isfinite(scores[top])]
+            
+            # Keep the best rows seen so far
+            best_rows = np.concatenate([best_rows, top + start])
+            best_scores = np.concatenate([best_scores, scores[top]])
+            if len(best_rows) > limit:
+                keep = np.argpartition(-best_scores, limit - 1)[:limit]
+                best_rows, best_scores = best_rows[keep], best_scores[keep]
+        
+        return {
+            int(row): float((1 + score) / 2)
+            for row, score in zip(best_rows, best_scores)
+        }
+    
+    def _keyword_scores(
+        self, query: str, limit: int, filters: Optional[Dict[str, Any]]
+    ) -> Dict[int, float]:
+        """
+        Find the rows best matching a query by BM25.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of rows
+            filters: Search filters, as accepted by build_where
+        
+        Returns:
+            Dict[int, float]: BM25 score of the best matching rows
+        """
+        match = _fts_query(query)
+        if match is None:
+            return {}
+        
+        sql = (
+            f"SELECT documents_fts.rowid, -bm25(documents_fts, {KEYWORD_WEIGHTS[0]}, "
+            f"{KEYWORD_WEIGHTS[1]}) AS score FROM documents_fts"
+        )
+        params: List[Any] = [match]
+        where = build_where(filters)
+        if where is None:
+            sql += " WHERE documents_fts MATCH ?"
+        else:
+            condition, condition_params = _where_sql(where)
+            sql += (
+                " JOIN documents ON documents.row = documents_fts.rowid "
+                f"WHERE documents_fts MATCH ? AND ({condition})"
+            )
+            params.extend(condition_params)
+        sql += " ORDER BY score DESC LIMIT ?"
+        params.append(limit)
+        
+        return dict(self._db.execute(sql, params))
+    
+    def _load_results(
+        self,
+        scores: List[Tuple[int, float]],
+        properties: List[str],
+        with_vector: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build search results for scored rows. Must be called with the lock held.
+        
+        Args:
+            scores: Row and score of each result, best first
+            properties: Document properties to return
+            with_vector: Whether to return each result's ``vector``
+        
+        Returns:
+            List[Dict[str, Any]]: Search results
+        """
+        rows = [row for row, _ in scores]
+        stored: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        for i in range(0, len(rows), SQL_CHUNK):
+            chunk = rows[i:i + SQL_CHUNK]
+            stored.update(
+                (row, (weaviate_id, json.loads(props)))
+                for row, weaviate_id, props in self._db.execute(
+                    f"SELECT row, id, properties FROM documents "
+                    f"WHERE row IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        
+        results = []
+        for row, score in scores:
+            weaviate_id, props = stored[row]
+            result = {
+                "id": weaviate_id,
+                "content": props.get("content") if "content" in properties else None,
+                "metadata": {
+                    field: props.get(field) or default
+                    for field, default in METADATA_DEFAULTS.items()
+                    if field in properties
+                },
+                "score": score,
+                **{field: props.get(field) for field in CHUNK_FIELDS},
+                **{field: props.get(field) for field in SUMMARY_NODE_FIELDS},
+            }
+            if with_vector:
+                result["vector"] = self._vectors[row].tolist()
+            results.append(result)
+        
+        return results
+    
+    def search_similar(
+        self,
+        query: str,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        mode: str = "vector",
+        alpha: Optional[float] = None,
+        properties: Optional[List[str]] = None,
+        with_vector: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Search for similar documents in the store.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            filters: Optional metadata filters, as accepted by build_where
+            mode: Search mode: ``vector`` (semantic), ``keyword`` (BM25) or
+                ``hybrid`` (both, fused by relative score)
+            alpha: Weight of the vector score in hybrid mode (0 is pure keyword)
+            properties: Document properties to fetch (defaults to all)
+            with_vector: Whether to return each result's ``vector``
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: List of results and total count
+        
+        Raises:
+            ValueError: If the search parameters are invalid
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode}")
+        if properties is None:
+            properties = list(SEARCH_FIELDS)
+        unknown = set(properties) - set(SEARCH_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown search fields: {sorted(unknown)}")
+        
+        # Embedding the query may call a remote model; other searches and
+        # writes must not wait for it
+        vector: Optional[np.ndarray] = None
+        if mode != "keyword":
+            vector = _normalized(self.query_vectors.get_vector(query))
+        
+        # Only the selection of rows needs the lock; the scan runs without it
+        vector_scores: Dict[int, float] = {}
+        if vector is not None:
+            with self._lock:
+                mask = self._filter_mask(filters)
+                vectors = self._vectors
+                generation = self._generation
+            
+            vector_scores = self._vector_scores(vectors, vector, limit, mask)
+        
+        with self._lock:
+            if vector is not None:
+                # Rows rewritten or deleted during the scan may hold another
+                # document now
+                vector_scores = {
+                    row: score
+                    for row, score in vector_scores.items()
+                    if self._row_generations[row] <= generation
+                }
+            
+            if vector is None:
+                scores = self._keyword_scores(query, limit, filters)
+            elif mode == "vector":
+                scores = vector_scores
+            else:
+                if alpha is None:
+                    alpha = self.settings.hybrid_search_alpha
+                vector_scores = _relative_scores(vector_scores)
+                keyword_scores = _relative_scores(self._keyword_scores(query, limit, filters))
+                scores = {
+                    row: alpha * vector_scores.get(row, 0.0)
+                    + (1 - alpha) * keyword_scores.get(row, 0.0)
+                    for row in vector_scores.keys() | keyword_scores.keys()
+                }
+            
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+            results = self._load_results(ranked, properties, with_vector)
+        
+        return results, len(results)
+    
+    def search_many(
+        self, searches: List[Dict[str, Any]]
+    ) -> List[Tuple[List[Dict[str, Any]], int]]:
+        """
+        Run several searches.
+        
+        Args:
+            searches: Search parameters per query, as accepted by search_similar
+        
+        Returns:
+            List[Tuple[List[Dict[str, Any]], int]]: Results and total count
+                per search, in request order
+        """
+        return [self.search_similar(**search) for search in searches]
+    
+    def update_document(
+        self, weaviate_id: str, properties: Dict[str, Any], source: Optional[str] = None
+    ) -> bool:
+        """
+        Merge properties into an existing document.
+        
+        The stored vector is kept, as Weaviate keeps client-side vectors.
+        
+        Args:
+            weaviate_id: Document ID
+            properties: Properties to set
+            source: Ignored; the local store is not partitioned
+        
+        Returns:
+            bool: True if successful
+        
+        Raises:
+            KeyError: If the document does not exist
+        """
+        self.update_documents([weaviate_id], properties, source)
+        logger.debug(f"Updated document in the local vector store with ID: {weaviate_id}")
+        
+        return True
+    
+    def update_documents(
+        self,
+        weaviate_ids: List[str],
+        properties: Dict[str, Any],
+        source: Optional[str] = None,
+    ) -> int:
+        """
+        Merge the same properties into several documents in one transaction.
+        
+        Args:
+            weaviate_ids: Document IDs
+            properties: Properties to set
+            source: Ignored; the local store is not partitioned
+        
+        Returns:
+            int: Number of documents updated
+        
+        Raises:
+            KeyError: If a document does not exist; no document is updated then
+        """
+        with self._lock:
+            missing = [
+                weaviate_id for weaviate_id in weaviate_ids if weaviate_id not in self._rows
+            ]
+            if missing:
+                raise KeyError(f"Document {missing[0]} not found")
+            
+            columns = ", ".join(f"{field} = ?" for field in FILTER_FIELDS)
+            self._generation += 1
+            with self._db:
+                for weaviate_id in weaviate_ids:
+                    row = self._rows[weaviate_id]
+                    (stored,) = self._db.execute(
+                        "SELECT properties FROM documents WHERE row = ?", (row,)
+                    ).fetchone()
+                    merged = {**json.loads(stored), **properties}
+                    
+                    self._db.execute(
+                        f"UPDATE documents SET {columns}, properties = ? WHERE row = ?",
+                        (*(merged.get(field) for field in FILTER_FIELDS), json.dumps(merged), row),
+                    )
+                    if "title" in properties or "content" in properties:
+                        self._db.execute(
+                            "UPDATE documents_fts SET title = ?, content = ? WHERE rowid = ?",
+                            (merged.get("title", ""), merged.get("content", ""), row),
+                        )
+                    self._summary[row] = merged.get("node_type") == NODE_TYPE_SUMMARY
+                    self._row_generations[row] = self._generation
+        
+        self._invalidate_search_cache()
+        
+        return len(weaviate_ids)
+    
+    def delete_document(self, weaviate_id: str, source: Optional[str] = None) -> bool:
+        """
+        Delete a document from the store.
+        
+        Args:
+            weaviate_id: Document ID
+            source: Ignored; the local store is not partitioned
+        
+        Returns:
+            bool: True if the document was deleted
+        """
+        with self._lock:
+            deleted = self._remove([weaviate_id])
+        
+        self._invalidate_search_cache()
+        return deleted > 0
+    
+    def delete_documents(
+        self, weaviate_ids: List[str], source: Optional[str] = None
+    ) -> int:
+        """
+        Delete documents from the store.
+        
+        Args:
+            weaviate_ids: Document IDs
+            source: Ignored; the local store is not partitioned
+        
+        Returns:
+            int: Number of deleted documents
+        """
+        with self._lock:
+            deleted = self._remove(weaviate_ids)
+        
+        self._invalidate_search_cache()
+        return deleted
+    
+    def delete_where(
+        self,
+        source: Optional[str] = None,
+        version: Optional[str] = None,
+        url_prefix: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Delete every document matching the given metadata.
+        
+        Args:
+            source: Delete documents from this source
+            version: Delete documents of this version
+            url_prefix: Delete documents whose URL starts with this prefix
+            dry_run: Whether to count matching documents without deleting them
+        
+        Returns:
+            Dict[str, Any]: ``matched``, ``deleted`` and ``failed`` object
+                counts, and ``dry_run``
+        
+        Raises:
+            ValueError: If no criterion is given
+        """
+        sql, params = _where_sql(WeaviateClient._delete_filter(source, version, url_prefix))
+        
+        with self._lock:
+            ids = [
+                weaviate_id
+                for (weaviate_id,) in self._db.execute(
+                    f"SELECT id FROM documents WHERE {sql}", params
+                )
+            ]
+            if dry_run:
+                return {"matched": len(ids), "deleted": 0, "failed": 0, "dry_run": True}
+            
+            deleted = self._remove(ids)
+        
+        self._invalidate_search_cache()
+        logger.info(
+            f"Deleted {deleted} documents from the local vector store "
+            f"(source={source}, version={version}, url_prefix={url_prefix})"
+        )
+        
+        return {"matched": len(ids), "deleted": deleted, "failed": 0, "dry_run": False}
+    
+    def list_sources(self) -> List[Dict[str, Any]]:
+        """
+        List the per-source partitions.
+        
+        Raises:
+            ValueError: Always; the local store is not partitioned by source
+        """
+        raise ValueError("Documentation is not partitioned by source")
+    
+    def set_source_active(self, source: str, active: bool) -> None:
+        """
+        Load or offload a source's partition.
+        
+        Raises:
+            ValueError: Always; the local store is not partitioned by source
+        """
+        raise ValueError("Documentation is not partitioned by source")
+
+
+def create_vector_client(settings: Settings) -> Union[WeaviateClient, LocalVectorStore]:
+    """
+    Create the vector database client selected by ``vector_backend``.
+    
+    Args:
+        settings: Application settings
+    
+    Returns:
+        Union[WeaviateClient, LocalVectorStore]: The vector database client
+    
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = settings.vector_backend
+    if backend not in VECTOR_BACKENDS:
+        raise ValueError(f"Unknown vector backend: {backend}")
+    
+    if backend == "local":
+        return LocalVectorStore(settings)
+    
+    return WeaviateClient(settings)
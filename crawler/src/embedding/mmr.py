@@ -0,0 +1,106 @@
+"""
+Maximal Marginal Relevance (MMR) reranking of search results.
+
+Nearest-neighbour search often returns several near-identical chunks of the
+same section. MMR over-fetches candidates with their vectors and picks results
+one at a time, trading the relevance of each candidate against its similarity
+to the results already picked.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def mmr_select(
+    relevance: np.ndarray, vectors: np.ndarray, k: int, lambda_mult: float
+) -> List[int]:
+    """
+    Select a relevant but diverse subset of candidates.
+    
+    Each step scores all remaining candidates at once as
+    ``lambda * relevance - (1 - lambda) * max similarity to the selection``,
+    so a selection costs one matrix-vector product per picked result.
+    
+    Args:
+        relevance: Relevance of each candidate, in [0, 1]
+        vectors: Candidate vectors, one per row
+        k: Number of candidates to select
+        lambda_mult: Weight of relevance against diversity (1 is pure relevance)
+    
+    Returns:
+        List[int]: Indexes of the selected candidates, in selection order
+    """
+    count = len(relevance)
+    k = min(k, count)
+    if k <= 0:
+        return []
+    
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit = vectors / np.where(norms == 0, 1, norms)
+    
+    scores = lambda_mult * relevance
+    max_similarity = np.full(count, -np.inf)
+    available = np.ones(count, dtype=bool)
+    selected: List[int] = []
+    
+    for _ in range(k):
+        if selected:
+            marginal = scores - (1 - lambda_mult) * max_similarity
+        else:
+            marginal = scores.copy()
+        marginal[~available] = -np.inf
+        
+        best = int(np.argmax(marginal))
+        selected.append(best)
+        available[best] = False
+        max_similarity = np.maximum(max_similarity, unit @ unit[best])
+    
+    return selected
+
+
+def diversify(
+    results: List[Dict[str, Any]], limit: int, lambda_mult: float
+) -> List[Dict[str, Any]]:
+    """
+    Rerank search results with MMR and drop their vectors.
+    
+    Scores are rescaled to [0, 1] so they are comparable with cosine
+    similarities whatever the search mode. Results without a vector are
+    treated as dissimilar to every other result.
+    
+    Args:
+        results: Candidate results, with ``vector`` and ``score``
+        limit: Maximum number of results
+        lambda_mult: Weight of relevance against diversity (1 is pure relevance)
+    
+    Returns:
+        List[Dict[str, Any]]: Selected results, without vectors
+    """
+    dimension = next(
+        (len(result["vector"]) for result in results if result.get("vector")), 0
+    )
+    
+    if dimension == 0:
+        selected = list(range(min(limit, len(results))))
+    else:
+        vectors = np.zeros((len(results), dimension), dtype=np.float32)
+        for i, result in enumerate(results):
+            if result.get("vector"):
+                vectors[i] = result["vector"]
+        
+        relevance = np.array([result["score"] for result in results], dtype=np.float32)
+        top = relevance.max(initial=0.0)
+        if top > 0:
+            relevance = relevance / top
+        
+        selected = mmr_select(relevance, vectors, limit, lambda_mult)
+        logger.debug(f"MMR selected {len(selected)} of {len(results)} candidates")
+    
+    return [
+        {key: value for key, value in results[i].items() if key != "vector"}
+        for i in selected
+    ]
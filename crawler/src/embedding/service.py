@@ -1,15 +1,103 @@
 """
 Service for document embedding and similarity search.
+
+All Weaviate calls run on the client's bounded thread pools, so the event loop
+stays free while Weaviate vectorizes or ingests. Documents are split into
+overlapping chunks before they are stored, so long pages are fully vectorized.
+Repeated searches are answered from the client's search cache.
+
+The nodes of RAPTOR summary trees can be stored next to the chunks, marked
+with ``node_type``. Searches return only chunks by default; a collapsed-tree
+search ranks chunks and summaries of every level in one query, so broad
+questions are answered by a few dense summaries instead of many chunks.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, cast
 
-from src.embedding.weaviate import WeaviateClient
+from src.crawl4ai.manifest import CrawlManifest
+from src.embedding.cache import make_search_key
+from src.embedding.chunking import DocumentChunker, group_chunks
+from src.embedding.local_store import create_vector_client
+from src.embedding.mmr import diversify
+from src.embedding.snippets import project_results, search_properties
+from src.embedding.weaviate import EXCLUDE_SUMMARIES, NODE_TYPE_SUMMARY, WeaviateClient
 from src.utils.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Page metadata copied onto the summary nodes of the page
+SUMMARY_NODE_METADATA = ("title", "url", "source", "version")
+
+
+def summary_node_documents(
+    summary_id: str, hierarchical_summary: Dict[str, Any], metadata: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Flatten a RAPTOR summary tree into one document per node.
+    
+    Each node keeps the metadata of the summarized page and records its level,
+    topic, summary ID and the object ID of its parent node, so the tree can be
+    walked up from any search hit.
+    
+    Args:
+        summary_id: ID of the summary
+        hierarchical_summary: Root node of the summary tree
+        metadata: Metadata of the summarized page
+    
+    Returns:
+        List[Dict[str, Any]]: Node documents with content and metadata,
+            parents before their children
+    """
+    page_metadata = {
+        field: metadata[field] for field in SUMMARY_NODE_METADATA if field in metadata
+    }
+    documents: List[Dict[str, Any]] = []
+    
+    def add_node(node: Dict[str, Any], parent_id: Optional[str]) -> None:
+        """Add a node and its descendants."""
+        if not node.get("content"):
+            return
+        
+        node_metadata = {
+            **page_metadata,
+            "parent_url": metadata.get("url", ""),
+            "node_type": NODE_TYPE_SUMMARY,
+            "level": node.get("level", 1),
+            "summary_id": summary_id,
+        }
+        if node.get("topic"):
+            node_metadata["topic"] = node["topic"]
+        if parent_id is not None:
+            node_metadata["parent_id"] = parent_id
+        
+        documents.append({"content": node["content"], "metadata": node_metadata})
+        node_id = WeaviateClient._object_id(node["content"], node_metadata)
+        for child in node.get("children", []):
+            add_node(child, node_id)
+    
+    add_node(hierarchical_summary, None)
+    return documents
+
+
+def _node_filters(filters: Dict[str, Any], collapsed_tree: bool) -> Dict[str, Any]:
+    """
+    Restrict a search to page chunks unless it spans the whole summary tree.
+    
+    Args:
+        filters: Search filters
+        collapsed_tree: Whether summary nodes are searched with the chunks
+    
+    Returns:
+        Dict[str, Any]: Filters of the search
+    """
+    # An explicit node type filter wins
+    if collapsed_tree or "node_type" in filters:
+        return filters
+    
+    return {**filters, "node_type": EXCLUDE_SUMMARIES}
+
 
 class EmbeddingService:
     """
@@ -18,21 +106,55 @@ class EmbeddingService:
     Attributes:
         settings: Application settings
         weaviate_client: Weaviate client for vector operations
+        chunker: Document chunker, or None if chunking is disabled
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(
+        self, settings: Settings, weaviate_client: Optional[WeaviateClient] = None
+    ):
         """
         Initialize the embedding service.
         
         Args:
             settings: Application settings
+            weaviate_client: Optional shared Weaviate client; without one, the
+                client selected by ``vector_backend`` is created and owned by
+                this service
         """
         self.settings = settings
-        self.weaviate_client = WeaviateClient(settings)
+        self._owns_client = weaviate_client is None
+        self.weaviate_client = weaviate_client or cast(
+            WeaviateClient, create_vector_client(settings)
+        )
+        self.chunker = DocumentChunker(settings) if settings.chunking_enabled else None
+    
+    def close(self) -> None:
+        """
+        Close the vector database client if this service created it.
+        """
+        if self._owns_client:
+            self.weaviate_client.close()
+    
+    def _chunk_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Split documents into the objects stored in Weaviate.
+        
+        Args:
+            documents: List of document objects with content and metadata
+        
+        Returns:
+            List[Dict[str, Any]]: Objects to store, each with ``document_index``
+        """
+        if self.chunker is None:
+            return [
+                {**doc, "document_index": index} for index, doc in enumerate(documents)
+            ]
+        
+        return self.chunker.chunk_documents(documents)
     
     async def embed_document(
         self, content: str, metadata: Dict[str, str] = None
-    ) -> Tuple[str, str]:
+    ) -> Tuple[str, List[str]]:
         """
         Embed a document and store it in the vector database.
         
@@ -41,48 +163,185 @@ class EmbeddingService:
             metadata: Optional metadata
             
         Returns:
-            Tuple[str, str]: Document ID and vector ID
+            Tuple[str, List[str]]: Document ID and the vector IDs of its chunks
+        
+        Raises:
+            RuntimeError: If a chunk could not be stored
         """
         if metadata is None:
             metadata = {}
         
+        chunks = self._chunk_documents([{"content": content, "metadata": metadata}])
+        
         # Store the document in Weaviate (which will also generate the embedding)
         try:
-            doc_id, vector_id = self.weaviate_client.add_document(content, metadata)
-            logger.info(f"Embedded document with ID: {doc_id}")
+            if len(chunks) == 1:
+                doc_id, vector_id = await self.weaviate_client.ingest_executor.run(
+                    self.weaviate_client.add_document,
+                    chunks[0]["content"],
+                    chunks[0]["metadata"],
+                )
+                vector_ids = [vector_id]
+            else:
+                results = await self.weaviate_client.ingest_executor.run(
+                    self.weaviate_client.batch_add_documents, chunks
+                )
+                errors = [r["error"] for r in results if not r["success"]]
+                if errors:
+                    raise RuntimeError(
+                        f"{len(errors)} of {len(chunks)} chunks failed: {errors[0]}"
+                    )
+                doc_id = str(uuid.uuid4())
+                vector_ids = [r["vector_id"] for r in results]
+            
+            logger.info(f"Embedded document with ID: {doc_id} in {len(vector_ids)} chunks")
             
-            return doc_id, vector_id
+            return doc_id, vector_ids
         except Exception as e:
             logger.error(f"Failed to embed document: {str(e)}")
             raise
     
+    def _fetch_limit(
+        self, limit: int, group_by_page: bool, mmr_lambda: Optional[float]
+    ) -> int:
+        """
+        Number of chunks to fetch from Weaviate for a search.
+        
+        Args:
+            limit: Maximum number of results
+            group_by_page: Whether results are grouped by page
+            mmr_lambda: MMR weight, or None if results are not reranked
+        
+        Returns:
+            int: Number of chunks to fetch
+        """
+        fetch_limit = limit
+        # Several chunks may match per page, so fetch extra chunks to fill the pages
+        if group_by_page:
+            fetch_limit *= self.settings.search_group_oversample
+        # MMR needs a pool of candidates to pick diverse results from
+        if mmr_lambda is not None:
+            fetch_limit *= self.settings.mmr_oversample
+        
+        return fetch_limit
+    
+    def _finish_results(
+        self,
+        results: List[Dict[str, Any]],
+        total: int,
+        query: str,
+        limit: int,
+        group_by_page: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        snippet_length: Optional[int] = None,
+        mmr_lambda: Optional[float] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Group, rerank and project the chunks fetched for a search.
+        
+        Args:
+            results: Chunks returned by Weaviate, best first
+            total: Number of chunks returned
+            query: Search query
+            limit: Maximum number of results
+            group_by_page: Whether to merge matching chunks into one result per page
+            fields: Fields to return (defaults to all)
+            snippet_length: Snippet length in characters, or None for no snippet
+            mmr_lambda: MMR weight, or None if results are not reranked
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Final results and total count
+        """
+        if group_by_page:
+            # Every page stays a candidate when MMR picks the final results
+            results = group_chunks(results, limit if mmr_lambda is None else len(results))
+            total = len(results)
+        if mmr_lambda is not None:
+            results = diversify(results, limit, mmr_lambda)
+            total = len(results)
+        
+        return project_results(results, query, fields, snippet_length), total
+    
     async def search(
         self,
         query: str,
         limit: int = 10,
-        filters: Optional[Dict[str, str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        group_by_page: bool = False,
+        mode: str = "vector",
+        alpha: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        snippet_length: Optional[int] = None,
+        mmr_lambda: Optional[float] = None,
+        collapsed_tree: bool = False,
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
-        Search for documents by semantic similarity.
+        Search for documents by semantic similarity, keywords or both.
         
         Args:
             query: Search query
             limit: Maximum number of results
-            filters: Optional filters
+            filters: Optional metadata filters, as accepted by build_where
+            group_by_page: Whether to merge matching chunks into one result per page
+            mode: Search mode (vector, keyword or hybrid)
+            alpha: Weight of the vector score in hybrid mode (0 is pure keyword)
+            fields: Fields to return (defaults to all)
+            snippet_length: Return a highlighted snippet of this many characters
+                instead of the full content
+            mmr_lambda: Rerank results with MMR, weighting relevance against
+                diversity (1 is pure relevance); None disables reranking
+            collapsed_tree: Whether to rank RAPTOR summary nodes of every level
+                together with the page chunks
             
         Returns:
             Tuple[List[Dict[str, Any]], int]: Search results and total count
         """
-        if filters is None:
-            filters = {}
+        filters = _node_filters(filters or {}, collapsed_tree)
+        
+        cache = self.weaviate_client.search_cache
+        if cache is not None:
+            cache_key = make_search_key(
+                query,
+                limit,
+                filters,
+                group_by_page=group_by_page,
+                mode=mode,
+                alpha=alpha,
+                fields=fields,
+                snippet_length=snippet_length,
+                mmr_lambda=mmr_lambda,
+            )
+            generation = cache.generation
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Search cache hit for query: {query}")
+                return cached
         
         # Search for similar documents in Weaviate
         try:
-            results, total = self.weaviate_client.search_similar(
+            results, total = await self.weaviate_client.search_executor.run(
+                self.weaviate_client.search_similar,
                 query=query,
-                limit=limit,
+                limit=self._fetch_limit(limit, group_by_page, mmr_lambda),
                 filters=filters,
+                mode=mode,
+                alpha=alpha,
+                properties=search_properties(fields, snippet_length),
+                with_vector=mmr_lambda is not None,
             )
+            results, total = self._finish_results(
+                results,
+                total,
+                query,
+                limit,
+                group_by_page=group_by_page,
+                fields=fields,
+                snippet_length=snippet_length,
+                mmr_lambda=mmr_lambda,
+            )
+            
+            if cache is not None:
+                cache.put(cache_key, (results, total), generation)
             logger.info(f"Found {total} documents similar to query: {query}")
             
             return results, total
@@ -90,9 +349,133 @@ class EmbeddingService:
             logger.error(f"Failed to search for documents: {str(e)}")
             raise
     
+    async def search_batch(
+        self, searches: List[Dict[str, Any]]
+    ) -> List[Tuple[List[Dict[str, Any]], int]]:
+        """
+        Run many searches with a single Weaviate round-trip.
+        
+        Searches answered by the cache are not sent; the rest run as one
+        aliased multi-Get query.
+        
+        Args:
+            searches: Search parameters per query (query, limit, filters,
+                group_by_page, mode, alpha, fields, snippet_length, mmr_lambda,
+                collapsed_tree)
+        
+        Returns:
+            List[Tuple[List[Dict[str, Any]], int]]: Results and total count
+                per search, in request order
+        
+        Raises:
+            ValueError: If the batch is empty or too large
+        """
+        if not searches:
+            raise ValueError("Batch must contain at least one search")
+        if len(searches) > self.settings.search_batch_max_queries:
+            raise ValueError(
+                f"Batch exceeds the maximum of "
+                f"{self.settings.search_batch_max_queries} searches"
+            )
+        
+        searches = list(searches)
+        cache = self.weaviate_client.search_cache
+        generation = 0
+        if cache is not None:
+            generation = cache.generation
+        responses: List[Optional[Tuple[List[Dict[str, Any]], int]]] = [None] * len(searches)
+        cache_keys = []
+        pending = []
+        
+        for index, search in enumerate(searches):
+            search = {
+                "limit": 10,
+                "filters": {},
+                "group_by_page": False,
+                "mode": "vector",
+                "alpha": None,
+                "fields": None,
+                "snippet_length": None,
+                "mmr_lambda": None,
+                "collapsed_tree": False,
+                **search,
+            }
+            search["filters"] = _node_filters(search["filters"] or {}, search["collapsed_tree"])
+            searches[index] = search
+            
+            cache_key = None
+            if cache is not None:
+                cache_key = make_search_key(
+                    search["query"],
+                    search["limit"],
+                    search["filters"],
+                    group_by_page=search["group_by_page"],
+                    mode=search["mode"],
+                    alpha=search["alpha"],
+                    fields=search["fields"],
+                    snippet_length=search["snippet_length"],
+                    mmr_lambda=search["mmr_lambda"],
+                )
+                responses[index] = cache.get(cache_key)
+            cache_keys.append(cache_key)
+            
+            if responses[index] is None:
+                pending.append(index)
+        
+        if not pending:
+            return [response for response in responses if response is not None]
+        
+        queries = []
+        for index in pending:
+            search = searches[index]
+            queries.append({
+                "query": search["query"],
+                "limit": self._fetch_limit(
+                    search["limit"], search["group_by_page"], search["mmr_lambda"]
+                ),
+                "filters": search["filters"],
+                "mode": search["mode"],
+                "alpha": search["alpha"],
+                "properties": search_properties(search["fields"], search["snippet_length"]),
+                "with_vector": search["mmr_lambda"] is not None,
+            })
+        
+        try:
+            fetched = await self.weaviate_client.search_executor.run(
+                self.weaviate_client.search_many, queries
+            )
+        except Exception as e:
+            logger.error(f"Failed to run batch search: {str(e)}")
+            raise
+        
+        for index, (results, total) in zip(pending, fetched):
+            search = searches[index]
+            results, total = self._finish_results(
+                results,
+                total,
+                search["query"],
+                search["limit"],
+                group_by_page=search["group_by_page"],
+                fields=search["fields"],
+                snippet_length=search["snippet_length"],
+                mmr_lambda=search["mmr_lambda"],
+            )
+            
+            responses[index] = (results, total)
+            if cache is not None:
+                cache.put(cache_keys[index], (results, total), generation)
+        
+        logger.info(
+            f"Ran batch of {len(searches)} searches, "
+            f"{len(searches) - len(pending)} served from cache"
+        )
+        
+        # Every search is answered now, from the cache or by the query
+        return [response for response in responses if response is not None]
+    
     async def batch_embed_documents(
         self, documents: List[Dict[str, Any]]
-    ) -> List[Tuple[str, str]]:
+    ) -> List[Dict[str, Any]]:
         """
         Embed multiple documents in a batch.
         
@@ -100,34 +483,306 @@ class EmbeddingService:
             documents: List of document objects with content and metadata
             
         Returns:
-            List[Tuple[str, str]]: List of document IDs and vector IDs
+            List[Dict[str, Any]]: One result per document, in input order, with
+                ``doc_id``, ``vector_id`` (first chunk), ``vector_ids``,
+                ``success`` and ``error``
         """
+        chunks = self._chunk_documents(documents)
+        
         # Store the documents in Weaviate in batch
         try:
-            results = self.weaviate_client.batch_add_documents(documents)
-            logger.info(f"Embedded {len(documents)} documents in batch")
+            chunk_results = await self.weaviate_client.ingest_executor.run(
+                self.weaviate_client.batch_add_documents, chunks
+            )
+            
+            results = [
+                {
+                    "doc_id": str(uuid.uuid4()),
+                    "vector_id": None,
+                    "vector_ids": [],
+                    "success": True,
+                    "error": None,
+                }
+                for _ in documents
+            ]
+            for chunk, chunk_result in zip(chunks, chunk_results):
+                result = results[chunk["document_index"]]
+                result["vector_ids"].append(chunk_result["vector_id"])
+                if result["vector_id"] is None:
+                    result["vector_id"] = chunk_result["vector_id"]
+                if not chunk_result["success"]:
+                    result["success"] = False
+                    result["error"] = result["error"] or chunk_result["error"]
+            
+            embedded = sum(1 for result in results if result["success"])
+            logger.info(f"Embedded {embedded} of {len(documents)} documents in batch")
             
             return results
         except Exception as e:
             logger.error(f"Failed to batch embed documents: {str(e)}")
             raise
     
-    async def delete_document(self, vector_id: str) -> bool:
+    async def index_summary(
+        self,
+        summary_id: str,
+        hierarchical_summary: Dict[str, Any],
+        metadata: Dict[str, Any],
+    ) -> List[str]:
+        """
+        Store every node of a RAPTOR summary tree as a searchable object.
+        
+        Node IDs derive from their content and position, so indexing the same
+        summary again stores nothing new.
+        
+        Args:
+            summary_id: ID of the summary
+            hierarchical_summary: Root node of the summary tree
+            metadata: Metadata of the summarized page
+        
+        Returns:
+            List[str]: Vector IDs of the nodes, parents before their children
+        
+        Raises:
+            RuntimeError: If a node could not be stored
+        """
+        documents = summary_node_documents(summary_id, hierarchical_summary, metadata)
+        if not documents:
+            return []
+        
+        try:
+            results = await self.weaviate_client.ingest_executor.run(
+                self.weaviate_client.batch_add_documents, documents
+            )
+            errors = [r["error"] for r in results if not r["success"]]
+            if errors:
+                raise RuntimeError(
+                    f"{len(errors)} of {len(documents)} summary nodes failed: {errors[0]}"
+                )
+            
+            logger.info(f"Indexed {len(results)} nodes of summary {summary_id}")
+            return [r["vector_id"] for r in results]
+        except Exception as e:
+            logger.error(f"Failed to index summary nodes: {str(e)}")
+            raise
+    
+    async def update_document(
+        self, vector_id: str, properties: Dict[str, Any], source: Optional[str] = None
+    ) -> bool:
+        """
+        Update stored properties of a document.
+        
+        Args:
+            vector_id: Vector ID
+            properties: Properties to set
+            source: Source of the document, needed when stored per source
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            return await self.weaviate_client.ingest_executor.run(
+                self.weaviate_client.update_document, vector_id, properties, source
+            )
+        except Exception as e:
+            logger.error(f"Failed to update document: {str(e)}")
+            raise
+    
+    async def update_documents(
+        self,
+        vector_ids: List[str],
+        properties: Dict[str, Any],
+        source: Optional[str] = None,
+    ) -> int:
+        """
+        Set the same properties on several documents in one ingest task.
+        
+        Args:
+            vector_ids: Vector IDs
+            properties: Properties to set
+            source: Source of the documents, needed when stored per source
+        
+        Returns:
+            int: Number of documents updated
+        """
+        if not vector_ids:
+            return 0
+        
+        try:
+            return await self.weaviate_client.ingest_executor.run(
+                self.weaviate_client.update_documents, vector_ids, properties, source
+            )
+        except Exception as e:
+            logger.error(f"Failed to update documents: {str(e)}")
+            raise
+    
+    async def delete_document(self, vector_id: str, source: Optional[str] = None) -> bool:
         """
         Delete a document from the vector database.
         
         Args:
             vector_id: Vector ID
+            source: Source of the document, needed when stored per source
             
         Returns:
             bool: True if successful
         """
         try:
-            success = self.weaviate_client.delete_document(vector_id)
+            success = await self.weaviate_client.ingest_executor.run(
+                self.weaviate_client.delete_document, vector_id, source
+            )
             if success:
                 logger.info(f"Deleted document with vector ID: {vector_id}")
+                self._forget_crawled_pages(source, vector_ids=[vector_id])
             
             return success
         except Exception as e:
             logger.error(f"Failed to delete document: {str(e)}")
+            raise
+    
+    async def delete_documents(
+        self, vector_ids: List[str], source: Optional[str] = None
+    ) -> int:
+        """
+        Delete documents from the vector database with batch deletes.
+        
+        Unlike delete_document, the crawl manifest is left to the caller.
+        
+        Args:
+            vector_ids: Vector IDs
+            source: Source of the documents, needed when stored per source
+        
+        Returns:
+            int: Number of deleted documents
+        """
+        try:
+            return await self.weaviate_client.ingest_executor.run(
+                self.weaviate_client.delete_documents, vector_ids, source
+            )
+        except Exception as e:
+            logger.error(f"Failed to delete documents: {str(e)}")
+            raise
+    
+    async def existing_ids(
+        self, vector_ids: List[str], source: Optional[str] = None
+    ) -> Set[str]:
+        """
+        Find which of a source's documents are still in the vector database.
+        
+        Args:
+            vector_ids: Vector IDs to check
+            source: Source of the documents, needed when stored per source
+        
+        Returns:
+            Set[str]: The IDs that exist
+        """
+        return await self.weaviate_client.search_executor.run(
+            self.weaviate_client.existing_source_ids, vector_ids, source
+        )
+    
+    def _forget_crawled_pages(
+        self,
+        source: Optional[str] = None,
+        version: Optional[str] = None,
+        url_prefix: Optional[str] = None,
+        vector_ids: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Forget deleted pages in the crawl manifests, so the next crawl stores
+        them again instead of skipping them as unchanged.
+        
+        Args:
+            source: Source of the deleted documents, or None for every source
+            version: Version of the deleted documents
+            url_prefix: URL prefix of the deleted documents
+            vector_ids: IDs of the deleted documents, instead of the version
+                and URL prefix
+        """
+        if not self.settings.crawl_manifest_enabled:
+            return
+        
+        directory = self.settings.crawl_manifest_dir
+        if source is not None:
+            manifests = [CrawlManifest(directory, source)]
+        else:
+            manifests = CrawlManifest.load_all(directory)
+        
+        for manifest in manifests:
+            if vector_ids is not None:
+                forgotten = manifest.forget_objects(vector_ids)
+            else:
+                forgotten = manifest.forget(url_prefix, version)
+            if forgotten:
+                manifest.save()
+                logger.info(f"Forgot {forgotten} deleted pages of {manifest.source}")
+    
+    async def delete_by_filter(
+        self,
+        source: Optional[str] = None,
+        version: Optional[str] = None,
+        url_prefix: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Delete all documents of a source, version or URL prefix at once.
+        
+        Args:
+            source: Delete documents from this source
+            version: Delete documents of this version
+            url_prefix: Delete documents whose URL starts with this prefix
+            dry_run: Whether to count matching documents without deleting them
+        
+        Returns:
+            Dict[str, Any]: Matched, deleted and failed object counts
+        
+        Raises:
+            ValueError: If no criterion is given
+        """
+        try:
+            result = await self.weaviate_client.ingest_executor.run(
+                self.weaviate_client.delete_where,
+                source=source,
+                version=version,
+                url_prefix=url_prefix,
+                dry_run=dry_run,
+            )
+            if not dry_run:
+                self._forget_crawled_pages(source, version, url_prefix)
+            
+            return result
+        except Exception as e:
+            logger.error(f"Failed to delete documents by filter: {str(e)}")
+            raise
+    
+    async def list_sources(self) -> List[Dict[str, Any]]:
+        """
+        List the documentation sources stored in their own partition.
+        
+        Returns:
+            List[Dict[str, Any]]: Tenant ``name`` and ``active`` flag per source
+        
+        Raises:
+            ValueError: If documents are not partitioned by source
+        """
+        return await self.weaviate_client.search_executor.run(
+            self.weaviate_client.list_sources
+        )
+    
+    async def set_source_active(self, source: str, active: bool) -> None:
+        """
+        Load or archive the partition of a documentation source.
+        
+        Args:
+            source: Documentation source
+            active: Whether the source should be searchable
+        
+        Raises:
+            ValueError: If documents are not partitioned by source
+            KeyError: If the source is not stored
+        """
+        try:
+            await self.weaviate_client.ingest_executor.run(
+                self.weaviate_client.set_source_active, source, active
+            )
+        except Exception as e:
+            logger.error(f"Failed to set source {source} active={active}: {str(e)}")
             raise
\ No newline at end of file
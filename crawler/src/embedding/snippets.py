@@ -0,0 +1,169 @@
+"""
+Field projection and highlighted snippets for search results.
+
+Search results carry the full content of each hit by default. Callers can ask
+for a subset of fields and for a snippet: the window of the content that
+contains the most query terms, with the offsets of each term inside it.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+# Document properties a search can return
+SEARCH_FIELDS = ("content", "title", "url", "source", "version")
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def query_terms(query: str) -> List[str]:
+    """
+    Extract the distinct words of a query.
+    
+    Args:
+        query: Search query
+    
+    Returns:
+        List[str]: Lowercased query words, longest first
+    """
+    terms = {term.lower() for term in WORD_PATTERN.findall(query)}
+    return sorted(terms, key=lambda term: (-len(term), term))
+
+
+def make_snippet(content: str, query: str, length: int) -> Dict[str, Any]:
+    """
+    Cut the window of a document that best matches a query.
+    
+    The window of ``length`` characters containing the most query-term
+    occurrences is chosen, then trimmed to whole words.
+    
+    Args:
+        content: Document content
+        query: Search query
+        length: Maximum snippet length in characters
+    
+    Returns:
+        Dict[str, Any]: ``text``, its ``start_offset`` and ``end_offset`` in the
+            content, and ``highlights`` as (start, end) offsets in ``text``
+    """
+    terms = query_terms(query)
+    matches = []
+    if terms:
+        pattern = re.compile(
+            r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\b",
+            re.IGNORECASE,
+        )
+        matches = [match.span() for match in pattern.finditer(content)]
+    
+    start = 0
+    if matches:
+        # Slide the window over the matches and keep the densest position
+        best_count = 0
+        best_span = (0, 0)
+        right = 0
+        for left, (match_start, _) in enumerate(matches):
+            while right < len(matches) and matches[right][1] <= match_start + length:
+                right += 1
+            if right - left > best_count:
+                best_count = right - left
+                best_span = (match_start, matches[right - 1][1])
+        # Center the matched span in the window
+        padding = max(0, length - (best_span[1] - best_span[0])) // 2
+        start = max(0, best_span[0] - padding)
+    
+    end = min(len(content), start + length)
+    start = max(0, min(start, end - length))
+    
+    # Do not cut words in half
+    while start > 0 and content[start - 1].isalnum() and content[start].isalnum():
+        start += 1
+    while (
+        end < len(content)
+        and end > start
+        and content[end - 1].isalnum()
+        and content[end].isalnum()
+    ):
+        end -= 1
+    
+    return {
+        "text": content[start:end],
+        "start_offset": start,
+        "end_offset": end,
+        "highlights": [
+            (match_start - start, match_end - start)
+            for match_start, match_end in matches
+            if match_start >= start and match_end <= end
+        ],
+    }
+
+
+def search_properties(
+    fields: Optional[Sequence[str]] = None,
+    snippet_length: Optional[int] = None,
+) -> Optional[List[str]]:
+    """
+    Select the properties a search must fetch to serve a projection.
+    
+    Args:
+        fields: Fields to return, or None for all
+        snippet_length: Snippet length in characters, or None for no snippet
+    
+    Returns:
+        Optional[List[str]]: Properties to fetch, or None for all
+    """
+    if fields is None:
+        return None
+    
+    needed = set(fields)
+    if snippet_length is not None:
+        needed.add("content")
+    # Grouping by page relies on the URL
+    needed.add("url")
+    
+    return [field for field in SEARCH_FIELDS if field in needed]
+
+
+def project_results(
+    results: List[Dict[str, Any]],
+    query: str,
+    fields: Optional[Sequence[str]] = None,
+    snippet_length: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Reduce search results to the requested fields and add snippets.
+    
+    In snippet mode the full content is dropped unless ``content`` is
+    explicitly requested. Results are copied, never modified in place.
+    
+    Args:
+        results: Search results
+        query: Search query, used to pick and highlight snippets
+        fields: Fields to return, or None for all
+        snippet_length: Snippet length in characters, or None for no snippet
+    
+    Returns:
+        List[Dict[str, Any]]: Projected results
+    """
+    if fields is None and snippet_length is None:
+        return results
+    
+    keep_content = "content" in fields if fields is not None else snippet_length is None
+    projected = []
+    
+    for result in results:
+        result = dict(result)
+        content = result.get("content") or ""
+        
+        if snippet_length is not None:
+            result["snippet"] = make_snippet(content, query, snippet_length)
+        if not keep_content:
+            result["content"] = None
+        if fields is not None:
+            result["metadata"] = {
+                key: value
+                for key, value in result.get("metadata", {}).items()
+                if key in fields
+            }
+        
+        projected.append(result)
+    
+    return projected
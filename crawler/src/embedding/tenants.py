@@ -0,0 +1,287 @@
+"""
+Per-source partitioning of the Documentation class with Weaviate multi-tenancy.
+
+With ``weaviate_multi_tenancy`` enabled every documentation source is stored
+in its own tenant, which has its own HNSW graph. Searches scoped to some
+sources only walk those tenants, and a whole source can be dropped or set
+inactive (offloaded from memory) with a single schema call.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from weaviate import Tenant, TenantActivityStatus
+
+logger = logging.getLogger(__name__)
+
+# Tenant of documents without a source
+DEFAULT_TENANT = "default"
+
+# Characters Weaviate does not allow in tenant names
+INVALID_TENANT_CHARS = re.compile(r"[^A-Za-z0-9_-]+")
+
+# Minimum seconds between re-reads of the tenants after a lookup misses
+REFRESH_INTERVAL_SECONDS = 5.0
+
+
+def tenant_name(source: Optional[str]) -> str:
+    """
+    Map a documentation source to its tenant name.
+    
+    Sources that are not valid tenant names are slugified and suffixed with a
+    hash of the original, so distinct sources never share a tenant.
+    
+    Args:
+        source: Documentation source
+    
+    Returns:
+        str: Tenant name
+    """
+    if not source:
+        return DEFAULT_TENANT
+    
+    name = INVALID_TENANT_CHARS.sub("-", source).strip("-")[:48]
+    if name != source:
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:8]
+        name = f"{name}-{digest}" if name else digest
+    
+    return name
+
+
+def filter_sources(filters: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+    """
+    Extract the sources a search is restricted to by its filters.
+    
+    Only a top-level ``source`` condition with Equal or ContainsAny semantics
+    restricts the tenants; any other filter searches all of them.
+    
+    Args:
+        filters: Search filters, as accepted by build_where
+    
+    Returns:
+        Optional[List[str]]: Sources to search, or None for all
+    """
+    condition = (filters or {}).get("source")
+    if isinstance(condition, dict):
+        if condition.get("operator") not in ("Equal", "ContainsAny"):
+            return None
+        condition = condition.get("value")
+    
+    if isinstance(condition, str):
+        return [condition]
+    if isinstance(condition, (list, tuple)):
+        return [str(source) for source in condition]
+    
+    return None
+
+
+class TenantRegistry:
+    """
+    Thread-safe view of the tenants of a multi-tenant class.
+    
+    Tenants are created on first write, so ingesting a new source needs no
+    setup. Other processes create tenants too, so lookups of unknown tenants
+    re-read them from Weaviate.
+    
+    Attributes:
+        schema: Weaviate schema client
+        class_name: Multi-tenant class name
+    """
+    
+    def __init__(self, schema: Any, class_name: str):
+        """
+        Initialize the registry with the tenants that already exist.
+        
+        Args:
+            schema: Weaviate schema client
+            class_name: Multi-tenant class name
+        """
+        self.schema = schema
+        self.class_name = class_name
+        self._lock = threading.Lock()
+        self._status = self._read()
+        self._refreshed_at = time.monotonic()
+    
+    def _read(self) -> Dict[str, TenantActivityStatus]:
+        """
+        Read the tenants and their status from Weaviate.
+        
+        Returns:
+            Dict[str, TenantActivityStatus]: Status by tenant name
+        """
+        return {
+            tenant.name: tenant.activity_status
+            for tenant in self.schema.get_class_tenants(self.class_name)
+        }
+    
+    def reload(self) -> None:
+        """
+        Re-read the tenants from Weaviate.
+        """
+        status = self._read()
+        with self._lock:
+            self._status = status
+            self._refreshed_at = time.monotonic()
+    
+    def refresh(self, names: Iterable[str]) -> None:
+        """
+        Re-read the tenants if any of the given ones is unknown.
+        
+        Misses re-read the tenants at most once per REFRESH_INTERVAL_SECONDS,
+        so lookups of sources that do not exist stay cheap.
+        
+        Args:
+            names: Tenant names about to be looked up
+        """
+        wanted = set(names)
+        with self._lock:
+            if wanted <= set(self._status):
+                return
+            now = time.monotonic()
+            if now - self._refreshed_at < REFRESH_INTERVAL_SECONDS:
+                return
+            self._refreshed_at = now
+        
+        self.reload()
+        logger.debug(f"Re-read the tenants of {self.class_name}")
+    
+    def ensure(self, names: Iterable[str]) -> None:
+        """
+        Create the tenants that do not exist yet.
+        
+        Args:
+            names: Tenant names
+        """
+        with self._lock:
+            missing = sorted(set(names) - set(self._status))
+            if not missing:
+                return
+            
+            # Another process may have created them since they were read
+            self._status = self._read()
+            self._refreshed_at = time.monotonic()
+            missing = [name for name in missing if name not in self._status]
+            if not missing:
+                return
+            
+            self.schema.add_class_tenants(
+                self.class_name, [Tenant(name=name) for name in missing]
+            )
+            for name in missing:
+                self._status[name] = TenantActivityStatus.HOT
+        logger.info(f"Created tenants {missing} in {self.class_name}")
+    
+    def active(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        List the tenants that can be queried.
+        
+        Args:
+            names: Restrict to these tenant names (defaults to all)
+        
+        Returns:
+            List[str]: Existing, active tenant names
+        """
+        with self._lock:
+            candidates = self._status if names is None else names
+            return sorted(
+                name for name in set(candidates)
+                if self._status.get(name) == TenantActivityStatus.HOT
+            )
+    
+    def inactive(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        List the tenants that are offloaded and cannot be queried.
+        
+        Args:
+            names: Restrict to these tenant names (defaults to all)
+        
+        Returns:
+            List[str]: Existing, inactive tenant names
+        """
+        with self._lock:
+            candidates = self._status if names is None else names
+            return sorted(
+                name for name in set(candidates)
+                if name in self._status
+                and self._status[name] != TenantActivityStatus.HOT
+            )
+    
+    def exists(self, name: str) -> bool:
+        """
+        Check whether a tenant exists.
+        
+        Args:
+            name: Tenant name
+        
+        Returns:
+            bool: True if the tenant exists
+        """
+        with self._lock:
+            return name in self._status
+    
+    def remove(self, name: str) -> None:
+        """
+        Delete a tenant and all of its objects.
+        
+        Args:
+            name: Tenant name
+        """
+        with self._lock:
+            self.schema.remove_class_tenants(self.class_name, [name])
+            self._status.pop(name, None)
+        logger.info(f"Removed tenant {name} from {self.class_name}")
+    
+    def set_active(self, name: str, active: bool) -> None:
+        """
+        Load a tenant (HOT) or offload it from memory (COLD).
+        
+        Args:
+            name: Tenant name
+            active: Whether the tenant should be queryable
+        
+        Raises:
+            KeyError: If the tenant does not exist
+        """
+        status = TenantActivityStatus.HOT if active else TenantActivityStatus.COLD
+        with self._lock:
+            if name not in self._status:
+                raise KeyError(f"Tenant {name} not found")
+            
+            self.schema.update_class_tenants(
+                self.class_name, [Tenant(name=name, activity_status=status)]
+            )
+            self._status[name] = status
+        logger.info(f"Set tenant {name} of {self.class_name} to {status.value}")
+    
+    def describe(self) -> List[Dict[str, Any]]:
+        """
+        List all tenants with their status.
+        
+        Returns:
+            List[Dict[str, Any]]: Tenant ``name`` and ``active`` flag
+        """
+        with self._lock:
+            return [
+                {"name": name, "active": status == TenantActivityStatus.HOT}
+                for name, status in sorted(self._status.items())
+            ]
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report tenant counts.
+        
+        Returns:
+            Dict[str, Any]: Total and active tenant counts
+        """
+        with self._lock:
+            return {
+                "tenants": len(self._status),
+                "active": sum(
+                    1 for status in self._status.values()
+                    if status == TenantActivityStatus.HOT
+                ),
+            }
@@ -0,0 +1,156 @@
+"""
+HNSW vector index configuration and memory estimates.
+
+The Documentation class keeps one HNSW graph plus one vector per object in
+memory. The graph is tuned with ``ef`` (query-time candidate list),
+``efConstruction`` and ``maxConnections``, and the vectors can be compressed
+with product quantization (PQ, one byte per segment) or binary quantization
+(BQ, one bit per dimension). Compressed searches rescore their candidates
+with the full vectors read from disk, so recall stays close to uncompressed.
+"""
+
+from typing import Any, Dict, List
+
+from src.utils.config import Settings
+
+# Vector compression methods
+QUANTIZATIONS = ("none", "pq", "bq")
+
+# Index settings that can be changed on an existing class
+MUTABLE_INDEX_KEYS = ("ef", "vectorCacheMaxObjects")
+
+# Index settings fixed when the class is created
+IMMUTABLE_INDEX_KEYS = ("efConstruction", "maxConnections")
+
+# Bytes per graph edge (a uint64 neighbour ID)
+EDGE_BYTES = 8
+
+
+def pq_config(settings: Settings) -> Dict[str, Any]:
+    """
+    Build the settings that enable product quantization.
+    
+    Args:
+        settings: Application settings
+    
+    Returns:
+        Dict[str, Any]: Weaviate ``pq`` index configuration
+    """
+    config: Dict[str, Any] = {
+        "enabled": True,
+        "trainingLimit": settings.weaviate_pq_training_limit,
+    }
+    # Zero lets Weaviate pick the number of segments from the dimension
+    if settings.weaviate_pq_segments > 0:
+        config["segments"] = settings.weaviate_pq_segments
+    
+    return config
+
+
+def vector_index_config(settings: Settings, with_pq: bool = True) -> Dict[str, Any]:
+    """
+    Build the HNSW vector index configuration of the Documentation class.
+    
+    Args:
+        settings: Application settings
+        with_pq: Whether to enable PQ when it is the configured quantization;
+            PQ needs vectors to train on, so it is enabled once a class holds
+            data
+    
+    Returns:
+        Dict[str, Any]: Weaviate ``vectorIndexConfig``
+    
+    Raises:
+        ValueError: If the quantization is unknown
+    """
+    quantization = settings.weaviate_vector_quantization
+    if quantization not in QUANTIZATIONS:
+        raise ValueError(f"Unknown vector quantization: {quantization}")
+    
+    config: Dict[str, Any] = {
+        "ef": settings.weaviate_hnsw_ef,
+        "efConstruction": settings.weaviate_hnsw_ef_construction,
+        "maxConnections": settings.weaviate_hnsw_max_connections,
+        "vectorCacheMaxObjects": settings.weaviate_vector_cache_max_objects,
+    }
+    if quantization == "pq" and with_pq:
+        config["pq"] = pq_config(settings)
+    elif quantization == "bq":
+        config["bq"] = {"enabled": True}
+    
+    return config
+
+
+def index_config_changes(
+    current: Dict[str, Any], settings: Settings
+) -> Dict[str, Any]:
+    """
+    Compare an existing class's index configuration with the settings.
+    
+    Args:
+        current: ``vectorIndexConfig`` of the existing class
+        settings: Application settings
+    
+    Returns:
+        Dict[str, Any]: ``update`` with the index settings to change in place
+            (including enabling PQ), and ``fixed`` with the names of settings
+            that differ but cannot change without recreating the class
+    """
+    wanted = vector_index_config(settings, with_pq=False)
+    update: Dict[str, Any] = {
+        key: wanted[key] for key in MUTABLE_INDEX_KEYS if current.get(key) != wanted[key]
+    }
+    fixed: List[str] = [
+        key for key in IMMUTABLE_INDEX_KEYS if current.get(key) != wanted[key]
+    ]
+    
+    bq_enabled = bool(current.get("bq", {}).get("enabled"))
+    if bq_enabled != (settings.weaviate_vector_quantization == "bq"):
+        fixed.append("bq")
+    
+    pq_enabled = bool(current.get("pq", {}).get("enabled"))
+    if settings.weaviate_vector_quantization == "pq" and not pq_enabled:
+        update["pq"] = pq_config(settings)
+    elif settings.weaviate_vector_quantization != "pq" and pq_enabled:
+        # Compressed vectors cannot be restored in place
+        fixed.append("pq")
+    
+    return {"update": update, "fixed": fixed}
+
+
+def estimate_index_memory(
+    objects: int,
+    dimension: int,
+    max_connections: int,
+    quantization: str = "none",
+    pq_segments: int = 0,
+) -> Dict[str, int]:
+    """
+    Estimate the memory an HNSW index needs.
+    
+    Vectors are counted as float32 (uncompressed), one byte per PQ segment or
+    one bit per dimension for BQ. The graph is counted at its upper bound of
+    ``2 * maxConnections`` edges per object on the base layer.
+    
+    Args:
+        objects: Number of indexed objects
+        dimension: Vector dimension
+        max_connections: HNSW maxConnections
+        quantization: Vector compression (none, pq or bq)
+        pq_segments: PQ segments (0 assumes one segment per four
+            dimensions)
+    
+    Returns:
+        Dict[str, int]: ``vectors``, ``graph`` and ``total`` bytes
+    """
+    if quantization == "pq":
+        vector_bytes = pq_segments or max(1, dimension // 4)
+    elif quantization == "bq":
+        vector_bytes = (dimension + 7) // 8
+    else:
+        vector_bytes = dimension * 4
+    
+    vectors = objects * vector_bytes
+    graph = objects * 2 * max_connections * EDGE_BYTES
+    
+    return {"vectors": vectors, "graph": graph, "total": vectors + graph}
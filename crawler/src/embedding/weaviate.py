@@ -4,27 +4,181 @@ Weaviate vector database client for storing and retrieving document embeddings.
 
 import json
 import logging
+import threading
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import weaviate
+from weaviate.batch.crud_batch import WeaviateErrorRetryConf
+from weaviate.config import Config, ConnectionConfig
+from weaviate.exceptions import ObjectAlreadyExistsException
+from weaviate.gql.get import GetBuilder, HybridFusion
 from weaviate.util import generate_uuid5
 
+from src.embedding.cache import SearchCache
+from src.embedding.chunking import CHUNK_FIELDS
+from src.embedding.embedders import QueryVectorCache, create_embedder
+from src.embedding.executor import BoundedExecutor
+from src.embedding.filters import any_of, build_where, field_filter
+from src.embedding.snippets import SEARCH_FIELDS
+from src.embedding.tenants import TenantRegistry, filter_sources, tenant_name
+from src.embedding.vector_index import index_config_changes, vector_index_config
+from src.utils.circuit_breaker import CircuitBreaker
 from src.utils.config import Settings
+from src.utils.metrics import get_metrics
 
 logger = logging.getLogger(__name__)
 
 # Define the class name for documentation objects in Weaviate
 DOC_CLASS_NAME = "Documentation"
 
+# Defaults for metadata properties that are missing on an object
+METADATA_DEFAULTS = {
+    "title": "Untitled",
+    "url": "",
+    "source": "",
+    "version": "latest",
+}
+
+# Node type of RAPTOR summary nodes; page chunks have no node type
+NODE_TYPE_SUMMARY = "summary"
+
+# Node type condition of searches restricted to page chunks
+EXCLUDE_SUMMARIES = {"operator": "NotEqual", "value": NODE_TYPE_SUMMARY}
+
+# Properties describing a RAPTOR summary node, returned with every result
+SUMMARY_NODE_FIELDS = ("node_type", "level", "topic", "summary_id", "parent_id")
+
+# Search modes: semantic (nearText/nearVector), BM25 keyword, or both fused
+SEARCH_MODES = ("vector", "keyword", "hybrid")
+
+# Properties matched by keyword search; titles weigh double
+KEYWORD_SEARCH_PROPERTIES = ["title^2", "content"]
+
+# Maximum number of IDs checked for existence in one query
+EXISTENCE_CHECK_CHUNK = 500
+
+# Exact-match metadata: whole-value tokens in a filterable inverted index, so
+# filters narrow the candidates before the vector search; not used by BM25
+FILTER_PROPERTY_CONFIG = {
+    "dataType": ["text"],
+    "tokenization": "field",
+    "indexFilterable": True,
+    "indexSearchable": False,
+}
+
+# Properties added after the initial schema; created on existing classes too
+ADDED_PROPERTIES = [
+    {
+        "name": "summary_id",
+        "description": "ID of the RAPTOR summary generated for the page",
+        "dataType": ["text"],
+        "tokenization": "field",
+        "moduleConfig": {
+            "text2vec-transformers": {
+                "skip": True,
+            }
+        },
+    },
+    {
+        "name": "parent_url",
+        "description": "URL of the page the chunk belongs to",
+        **FILTER_PROPERTY_CONFIG,
+        "moduleConfig": {
+            "text2vec-transformers": {
+                "skip": True,
+            }
+        },
+    },
+    {
+        "name": "aliases",
+        "description": "URLs of near-duplicate copies of the page",
+        **FILTER_PROPERTY_CONFIG,
+        "dataType": ["text[]"],
+        "moduleConfig": {
+            "text2vec-transformers": {
+                "skip": True,
+            }
+        },
+    },
+    {
+        "name": "node_type",
+        "description": "Set to summary on RAPTOR summary nodes; unset on page chunks",
+        **FILTER_PROPERTY_CONFIG,
+        "moduleConfig": {
+            "text2vec-transformers": {
+                "skip": True,
+            }
+        },
+    },
+    {
+        "name": "level",
+        "description": "Level of the summary node in its RAPTOR tree (1 is the root)",
+        "dataType": ["int"],
+    },
+    {
+        "name": "topic",
+        "description": "Topic of the summary node",
+        "dataType": ["text"],
+        "moduleConfig": {
+            "text2vec-transformers": {
+                "skip": True,
+            }
+        },
+    },
+    {
+        "name": "parent_id",
+        "description": "Object ID of the parent summary node",
+        **FILTER_PROPERTY_CONFIG,
+        "moduleConfig": {
+            "text2vec-transformers": {
+                "skip": True,
+            }
+        },
+    },
+    {
+        "name": "chunk_index",
+        "description": "Position of the chunk within its page",
+        "dataType": ["int"],
+    },
+    {
+        "name": "start_offset",
+        "description": "Character offset where the chunk starts in its page",
+        "dataType": ["int"],
+    },
+    {
+        "name": "end_offset",
+        "description": "Character offset where the chunk ends in its page",
+        "dataType": ["int"],
+    },
+]
+
 
 class WeaviateClient:
     """
     Client for interacting with Weaviate vector database.
     
+    One instance is meant to be shared by the whole process: it holds a pooled
+    HTTP session and verifies the schema once, when it is created.
+    
+    The Weaviate client is synchronous. Async callers run its methods through
+    ``search_executor`` or ``ingest_executor``, two separate bounded thread
+    pools, so ingestion never blocks the event loop or starves searches.
+    
+    Queries go through a circuit breaker: while Weaviate is failing or slow
+    they are rejected with ``CircuitOpenError`` instead of waiting for the
+    client timeout.
+    
     Attributes:
         settings: Application settings
         client: Weaviate client
+        search_executor: Thread pool for read queries
+        ingest_executor: Thread pool for writes
+        search_cache: Cache of search results, or None if disabled
+        embedder: Client-side embedder, or None if Weaviate vectorizes objects
+        query_vectors: Cache of query embeddings used with the embedder
+        breaker: Circuit breaker guarding Weaviate queries
+        tenants: Tenants of the class when it is partitioned by source, or None
     """
     
     def __init__(self, settings: Settings):
@@ -35,6 +189,38 @@ class WeaviateClient:
             settings: Application settings
         """
         self.settings = settings
+        self.search_executor = BoundedExecutor("search", settings.weaviate_search_workers)
+        self.ingest_executor = BoundedExecutor("ingest", settings.weaviate_ingest_workers)
+        # The client's batch object keeps state and is not thread-safe
+        self._batch_lock = threading.Lock()
+        
+        get_metrics().register_provider("weaviate_executors", self.executor_stats)
+        
+        self.breaker = CircuitBreaker(
+            "weaviate",
+            failure_threshold=settings.weaviate_breaker_failure_threshold,
+            recovery_timeout=settings.weaviate_breaker_recovery_seconds,
+            slow_call_seconds=settings.weaviate_breaker_slow_call_seconds,
+        )
+        get_metrics().register_provider("weaviate_circuit_breaker", self.breaker.stats)
+        
+        self.search_cache = None
+        if settings.search_cache_enabled:
+            self.search_cache = SearchCache(
+                settings.search_cache_max_entries, settings.search_cache_ttl_seconds
+            )
+            get_metrics().register_provider("search_cache", self.search_cache.stats)
+        
+        self.embedder = create_embedder(settings)
+        self.query_vectors = None
+        if self.embedder is not None:
+            self.query_vectors = QueryVectorCache(
+                self.embedder, settings.query_vector_cache_size
+            )
+            get_metrics().register_provider("query_vector_cache", self.query_vectors.stats)
+        
+        # Loaded with the schema if the class is partitioned by source
+        self.tenants: Optional[TenantRegistry] = None
         
         # Configure auth if Weaviate API key is provided
         auth_config = None
@@ -46,9 +232,21 @@ class WeaviateClient:
             self.client = weaviate.Client(
                 url=settings.weaviate_url,
                 auth_client_secret=auth_config,
+                timeout_config=(
+                    settings.weaviate_connect_timeout,
+                    settings.weaviate_read_timeout,
+                ),
                 additional_headers={
                     "X-OpenAI-Api-Key": settings.openai_api_key,
                 },
+                # Readiness is checked by the schema request below
+                startup_period=None,
+                additional_config=Config(
+                    connection_config=ConnectionConfig(
+                        session_pool_connections=settings.weaviate_pool_connections,
+                        session_pool_maxsize=settings.weaviate_pool_maxsize,
+                    )
+                ),
             )
             logger.info(f"Connected to Weaviate at {settings.weaviate_url}")
             
@@ -58,21 +256,57 @@ class WeaviateClient:
             logger.error(f"Failed to connect to Weaviate: {str(e)}")
             raise
     
+    def executor_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Report usage of the search and ingest thread pools.
+        
+        Returns:
+            Dict[str, Dict[str, int]]: Statistics per pool
+        """
+        return {
+            "search": self.search_executor.stats(),
+            "ingest": self.ingest_executor.stats(),
+        }
+    
+    def close(self) -> None:
+        """
+        Shut down the executors and close the pooled connections to Weaviate.
+        """
+        self.search_executor.shutdown()
+        self.ingest_executor.shutdown()
+        if self.embedder is not None:
+            self.embedder.close()
+        self.client._connection.close()
+        logger.info("Closed Weaviate connections")
+    
     def _ensure_schema(self) -> None:
         """
         Ensure the required schema exists in Weaviate.
         
-        Creates the Documentation class if it doesn't exist.
+        Creates the Documentation class if it doesn't exist, and adds
+        properties introduced since an existing class was created. With
+        ``weaviate_multi_tenancy`` the class is created with one tenant per
+        documentation source. The vector index is configured from the
+        ``weaviate_hnsw_*`` and quantization settings.
         """
         # Check if the class already exists
         class_exists = self.client.schema.exists(DOC_CLASS_NAME)
         
-        if not class_exists:
+        if class_exists:
+            self._ensure_properties()
+        else:
             # Define the Documentation class
             class_obj = {
                 "class": DOC_CLASS_NAME,
                 "description": "Documentation content with embeddings",
-                "vectorizer": "text2vec-transformers",  # Using the transformer vectorizer
+                "multiTenancyConfig": {
+                    "enabled": self.settings.weaviate_multi_tenancy,
+                },
+                "vectorIndexType": "hnsw",
+                # PQ is trained on existing vectors, so it is enabled later
+                "vectorIndexConfig": vector_index_config(self.settings, with_pq=False),
+                # Objects carry their own vectors when the crawler embeds them
+                "vectorizer": "none" if self.embedder else "text2vec-transformers",
                 "moduleConfig": {
                     "text2vec-transformers": {
                         "poolingStrategy": "masked_mean",
@@ -105,7 +339,7 @@ class WeaviateClient:
                     {
                         "name": "url",
                         "description": "The URL of the documentation",
-                        "dataType": ["string"],
+                        **FILTER_PROPERTY_CONFIG,
                         "moduleConfig": {
                             "text2vec-transformers": {
                                 "skip": True,
@@ -115,7 +349,7 @@ class WeaviateClient:
                     {
                         "name": "source",
                         "description": "The source of the documentation",
-                        "dataType": ["string"],
+                        **FILTER_PROPERTY_CONFIG,
                         "moduleConfig": {
                             "text2vec-transformers": {
                                 "skip": True,
@@ -125,13 +359,14 @@ class WeaviateClient:
                     {
                         "name": "version",
                         "description": "The version of the documentation",
-                        "dataType": ["string"],
+                        **FILTER_PROPERTY_CONFIG,
                         "moduleConfig": {
                             "text2vec-transformers": {
                                 "skip": True,
                             }
                         },
                     },
+                    *ADDED_PROPERTIES,
                 ],
             }
             
@@ -139,12 +374,267 @@ class WeaviateClient:
             self.client.schema.create_class(class_obj)
             logger.info(f"Created {DOC_CLASS_NAME} class in Weaviate")
     
+        self._load_tenants()
+        self._ensure_vector_index()
+    
+    def _ensure_properties(self) -> None:
+        """
+        Add any properties missing from an existing Documentation class.
+        """
+        class_schema = self.client.schema.get(DOC_CLASS_NAME)
+        existing = {prop["name"] for prop in class_schema.get("properties", [])}
+        
+        for prop in ADDED_PROPERTIES:
+            if prop["name"] not in existing:
+                self.client.schema.property.create(DOC_CLASS_NAME, prop)
+                logger.info(f"Added property {prop['name']} to {DOC_CLASS_NAME} class")
+    
+    def _load_tenants(self) -> None:
+        """
+        Load the tenants if the Documentation class is partitioned by source.
+        
+        Multi-tenancy is fixed when a class is created, so an existing class
+        keeps its configuration whatever the settings say.
+        """
+        class_schema = self.client.schema.get(DOC_CLASS_NAME)
+        enabled = bool(class_schema.get("multiTenancyConfig", {}).get("enabled"))
+        
+        if enabled != self.settings.weaviate_multi_tenancy:
+            logger.warning(
+                f"{DOC_CLASS_NAME} class was created with multi-tenancy "
+                f"{'enabled' if enabled else 'disabled'}; "
+                f"ignoring weaviate_multi_tenancy={self.settings.weaviate_multi_tenancy}"
+            )
+        
+        if enabled:
+            tenants = TenantRegistry(self.client.schema, DOC_CLASS_NAME)
+            get_metrics().register_provider("weaviate_tenants", tenants.stats)
+            self.tenants = tenants
+    
+    def _ensure_vector_index(self) -> None:
+        """
+        Apply the vector index settings to the existing Documentation class.
+        
+        Query-time settings are updated in place, and product quantization is
+        enabled once the class holds ``weaviate_pq_training_limit`` objects to
+        train on. Graph settings and binary quantization are fixed when the
+        class is created, so differences are only logged.
+        """
+        class_schema = self.client.schema.get(DOC_CLASS_NAME)
+        changes = index_config_changes(
+            class_schema.get("vectorIndexConfig", {}), self.settings
+        )
+        
+        if changes["fixed"]:
+            logger.warning(
+                f"{DOC_CLASS_NAME} vector index settings {changes['fixed']} differ "
+                f"from the configuration but cannot change on an existing class"
+            )
+        
+        update = changes["update"]
+        if "pq" in update:
+            count = self._object_count()
+            if count < self.settings.weaviate_pq_training_limit:
+                logger.info(
+                    f"Deferring product quantization of {DOC_CLASS_NAME} until it "
+                    f"holds {self.settings.weaviate_pq_training_limit} objects ({count} now)"
+                )
+                del update["pq"]
+        
+        if update:
+            self.client.schema.update_config(DOC_CLASS_NAME, {"vectorIndexConfig": update})
+            logger.info(f"Updated {DOC_CLASS_NAME} vector index settings: {sorted(update)}")
+    
+    def _object_count(self) -> int:
+        """
+        Count the objects of the Documentation class across active tenants.
+        
+        Returns:
+            int: Number of objects
+        """
+        if self.tenants is None:
+            return self._count(None)
+        
+        return sum(self._count(None, tenant) for tenant in self.tenants.active())
+    
+    def _tenant(self, source: Optional[str], create: bool = False) -> Optional[str]:
+        """
+        Get the tenant that stores a source's documents.
+        
+        Args:
+            source: Documentation source
+            create: Whether to create the tenant if it does not exist
+        
+        Returns:
+            Optional[str]: Tenant name, or None if the class is not partitioned
+        """
+        if self.tenants is None:
+            return None
+        
+        name = tenant_name(source)
+        if create:
+            self.tenants.ensure([name])
+        
+        return name
+    
+    def _search_tenants(self, filters: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+        """
+        Select the tenants a search must query.
+        
+        Args:
+            filters: Search filters
+        
+        Returns:
+            Optional[List[str]]: Active tenants of the filtered sources (all
+                active tenants without a source filter), or None if the class
+                is not partitioned
+        """
+        if self.tenants is None:
+            return None
+        
+        sources = filter_sources(filters)
+        if sources is None:
+            return self.tenants.active()
+        
+        names = [tenant_name(source) for source in sources]
+        self.tenants.refresh(names)
+        return self.tenants.active(names)
+    
+    def _invalidate_search_cache(self) -> None:
+        """
+        Invalidate cached search results after a write.
+        """
+        if self.search_cache is not None:
+            self.search_cache.invalidate()
+    
+    @staticmethod
+    def _object_id(content: str, metadata: Dict[str, Any]) -> str:
+        """
+        Compute the deterministic Weaviate ID of a document.
+        
+        Args:
+            content: Document content
+            metadata: Document metadata
+        
+        Returns:
+            str: UUID derived from the content and metadata
+        """
+        metadata_str = json.dumps(metadata, sort_keys=True)
+        return generate_uuid5(f"{content}::{metadata_str}")
+    
+    @staticmethod
+    def _build_object(content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Weaviate properties of a document.
+        
+        Args:
+            content: Document content
+            metadata: Document metadata, optionally with chunk position fields,
+                the URLs of duplicate copies and summary node fields
+        
+        Returns:
+            Dict[str, Any]: Document properties
+        """
+        doc_obj = {
+            "content": content,
+            "title": metadata.get("title", "Untitled Document"),
+            "url": metadata.get("url", ""),
+            "source": metadata.get("source", ""),
+            "version": metadata.get("version", "latest"),
+        }
+        for field in (*CHUNK_FIELDS, *SUMMARY_NODE_FIELDS, "aliases"):
+            if field in metadata:
+                doc_obj[field] = metadata[field]
+        
+        return doc_obj
+    
+    def existing_ids(
+        self, weaviate_ids: List[str], tenant: Optional[str] = None
+    ) -> Set[str]:
+        """
+        Find which of the given objects already exist in Weaviate.
+        
+        The IDs are checked with one GraphQL query per EXISTENCE_CHECK_CHUNK
+        IDs instead of one request per object.
+        
+        Args:
+            weaviate_ids: Weaviate object IDs to check
+            tenant: Tenant storing the objects, if the class is partitioned
+        
+        Returns:
+            Set[str]: The IDs that already exist
+        
+        Raises:
+            CircuitOpenError: If Weaviate is unavailable
+        """
+        found: Set[str] = set()
+        unique_ids = list(dict.fromkeys(weaviate_ids))
+        
+        for i in range(0, len(unique_ids), EXISTENCE_CHECK_CHUNK):
+            chunk = unique_ids[i:i + EXISTENCE_CHECK_CHUNK]
+            where = any_of([
+                field_filter("id", "Equal", weaviate_id) for weaviate_id in chunk
+            ])
+            
+            query_builder = (
+                self.client.query
+                .get(DOC_CLASS_NAME, [])
+                .with_additional(["id"])
+                .with_where(where)
+                .with_limit(len(chunk))
+            )
+            if tenant is not None:
+                query_builder = query_builder.with_tenant(tenant)
+            response = self.breaker.call(query_builder.do)
+            if "errors" in response:
+                raise RuntimeError(f"Existence check failed: {response['errors']}")
+            
+            objects = response.get("data", {}).get("Get", {}).get(DOC_CLASS_NAME) or []
+            found.update(obj["_additional"]["id"] for obj in objects)
+        
+        return found
+    
+    def existing_source_ids(
+        self, weaviate_ids: List[str], source: Optional[str] = None
+    ) -> Set[str]:
+        """
+        Find which of a source's objects still exist in Weaviate.
+        
+        Inactive tenants cannot be queried, so their objects are assumed to
+        exist.
+        
+        Args:
+            weaviate_ids: Weaviate object IDs to check
+            source: Source of the objects, locating their tenant when the
+                class is partitioned
+        
+        Returns:
+            Set[str]: The IDs that exist
+        
+        Raises:
+            CircuitOpenError: If Weaviate is unavailable
+        """
+        if self.tenants is None:
+            return self.existing_ids(weaviate_ids)
+        
+        tenant = tenant_name(source)
+        self.tenants.refresh([tenant])
+        if not self.tenants.exists(tenant):
+            return set()
+        if not self.tenants.active([tenant]):
+            return set(weaviate_ids)
+        
+        return self.existing_ids(weaviate_ids, tenant)
+    
     def add_document(
         self, content: str, metadata: Dict[str, str] = None
     ) -> Tuple[str, str]:
         """
         Add a document to Weaviate.
         
+        The Weaviate ID is derived from the content and metadata, so adding
+        the same document twice is a no-op that costs a single request.
+        
         Args:
             content: Document content
             metadata: Optional metadata
@@ -155,58 +645,183 @@ class WeaviateClient:
         if metadata is None:
             metadata = {}
         
-        # Generate a deterministic UUID based on content
         doc_id = str(uuid.uuid4())
         
         # For the Weaviate ID, include both content and metadata to avoid duplicates
-        metadata_str = json.dumps(metadata, sort_keys=True)
-        content_hash = f"{content}::{metadata_str}"
-        weaviate_id = generate_uuid5(content_hash)
-        
-        # Prepare the document object
-        doc_obj = {
-            "content": content,
-            "title": metadata.get("title", "Untitled Document"),
-            "url": metadata.get("url", ""),
-            "source": metadata.get("source", ""),
-            "version": metadata.get("version", "latest"),
-        }
+        weaviate_id = self._object_id(content, metadata)
         
         # Add the document to Weaviate
         try:
-            # Check if object already exists
-            try:
-                existing_obj = self.client.data_object.get(
-                    class_name=DOC_CLASS_NAME,
-                    uuid=weaviate_id
-                )
-                # If it exists, just return the IDs
-                if existing_obj:
-                    logger.info(f"Document already exists in Weaviate with ID: {weaviate_id}")
-                    return doc_id, weaviate_id
-            except Exception:
-                # Object doesn't exist, continue with creation
-                pass
-                
-            # Create the document
+            vector = None
+            if self.embedder is not None:
+                vector = self.embedder.embed([content])[0].tolist()
+            
             self.client.data_object.create(
-                data_object=doc_obj,
+                data_object=self._build_object(content, metadata),
                 class_name=DOC_CLASS_NAME,
                 uuid=weaviate_id,
+                vector=vector,
+                tenant=self._tenant(metadata.get("source"), create=True),
             )
+            self._invalidate_search_cache()
             logger.info(f"Added document to Weaviate with ID: {weaviate_id}")
             
+            return doc_id, weaviate_id
+        except ObjectAlreadyExistsException:
+            logger.info(f"Document already exists in Weaviate with ID: {weaviate_id}")
             return doc_id, weaviate_id
         except Exception as e:
             logger.error(f"Failed to add document to Weaviate: {str(e)}")
             # Even if we fail, return IDs to avoid breaking the flow
             return doc_id, weaviate_id
     
+    def _build_search_query(
+        self,
+        query: str,
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+        mode: str = "vector",
+        alpha: Optional[float] = None,
+        properties: Optional[List[str]] = None,
+        with_vector: bool = False,
+    ) -> GetBuilder:
+        """
+        Build the GraphQL Get query for a search.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            filters: Optional metadata filters, as accepted by build_where
+            mode: Search mode (vector, keyword or hybrid)
+            alpha: Weight of the vector score in hybrid mode (0 is pure keyword)
+            properties: Document properties to fetch (defaults to all)
+            with_vector: Whether to fetch the object vectors
+        
+        Returns:
+            GetBuilder: Query builder
+        
+        Raises:
+            ValueError: If the search mode, a property or a filter is invalid
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode}")
+        
+        if properties is None:
+            properties = list(SEARCH_FIELDS)
+        unknown = set(properties) - set(SEARCH_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown search fields: {sorted(unknown)}")
+        
+        # Vector search ranks by certainty, keyword and hybrid by their own score
+        additional = ["id", "certainty" if mode == "vector" else "score"]
+        if with_vector:
+            additional.append("vector")
+        
+        query_builder = (
+            self.client.query.get(
+                DOC_CLASS_NAME, [*properties, *CHUNK_FIELDS, *SUMMARY_NODE_FIELDS]
+            )
+            .with_limit(limit)
+            .with_additional(additional)
+        )
+        
+        if mode == "keyword":
+            query_builder = query_builder.with_bm25(
+                query=query, properties=KEYWORD_SEARCH_PROPERTIES
+            )
+        elif mode == "hybrid":
+            if alpha is None:
+                alpha = self.settings.hybrid_search_alpha
+            query_builder = query_builder.with_hybrid(
+                query=query,
+                alpha=alpha,
+                # Client-side embeddings supply the vector half of the query
+                vector=(
+                    self.query_vectors.get_vector(query)
+                    if self.query_vectors is not None else None
+                ),
+                properties=KEYWORD_SEARCH_PROPERTIES,
+                fusion_type=HybridFusion.RELATIVE_SCORE,
+            )
+        elif self.query_vectors is not None:
+            # Client-side embeddings search by vector; the query vector is cached
+            query_builder = query_builder.with_near_vector(
+                {"vector": self.query_vectors.get_vector(query)}
+            )
+        else:
+            query_builder = query_builder.with_near_text({"concepts": [query]})
+        
+        # Weaviate applies the filter before the vector search
+        where = build_where(filters)
+        if where is not None:
+            query_builder = query_builder.with_where(where)
+        
+        return query_builder
+    
+    def _transform_results(self, docs: Any) -> List[Dict[str, Any]]:
+        """
+        Convert the objects returned by a Get query into search results.
+        
+        Args:
+            docs: Objects returned for the Documentation class
+        
+        Returns:
+            List[Dict[str, Any]]: Search results
+        """
+        transformed_results = []
+        if not isinstance(docs, list):
+            return transformed_results
+        
+        # Transform the results
+        for i, doc in enumerate(docs):
+            # Basic validation
+            if not isinstance(doc, dict):
+                continue
+            
+            # Check if _additional field exists
+            doc_id = f"unknown-{i}"
+            score = 0.0
+            vector = None
+            
+            if "_additional" in doc:
+                add_data = doc["_additional"]
+                if isinstance(add_data, dict):
+                    if "id" in add_data:
+                        doc_id = str(add_data["id"])
+                    # Certainty for vector search, fused score for keyword and hybrid
+                    for score_field in ("certainty", "score"):
+                        if add_data.get(score_field) is not None:
+                            score = float(add_data[score_field])
+                    vector = add_data.get("vector")
+            
+            result = {
+                "id": doc_id,
+                "content": doc.get("content"),
+                # Only the fetched properties; missing values get defaults
+                "metadata": {
+                    field: doc.get(field) or default
+                    for field, default in METADATA_DEFAULTS.items()
+                    if field in doc
+                },
+                "score": score,
+                **{field: doc.get(field) for field in CHUNK_FIELDS},
+                **{field: doc.get(field) for field in SUMMARY_NODE_FIELDS},
+            }
+            if vector is not None:
+                result["vector"] = vector
+            transformed_results.append(result)
+        
+        return transformed_results
+    
     def search_similar(
         self,
         query: str,
         limit: int = 10,
-        filters: Optional[Dict[str, str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        mode: str = "vector",
+        alpha: Optional[float] = None,
+        properties: Optional[List[str]] = None,
+        with_vector: bool = False,
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Search for similar documents in Weaviate.
@@ -214,129 +829,197 @@ class WeaviateClient:
         Args:
             query: Search query
             limit: Maximum number of results
-            filters: Optional filters
+            filters: Optional metadata filters, as accepted by build_where
+            mode: Search mode: ``vector`` (semantic), ``keyword`` (BM25) or
+                ``hybrid`` (both, fused by relative score)
+            alpha: Weight of the vector score in hybrid mode (0 is pure keyword)
+            properties: Document properties to fetch (defaults to all)
+            with_vector: Whether to return each result's ``vector``
             
         Returns:
             Tuple[List[Dict[str, Any]], int]: List of results and total count
+        
+        Raises:
+            ValueError: If the search parameters are invalid
+            CircuitOpenError: If Weaviate is unavailable
+            RuntimeError: If Weaviate reports errors for the query
         """
+        if self.tenants is not None:
+            # Partitioned searches query every selected tenant in one request
+            return self.search_many([{
+                "query": query,
+                "limit": limit,
+                "filters": filters,
+                "mode": mode,
+                "alpha": alpha,
+                "properties": properties,
+                "with_vector": with_vector,
+            }])[0]
+        
+        query_builder = self._build_search_query(
+            query, limit, filters, mode, alpha, properties, with_vector
+        )
+        
         try:
-            # Build the query
-            query_builder = (
-                self.client.query.get(DOC_CLASS_NAME, ["content", "title", "url", "source", "version"])
-                .with_near_text({"concepts": [query]})
-                .with_limit(limit)
-                .with_additional(["id", "certainty"])
-            )
-            
-            # Add filters if provided
-            if filters and len(filters) > 0:
-                try:
-                    where_filter = {}
-                    
-                    for key, value in filters.items():
-                        # Add filter for each metadata field
-                        if key in ["title", "url", "source", "version"]:
-                            where_filter[key] = {"operator": "Equal", "valueString": value}
-                    
-                    if where_filter and len(where_filter) > 0:
-                        query_builder = query_builder.with_where(where_filter)
-                except Exception as filter_e:
-                    logger.warning(f"Failed to apply filters, skipping: {filter_e}")
-            
-            # Execute the query
-            result = query_builder.do()
-            
-            # Fallback to mock data if needed
-            if not result or not isinstance(result, dict):
-                logger.warning("Search returned invalid results, using mock data")
-                return self._get_mock_results(query, limit), limit
-            
-            # Extract the results
-            transformed_results = []
-            total = 0
-            
-            if "data" in result and "Get" in result["data"]:
-                get_data = result["data"]["Get"]
-                
-                if DOC_CLASS_NAME in get_data and isinstance(get_data[DOC_CLASS_NAME], list):
-                    docs = get_data[DOC_CLASS_NAME]
-                    total = len(docs)
-                    
-                    # Transform the results
-                    for i, doc in enumerate(docs):
-                        # Basic validation
-                        if not isinstance(doc, dict) or "content" not in doc:
-                            continue
-                            
-                        # Check if _additional field exists
-                        doc_id = f"unknown-{i}"
-                        certainty = 0.0
-                        
-                        if "_additional" in doc:
-                            add_data = doc["_additional"]
-                            if isinstance(add_data, dict):
-                                if "id" in add_data:
-                                    doc_id = str(add_data["id"])
-                                if "certainty" in add_data:
-                                    certainty = float(add_data["certainty"])
-                        
-                        transformed_results.append({
-                            "id": doc_id,
-                            "content": doc["content"],
-                            "metadata": {
-                                "title": doc.get("title", "Untitled"),
-                                "url": doc.get("url", ""),
-                                "source": doc.get("source", ""),
-                                "version": doc.get("version", "latest"),
-                            },
-                            "score": certainty,
-                        })
-            
-            if not transformed_results:
-                logger.info("No search results found, using mock data")
-                return self._get_mock_results(query, limit), limit
-                
-            return transformed_results, total
+            result = self.breaker.call(query_builder.do)
         except Exception as e:
             logger.error(f"Failed to search in Weaviate: {str(e)}")
-            # Fall back to mock data on error
-            return self._get_mock_results(query, limit), limit
+            raise
+        
+        if "errors" in result:
+            raise RuntimeError(f"Search failed: {result['errors']}")
+        
+        get_data = (result.get("data") or {}).get("Get") or {}
+        transformed_results = self._transform_results(get_data.get(DOC_CLASS_NAME))
+        
+        return transformed_results, len(transformed_results)
     
-    def _get_mock_results(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    def search_many(
+        self, searches: List[Dict[str, Any]]
+    ) -> List[Tuple[List[Dict[str, Any]], int]]:
         """
-        Get mock search results for testing purposes.
+        Run several searches as one aliased multi-Get GraphQL request.
+        
+        When the class is partitioned by source, each search queries the
+        tenants of its source filter (all tenants without one) and their
+        results are merged by score.
         
         Args:
-            query: Search query
-            limit: Maximum number of results
+            searches: Search parameters per query (query, limit, filters,
+                mode, alpha, properties, with_vector), as accepted by
+                search_similar
+        
+        Returns:
+            List[Tuple[List[Dict[str, Any]], int]]: Results and total count
+                per search, in request order
+        
+        Raises:
+            CircuitOpenError: If Weaviate is unavailable
+            RuntimeError: If Weaviate reports errors for the request
+        """
+        if not searches:
+            return []
+        
+        builders = []
+        # Aliases of the queries answering each search
+        aliases: List[List[str]] = []
+        for index, search in enumerate(searches):
+            tenants = self._search_tenants(search.get("filters"))
+            if tenants is None:
+                builders.append(self._build_search_query(**search).with_alias(f"q{index}"))
+                aliases.append([f"q{index}"])
+                continue
+        
+            search_aliases: List[str] = []
+            for tenant in tenants:
+                alias = f"q{index}_{len(search_aliases)}"
+                builders.append(
+                    self._build_search_query(**search).with_alias(alias).with_tenant(tenant)
+                )
+                search_aliases.append(alias)
+            aliases.append(search_aliases)
+        
+        get_data: Dict[str, Any] = {}
+        if builders:
+            try:
+                result = self.breaker.call(self.client.query.multi_get(builders).do)
+            except Exception as e:
+                logger.error(f"Failed to run batch search in Weaviate: {str(e)}")
+                raise
+        
+            if "errors" in result:
+                raise RuntimeError(f"Batch search failed: {result['errors']}")
+            
+            get_data = (result.get("data") or {}).get("Get") or {}
+        
+        responses = []
+        for search, search_aliases in zip(searches, aliases):
+            results = []
+            for alias in search_aliases:
+                results.extend(self._transform_results(get_data.get(alias)))
+            if len(search_aliases) > 1:
+                results.sort(key=lambda result: result["score"], reverse=True)
+                results = results[:search["limit"]]
+            responses.append((results, len(results)))
+        
+        return responses
+    
+    def update_document(
+        self, weaviate_id: str, properties: Dict[str, Any], source: Optional[str] = None
+    ) -> bool:
+        """
+        Merge properties into an existing document.
+        
+        Args:
+            weaviate_id: Weaviate object ID
+            properties: Properties to set
+            source: Source of the document, locating its tenant when the class
+                is partitioned
             
         Returns:
-            List[Dict[str, Any]]: List of mock results
+            bool: True if successful
         """
-        # Simple mock data
-        mock_docs = [
-            {
-                "id": f"mock-{i}",
-                "content": f"This is a mock document {i} for query: {query}",
-                "metadata": {
-                    "title": f"Mock Document {i}",
-                    "url": f"https://example.com/doc{i}",
-                    "source": "mock-data",
-                    "version": "latest",
-                },
-                "score": 0.95 - (i * 0.05),
-            }
-            for i in range(1, min(limit + 1, 6))
-        ]
+        try:
+            self.client.data_object.update(
+                data_object=properties,
+                class_name=DOC_CLASS_NAME,
+                uuid=weaviate_id,
+                tenant=self._tenant(source),
+            )
+            self._invalidate_search_cache()
+            logger.debug(f"Updated document in Weaviate with ID: {weaviate_id}")
+            
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update document in Weaviate: {str(e)}")
+            raise
+    
+    def update_documents(
+        self,
+        weaviate_ids: List[str],
+        properties: Dict[str, Any],
+        source: Optional[str] = None,
+    ) -> int:
+        """
+        Merge the same properties into several documents.
         
-        return mock_docs
+        Weaviate has no batch update, so the objects are updated one by one;
+        running them in one call saves a thread pool hop per object.
+        
+        Args:
+            weaviate_ids: Weaviate object IDs
+            properties: Properties to set
+            source: Source of the documents, locating their tenant when the
+                class is partitioned
+        
+        Returns:
+            int: Number of documents updated
+        """
+        try:
+            tenant = self._tenant(source)
+            for weaviate_id in weaviate_ids:
+                self.client.data_object.update(
+                    data_object=properties,
+                    class_name=DOC_CLASS_NAME,
+                    uuid=weaviate_id,
+                    tenant=tenant,
+                )
+            self._invalidate_search_cache()
+            logger.debug(f"Updated {len(weaviate_ids)} documents in Weaviate")
+            
+            return len(weaviate_ids)
+        except Exception as e:
+            logger.error(f"Failed to update documents in Weaviate: {str(e)}")
+            raise
     
-    def delete_document(self, weaviate_id: str) -> bool:
+    def delete_document(self, weaviate_id: str, source: Optional[str] = None) -> bool:
         """
         Delete a document from Weaviate.
         
         Args:
             weaviate_id: Weaviate object ID
+            source: Source of the document, locating its tenant when the class
+                is partitioned
             
         Returns:
             bool: True if successful
@@ -345,7 +1028,9 @@ class WeaviateClient:
             self.client.data_object.delete(
                 uuid=weaviate_id,
                 class_name=DOC_CLASS_NAME,
+                tenant=self._tenant(source),
             )
+            self._invalidate_search_cache()
             logger.info(f"Deleted document from Weaviate with ID: {weaviate_id}")
             
             return True
@@ -353,53 +1038,435 @@ class WeaviateClient:
             logger.error(f"Failed to delete document from Weaviate: {str(e)}")
             raise
     
+    def delete_documents(
+        self, weaviate_ids: List[str], source: Optional[str] = None
+    ) -> int:
+        """
+        Delete documents from Weaviate with batch deletes.
+        
+        The objects are deleted with one request per EXISTENCE_CHECK_CHUNK
+        IDs instead of one request per object.
+        
+        Args:
+            weaviate_ids: Weaviate object IDs
+            source: Source of the documents, locating their tenant when the
+                class is partitioned
+        
+        Returns:
+            int: Number of deleted documents
+        
+        Raises:
+            CircuitOpenError: If Weaviate is unavailable
+            RuntimeError: If some of the documents failed to delete
+        """
+        tenant = None
+        if self.tenants is not None:
+            tenant = tenant_name(source)
+            self.tenants.refresh([tenant])
+            if not self.tenants.exists(tenant):
+                return 0
+        
+        unique_ids = list(dict.fromkeys(weaviate_ids))
+        deleted = failed = 0
+        try:
+            for i in range(0, len(unique_ids), EXISTENCE_CHECK_CHUNK):
+                chunk = unique_ids[i:i + EXISTENCE_CHECK_CHUNK]
+                where = any_of([
+                    field_filter("id", "Equal", weaviate_id) for weaviate_id in chunk
+                ])
+                response = self.breaker.call(
+                    self.client.batch.delete_objects,
+                    class_name=DOC_CLASS_NAME,
+                    where=where,
+                    output="minimal",
+                    tenant=tenant,
+                )
+                results = response.get("results", {})
+                deleted += results.get("successful", 0)
+                failed += results.get("failed", 0)
+        except Exception as e:
+            logger.error(f"Failed to delete documents from Weaviate: {str(e)}")
+            raise
+        finally:
+            self._invalidate_search_cache()
+        
+        if failed:
+            raise RuntimeError(
+                f"Failed to delete {failed} of {len(unique_ids)} documents"
+            )
+        
+        logger.info(f"Deleted {deleted} documents from Weaviate")
+        return deleted
+    
+    @staticmethod
+    def _delete_filter(
+        source: Optional[str] = None,
+        version: Optional[str] = None,
+        url_prefix: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the where filter selecting documents for a bulk delete.
+        
+        Args:
+            source: Delete documents from this source
+            version: Delete documents of this version
+            url_prefix: Delete documents whose URL starts with this prefix
+        
+        Returns:
+            Dict[str, Any]: Where filter matching all given criteria
+        
+        Raises:
+            ValueError: If no criterion is given or the URL prefix contains a
+                wildcard, which Like filters cannot escape
+        """
+        if url_prefix and any(wildcard in url_prefix for wildcard in "*?"):
+            raise ValueError("URL prefix must not contain the wildcards * or ?")
+        
+        operands = []
+        if source:
+            operands.append(field_filter("source", "Equal", source))
+        if version:
+            operands.append(field_filter("version", "Equal", version))
+        if url_prefix:
+            operands.append(field_filter("url", "Like", f"{url_prefix}*"))
+        
+        if not operands:
+            raise ValueError("Bulk delete requires a source, version or URL prefix")
+        if len(operands) == 1:
+            return operands[0]
+        
+        return {"operator": "And", "operands": operands}
+    
+    def _count(self, where: Optional[Dict[str, Any]], tenant: Optional[str] = None) -> int:
+        """
+        Count the objects matching a where filter.
+        
+        Args:
+            where: Where filter, or None to count all objects
+            tenant: Tenant to count in, if the class is partitioned
+        
+        Returns:
+            int: Number of matching objects
+        
+        Raises:
+            CircuitOpenError: If Weaviate is unavailable
+            RuntimeError: If Weaviate reports errors for the query
+        """
+        query_builder = self.client.query.aggregate(DOC_CLASS_NAME).with_meta_count()
+        if where is not None:
+            query_builder = query_builder.with_where(where)
+        if tenant is not None:
+            query_builder = query_builder.with_tenant(tenant)
+        
+        response = self.breaker.call(query_builder.do)
+        if "errors" in response:
+            raise RuntimeError(f"Count failed: {response['errors']}")
+        
+        aggregate = response["data"]["Aggregate"][DOC_CLASS_NAME]
+        return aggregate[0]["meta"]["count"] if aggregate else 0
+    
+    def _drop_tenant(self, tenant: str, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Delete a source by dropping its tenant.
+        
+        Inactive tenants cannot be queried, so when one is dropped its object
+        counts are reported as None.
+        
+        Args:
+            tenant: Tenant name
+            dry_run: Whether to count the tenant's objects without deleting them
+        
+        Returns:
+            Dict[str, Any]: ``matched``, ``deleted`` and ``failed`` object
+                counts, ``dry_run``, and the ``dropped_tenant``
+        
+        Raises:
+            ValueError: If the class is not partitioned by source
+        """
+        if self.tenants is None:
+            raise ValueError("Documentation is not partitioned by source")
+        
+        self.tenants.refresh([tenant])
+        if not self.tenants.exists(tenant):
+            return {"matched": 0, "deleted": 0, "failed": 0, "dry_run": dry_run}
+        
+        matched = self._count(None, tenant) if self.tenants.active([tenant]) else None
+        if dry_run:
+            return {
+                "matched": matched,
+                "deleted": 0,
+                "failed": 0,
+                "dry_run": True,
+                "dropped_tenant": tenant,
+            }
+        
+        try:
+            self.tenants.remove(tenant)
+        finally:
+            self._invalidate_search_cache()
+        
+        return {
+            "matched": matched,
+            "deleted": matched,
+            "failed": 0,
+            "dry_run": False,
+            "dropped_tenant": tenant,
+        }
+    
+    def list_sources(self) -> List[Dict[str, Any]]:
+        """
+        List the tenants of a partitioned class.
+        
+        Returns:
+            List[Dict[str, Any]]: Tenant ``name`` and ``active`` flag
+        
+        Raises:
+            ValueError: If the class is not partitioned by source
+        """
+        if self.tenants is None:
+            raise ValueError("Documentation is not partitioned by source")
+        
+        self.tenants.reload()
+        return self.tenants.describe()
+    
+    def set_source_active(self, source: str, active: bool) -> None:
+        """
+        Load a source's tenant, or offload it from memory to archive it.
+        
+        Inactive sources are skipped by searches until they are loaded again.
+        
+        Args:
+            source: Documentation source
+            active: Whether the source should be searchable
+        
+        Raises:
+            ValueError: If the class is not partitioned by source
+            KeyError: If the source has no tenant
+        """
+        if self.tenants is None:
+            raise ValueError("Documentation is not partitioned by source")
+        
+        name = tenant_name(source)
+        self.tenants.refresh([name])
+        try:
+            self.tenants.set_active(name, active)
+        finally:
+            self._invalidate_search_cache()
+    
+    def delete_where(
+        self,
+        source: Optional[str] = None,
+        version: Optional[str] = None,
+        url_prefix: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Delete every document matching the given metadata with batch deletes.
+        
+        Weaviate deletes at most its query limit per request, so requests are
+        repeated until no matching objects remain. Objects that fail to delete
+        match again on the next request, so matches are counted once up front
+        and every match not deleted is reported as failed. A dry run only
+        counts the matching objects. When the class is partitioned, deleting a
+        whole source drops its tenant instead, and inactive tenants, which
+        cannot be queried, are skipped and reported as ``skipped_tenants``.
+        
+        Args:
+            source: Delete documents from this source
+            version: Delete documents of this version
+            url_prefix: Delete documents whose URL starts with this prefix
+            dry_run: Whether to count matching documents without deleting them
+        
+        Returns:
+            Dict[str, Any]: ``matched``, ``deleted`` and ``failed`` object
+                counts, ``dry_run``, and on a partitioned class the
+                ``dropped_tenant`` or the ``skipped_tenants``
+        
+        Raises:
+            ValueError: If no criterion is given or the URL prefix contains a
+                wildcard
+            CircuitOpenError: If Weaviate is unavailable
+            RuntimeError: If Weaviate reports errors for a count query
+        """
+        where = self._delete_filter(source, version, url_prefix)
+        
+        tenants: List[Optional[str]] = [None]
+        skipped: Dict[str, Any] = {}
+        if self.tenants is not None:
+            if source and not version and not url_prefix:
+                return self._drop_tenant(tenant_name(source), dry_run)
+            selected = [tenant_name(source)] if source else None
+            if selected is not None:
+                self.tenants.refresh(selected)
+            tenants = list(self.tenants.active(selected))
+            skipped["skipped_tenants"] = self.tenants.inactive(selected)
+            if skipped["skipped_tenants"]:
+                logger.warning(
+                    f"Bulk delete skips inactive tenants {skipped['skipped_tenants']}; "
+                    f"activate them to delete their documents"
+                )
+        
+        if dry_run:
+            matched = sum(self._count(where, tenant) for tenant in tenants)
+            return {
+                "matched": matched, "deleted": 0, "failed": 0, "dry_run": True, **skipped
+            }
+        
+        matched = deleted = 0
+        try:
+            for tenant in tenants:
+                matched += self._count(where, tenant)
+                while True:
+                    response = self.breaker.call(
+                        self.client.batch.delete_objects,
+                        class_name=DOC_CLASS_NAME,
+                        where=where,
+                        output="minimal",
+                        tenant=tenant,
+                    )
+                    results = response.get("results", {})
+                    deleted += results.get("successful", 0)
+                
+                    # A full page may mean more matches remain; stop if nothing was deleted
+                    if results.get("matches", 0) < results.get("limit", 0):
+                        break
+                    if not results.get("successful"):
+                        break
+        except Exception as e:
+            logger.error(f"Failed to bulk delete documents from Weaviate: {str(e)}")
+            raise
+        finally:
+            self._invalidate_search_cache()
+        
+        failed = max(0, matched - deleted)
+        logger.info(
+            f"Deleted {deleted} of {matched} documents from Weaviate "
+            f"(source={source}, version={version}, url_prefix={url_prefix})"
+        )
+        
+        return {
+            "matched": matched,
+            "deleted": deleted,
+            "failed": failed,
+            "dry_run": False,
+            **skipped,
+        }
+    
     def batch_add_documents(
         self, documents: List[Dict[str, Any]]
-    ) -> List[Tuple[str, str]]:
+    ) -> List[Dict[str, Any]]:
         """
         Add multiple documents to Weaviate in a batch.
         
+        Objects are sent by the client's dynamic batcher: several workers send
+        batches concurrently, the batch size follows the observed vectorizer
+        throughput, and objects Weaviate rejects are retried. Documents that
+        are already stored are skipped and reported as successful.
+        
         Args:
             documents: List of document objects with content and metadata
             
         Returns:
-            List[Tuple[str, str]]: List of document IDs and Weaviate IDs
+            List[Dict[str, Any]]: One result per document, in input order, with
+                ``doc_id``, ``vector_id``, ``success`` and ``error``
         """
-        results = []
+        prepared = []
+        for doc in documents:
+            content = doc["content"]
+            metadata = doc.get("metadata", {})
+            prepared.append((content, metadata, self._object_id(content, metadata)))
+        
+        # Error per Weaviate ID; None once Weaviate reported the object stored
+        outcomes: Dict[str, Optional[str]] = {}
         
+        def record_results(response: Optional[List[Dict[str, Any]]]) -> None:
+            """Record per-object outcomes reported by Weaviate."""
+            for item in response or []:
+                errors = item.get("result", {}).get("errors", {}).get("error")
+                outcomes[item["id"]] = (
+                    "; ".join(error.get("message", "") for error in errors)
+                    if errors else None
+                )
+        
+        # Tenant per Weaviate ID; None when the class is not partitioned
+        tenants = {
+            weaviate_id: self._tenant(metadata.get("source"))
+            for _, metadata, weaviate_id in prepared
+        }
+        
+        batch_error = None
         try:
-            # Create a batch process
-            with self.client.batch as batch:
-                # Configure batch
-                batch.batch_size = 100
+            if self.tenants is not None:
+                self.tenants.ensure(
+                    {tenant for tenant in tenants.values() if tenant is not None}
+                )
+            
+            # One query per tenant tells us which objects are already stored
+            existing: Set[str] = set()
+            for tenant in set(tenants.values()):
+                existing |= self.existing_ids(
+                    [weaviate_id for weaviate_id, t in tenants.items() if t == tenant],
+                    tenant,
+                )
+            for weaviate_id in existing:
+                outcomes[weaviate_id] = None
                 
-                # Add each document to the batch
-                for doc in documents:
-                    content = doc["content"]
-                    metadata = doc.get("metadata", {})
-                    
-                    doc_id = str(uuid.uuid4())
-                    weaviate_id = generate_uuid5(content)
-                    
-                    doc_obj = {
-                        "content": content,
-                        "title": metadata.get("title", "Untitled Document"),
-                        "url": metadata.get("url", ""),
-                        "source": metadata.get("source", ""),
-                        "version": metadata.get("version", "latest"),
-                    }
-                    
+            # Skip stored objects and duplicates within the same batch
+            pending = []
+            for content, metadata, weaviate_id in prepared:
+                if weaviate_id not in existing:
+                    pending.append((content, metadata, weaviate_id))
+                    existing.add(weaviate_id)
+            
+            # Client-side embedders vectorize the whole batch in large model calls
+            vectors = None
+            if self.embedder is not None and pending:
+                vectors = self.embedder.embed([content for content, _, _ in pending])
+            
+            with self._batch_lock, self.client.batch(
+                batch_size=self.settings.weaviate_batch_size,
+                dynamic=True,
+                creation_time=self.settings.weaviate_batch_creation_time,
+                num_workers=self.settings.weaviate_batch_workers,
+                weaviate_error_retries=WeaviateErrorRetryConf(
+                    number_retries=self.settings.weaviate_batch_retries
+                ),
+                callback=record_results,
+            ) as batch:
+                for i, (content, metadata, weaviate_id) in enumerate(pending):
                     batch.add_data_object(
-                        data_object=doc_obj,
+                        data_object=self._build_object(content, metadata),
                         class_name=DOC_CLASS_NAME,
                         uuid=weaviate_id,
+                        vector=vectors[i].tolist() if vectors is not None else None,
+                        tenant=tenants[weaviate_id],
                     )
-                    
-                    results.append((doc_id, weaviate_id))
-            
-            logger.info(f"Added {len(documents)} documents to Weaviate in batch")
-            
-            return results
         except Exception as e:
             logger.error(f"Failed to add documents to Weaviate in batch: {str(e)}")
-            raise
\ No newline at end of file
+            batch_error = str(e)
+        finally:
+            # Part of the batch may have been written even if it failed
+            self._invalidate_search_cache()
+        
+        results = []
+        for _, _, weaviate_id in prepared:
+            if weaviate_id in outcomes:
+                error = outcomes[weaviate_id]
+            else:
+                # No batch response covered this object
+                error = batch_error or "No result reported by Weaviate"
+            
+            results.append({
+                "doc_id": str(uuid.uuid4()),
+                "vector_id": weaviate_id,
+                "success": error is None,
+                "error": error,
+            })
+        
+        failed = sum(1 for result in results if not result["success"])
+        logger.info(
+            f"Added {len(results) - failed} of {len(documents)} documents "
+            f"to Weaviate in batch"
+        )
+        
+        return results
\ No newline at end of file
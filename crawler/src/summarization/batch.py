@@ -0,0 +1,298 @@
+"""
+Batch summarization of many independent document sets.
+
+All batches share one SummarizationService (and therefore one RAPTORProcessor
+and HTTP client) and are drained by a fixed pool of workers. LLM calls run as
+bulk work on the shared LLM scheduler, so throughput is bounded by the LLM
+quota rather than per-request overhead.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src.summarization.raptor import RAPTORProcessor
+from src.summarization.scheduler import PRIORITY_BULK
+from src.summarization.service import SummarizationService
+from src.utils.config import Settings
+from src.utils.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryBatch:
+    """
+    State of one batch of summary requests.
+    
+    Attributes:
+        batch_id: Unique identifier for the batch
+        requests: Summary request parameters per item
+        items: Status records per item, in request order
+        created_at: Creation timestamp
+        finished_at: Completion timestamp, once every item has finished
+    """
+    
+    def __init__(self, batch_id: str, requests: List[Dict[str, Any]]):
+        """
+        Initialize a batch.
+        
+        Args:
+            batch_id: Unique identifier for the batch
+            requests: Summary request parameters per item
+        """
+        self.batch_id = batch_id
+        self.requests = requests
+        self.items = [
+            {"index": i, "status": "pending", "summary_id": None, "error": None}
+            for i in range(len(requests))
+        ]
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        # Indexes of finished items in completion order, for streaming
+        self._finished: List[int] = []
+        self._changed = asyncio.Condition()
+    
+    @property
+    def completed(self) -> int:
+        """
+        Number of items that finished successfully.
+        """
+        return sum(1 for item in self.items if item["status"] == "completed")
+    
+    @property
+    def failed(self) -> int:
+        """
+        Number of items that failed.
+        """
+        return sum(1 for item in self.items if item["status"] == "failed")
+    
+    @property
+    def status(self) -> str:
+        """
+        Overall batch status (pending, running or completed).
+        """
+        if self.finished_at is not None:
+            return "completed"
+        if all(item["status"] == "pending" for item in self.items):
+            return "pending"
+        return "running"
+    
+    async def update_item(self, index: int, **updates: Any) -> None:
+        """
+        Update an item and wake up stream consumers.
+        
+        Args:
+            index: Item index
+            **updates: Fields to update on the item record
+        """
+        async with self._changed:
+            self.items[index].update(updates)
+            
+            if updates.get("status") in ("completed", "failed"):
+                self._finished.append(index)
+                if len(self._finished) == len(self.items):
+                    self.finished_at = time.time()
+            
+            self._changed.notify_all()
+    
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield each item record as it finishes, in completion order.
+        
+        Items that finished before streaming started are yielded first.
+        
+        Yields:
+            Dict[str, Any]: Finished item record
+        """
+        sent = 0
+        
+        while sent < len(self.items):
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self._finished) > sent)
+                ready = self._finished[sent:]
+            
+            for index in ready:
+                yield dict(self.items[index])
+            sent += len(ready)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the batch status.
+        
+        Returns:
+            Dict[str, Any]: Batch status and item records
+        """
+        return {
+            "batch_id": self.batch_id,
+            "status": self.status,
+            "total": len(self.items),
+            "completed": self.completed,
+            "failed": self.failed,
+            "items": [dict(item) for item in self.items],
+        }
+
+
+class SummaryBatchManager:
+    """
+    Schedules summary batches on a shared summarization service.
+    
+    Attributes:
+        settings: Application settings
+        service: Shared summarization service
+        metrics: Metrics registry
+    """
+    
+    def __init__(
+        self,
+        settings: Settings,
+        service: Optional[SummarizationService] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize the batch manager.
+        
+        Args:
+            settings: Application settings
+            service: Optional shared summarization service
+            metrics: Optional metrics registry
+        """
+        self.settings = settings
+        self.service = service or SummarizationService(
+            settings,
+            raptor=RAPTORProcessor(settings, priority=PRIORITY_BULK),
+        )
+        self.metrics = metrics or get_metrics()
+        self._batches: Dict[str, SummaryBatch] = {}
+        self._queue: "asyncio.Queue[Tuple[SummaryBatch, int]]" = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        
+        self.metrics.register_provider("summary_batches", self.stats)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report queue and batch statistics.
+        
+        Returns:
+            Dict[str, Any]: Queue depth, worker count and active batches
+        """
+        return {
+            "queued_items": self._queue.qsize(),
+            "workers": len(self._workers),
+            "active_batches": sum(
+                1 for batch in self._batches.values() if batch.finished_at is None
+            ),
+        }
+    
+    def start(self) -> None:
+        """
+        Start the worker pool.
+        """
+        if self._workers:
+            return
+        
+        for _ in range(self.settings.summary_batch_concurrency):
+            self._workers.append(asyncio.create_task(self._worker()))
+        logger.info(f"Started {len(self._workers)} summary batch workers")
+    
+    async def stop(self) -> None:
+        """
+        Stop the worker pool and release the shared HTTP client.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        
+        await self.service.raptor.aclose()
+        logger.info("Stopped summary batch workers")
+    
+    def submit(self, requests: List[Dict[str, Any]]) -> SummaryBatch:
+        """
+        Submit a batch of summary requests.
+        
+        Args:
+            requests: Summary request parameters per item (documents,
+                max_tokens, hierarchy_levels, force)
+        
+        Returns:
+            SummaryBatch: The queued batch
+        
+        Raises:
+            ValueError: If the batch is empty or too large
+        """
+        if not requests:
+            raise ValueError("Batch must contain at least one document set")
+        if len(requests) > self.settings.summary_batch_max_items:
+            raise ValueError(
+                f"Batch exceeds the maximum of "
+                f"{self.settings.summary_batch_max_items} document sets"
+            )
+        
+        self._prune()
+        
+        batch = SummaryBatch(str(uuid.uuid4()), requests)
+        self._batches[batch.batch_id] = batch
+        
+        for index in range(len(requests)):
+            self._queue.put_nowait((batch, index))
+        
+        self.metrics.increment("summary_batches_submitted")
+        logger.info(f"Queued summary batch {batch.batch_id} with {len(requests)} items")
+        
+        return batch
+    
+    def get(self, batch_id: str) -> SummaryBatch:
+        """
+        Get a batch by ID.
+        
+        Args:
+            batch_id: Unique identifier for the batch
+        
+        Returns:
+            SummaryBatch: The batch
+        
+        Raises:
+            KeyError: If the batch is not found
+        """
+        if batch_id not in self._batches:
+            raise KeyError(f"Summary batch {batch_id} not found")
+        
+        return self._batches[batch_id]
+    
+    def _prune(self) -> None:
+        """
+        Forget finished batches older than the configured TTL.
+        """
+        cutoff = time.time() - self.settings.summary_batch_ttl_seconds
+        expired = [
+            batch_id for batch_id, batch in self._batches.items()
+            if batch.finished_at is not None and batch.finished_at < cutoff
+        ]
+        for batch_id in expired:
+            del self._batches[batch_id]
+    
+    async def _worker(self) -> None:
+        """
+        Process queued batch items until cancelled.
+        """
+        while True:
+            batch, index = await self._queue.get()
+            try:
+                await batch.update_item(index, status="running")
+                summary_id, _, _ = await self.service.generate_summary(
+                    **batch.requests[index]
+                )
+                await batch.update_item(index, status="completed", summary_id=summary_id)
+                self.metrics.increment("summary_batch_items", labels={"status": "completed"})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Summary batch {batch.batch_id} item {index} failed: {str(e)}"
+                )
+                await batch.update_item(index, status="failed", error=str(e))
+                self.metrics.increment("summary_batch_items", labels={"status": "failed"})
+            finally:
+                self._queue.task_done()
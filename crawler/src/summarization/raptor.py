@@ -5,17 +5,83 @@ This module provides the core RAPTOR processing logic for generating hierarchica
 summaries of documentation content.
 """
 
+import hashlib
 import json
 import logging
-import uuid
+import re
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+from src.summarization.scheduler import (
+    PRIORITY_INTERACTIVE,
+    LLMScheduler,
+    get_llm_scheduler,
+)
 from src.utils.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Bump when prompts or models change so old summaries are not reused
+SUMMARY_KEY_VERSION = 1
+
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+
+
+def normalize_document(document: str) -> str:
+    """
+    Normalize a document for content addressing.
+    
+    Line endings are unified, trailing whitespace is removed from each line and
+    runs of blank lines are collapsed, so cosmetic differences do not produce a
+    different summary ID.
+    
+    Args:
+        document: Document content
+        
+    Returns:
+        str: Normalized document content
+    """
+    text = document.replace("\r\n", "\n").replace("\r", "\n")
+    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def compute_summary_id(
+    documents: List[str], max_tokens: int = 1000, hierarchy_levels: int = 3
+) -> str:
+    """
+    Compute a deterministic summary ID for a set of documents.
+    
+    The ID is a SHA-256 hash of the normalized documents and the generation
+    parameters, so identical requests map to the same stored summary.
+    
+    Args:
+        documents: List of document contents
+        max_tokens: Maximum tokens for the summary
+        hierarchy_levels: Number of hierarchy levels
+        
+    Returns:
+        str: Hex-encoded summary ID
+    """
+    digest = hashlib.sha256()
+    params = {
+        "version": SUMMARY_KEY_VERSION,
+        "max_tokens": max_tokens,
+        "hierarchy_levels": hierarchy_levels,
+    }
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    
+    for document in documents:
+        normalized = normalize_document(document).encode("utf-8")
+        # Length-prefix each document so boundaries are part of the key
+        digest.update(len(normalized).to_bytes(8, "big"))
+        digest.update(normalized)
+    
+    return digest.hexdigest()
+
 
 class RAPTORProcessor:
     """
@@ -24,17 +90,28 @@ class RAPTORProcessor:
     Attributes:
         settings: Application settings
         openai_api_key: OpenAI API key
+        scheduler: Shared scheduler every LLM call goes through
+        priority: Priority class of this processor's LLM calls
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        scheduler: Optional[LLMScheduler] = None,
+        priority: str = PRIORITY_INTERACTIVE,
+    ):
         """
         Initialize the RAPTOR processor.
         
         Args:
             settings: Application settings
+            scheduler: Optional LLM scheduler (defaults to the process-wide one)
+            priority: Priority class of this processor's LLM calls
         """
         self.settings = settings
         self.openai_api_key = settings.openai_api_key
+        self.scheduler = scheduler or get_llm_scheduler()
+        self.priority = priority
         self.client = httpx.AsyncClient(
             timeout=120.0,
             headers={
@@ -43,8 +120,31 @@ class RAPTORProcessor:
             },
         )
     
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client.
+        """
+        await self.client.aclose()
+    
+    async def _post_chat_completion(self, payload: Dict[str, Any]) -> httpx.Response:
+        """
+        Send a chat completion request through the shared LLM scheduler.
+        
+        Args:
+            payload: Chat completion request body
+            
+        Returns:
+            httpx.Response: OpenAI API response
+        """
+        async with self.scheduler.slot(self.priority):
+            return await self.client.post(OPENAI_CHAT_COMPLETIONS_URL, json=payload)
+    
     async def generate_summary(
-        self, documents: List[str], max_tokens: int = 1000, hierarchy_levels: int = 3
+        self,
+        documents: List[str],
+        max_tokens: int = 1000,
+        hierarchy_levels: int = 3,
+        summary_id: Optional[str] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Generate a hierarchical summary using RAPTOR.
@@ -53,13 +153,17 @@ class RAPTORProcessor:
             documents: List of document contents
             max_tokens: Maximum tokens for the summary
             hierarchy_levels: Number of hierarchy levels
+            summary_id: Optional precomputed summary ID
             
         Returns:
             Tuple[str, Dict[str, Any]]: Summary ID and summary data
         """
         try:
-            # Generate a unique ID for this summary
-            summary_id = str(uuid.uuid4())
+            # Content-addressed ID so identical requests share one summary
+            if summary_id is None:
+                summary_id = compute_summary_id(
+                    documents, max_tokens=max_tokens, hierarchy_levels=hierarchy_levels
+                )
             
             # Combine documents for initial processing
             combined_text = "\n\n".join(documents)
@@ -92,6 +196,9 @@ class RAPTORProcessor:
                 "summary": top_summary,
                 "hierarchical_summary": hierarchical_summary,
                 "document_count": len(documents),
+                "max_tokens": max_tokens,
+                "hierarchy_levels": hierarchy_levels,
+                "created_at": datetime.now(timezone.utc).isoformat(),
             }
             
             logger.info(f"Generated RAPTOR summary with ID: {summary_id}")
@@ -137,9 +244,8 @@ Detailed summary:"""
         
         try:
             # Call OpenAI API
-            response = await self.client.post(
-                "https://api.openai.com/v1/chat/completions",
-                json={
+            response = await self._post_chat_completion(
+                {
                     "model": "gpt-4o",
                     "messages": [
                         {"role": "system", "content": "You are a technical documentation assistant specializing in creating clear, accurate, and comprehensive summaries of technical documentation."},
@@ -147,7 +253,7 @@ Detailed summary:"""
                     ],
                     "max_tokens": max_tokens,
                     "temperature": 0.3,
-                },
+                }
             )
             response.raise_for_status()
             
@@ -181,9 +287,8 @@ Topics (JSON array only):"""
         
         try:
             # Call OpenAI API
-            response = await self.client.post(
-                "https://api.openai.com/v1/chat/completions",
-                json={
+            response = await self._post_chat_completion(
+                {
                     "model": "gpt-4o-mini",
                     "messages": [
                         {"role": "system", "content": "You are a technical documentation assistant specializing in identifying and organizing key topics in technical documentation."},
@@ -191,7 +296,7 @@ Topics (JSON array only):"""
                     ],
                     "max_tokens": 400,
                     "temperature": 0.2,
-                },
+                }
             )
             response.raise_for_status()
             
@@ -250,9 +355,8 @@ Content about "{topic}":"""
         
         try:
             # Call OpenAI API
-            response = await self.client.post(
-                "https://api.openai.com/v1/chat/completions",
-                json={
+            response = await self._post_chat_completion(
+                {
                     "model": "gpt-4o",
                     "messages": [
                         {"role": "system", "content": "You are a technical documentation assistant specializing in extracting and organizing relevant information on specific topics from technical documentation."},
@@ -260,7 +364,7 @@ Content about "{topic}":"""
                     ],
                     "max_tokens": 1500,
                     "temperature": 0.2,
-                },
+                }
             )
             response.raise_for_status()
             
@@ -0,0 +1,258 @@
+"""
+Retention and compaction of stored RAPTOR summaries.
+
+Summaries are expired by age, count and total size, always evicting the least
+recently accessed ones first, and are either deleted or archived as gzip files.
+Each pass also moves summaries written before sharding into their hashed
+subdirectories.
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+import shutil
+import time
+from typing import Any, Dict, List, Optional
+
+from src.summarization import service as summary_store
+from src.summarization.service import (
+    get_summary_path,
+    iter_summary_files,
+    load_aliases,
+    save_aliases,
+)
+from src.utils.config import Settings
+from src.utils.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+RETENTION_ACTIONS = ("delete", "archive")
+
+
+class SummaryRetentionManager:
+    """
+    Applies retention policies to the summary store.
+    
+    Attributes:
+        settings: Application settings
+        summaries_dir: Directory holding the summaries
+        archive_dir: Directory receiving archived summaries
+        metrics: Metrics registry for reporting activity
+    """
+    
+    def __init__(
+        self,
+        settings: Settings,
+        summaries_dir: Optional[str] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize the retention manager.
+        
+        Args:
+            settings: Application settings
+            summaries_dir: Optional summaries directory (defaults to SUMMARIES_DIR)
+            metrics: Optional metrics registry
+        
+        Raises:
+            ValueError: If the configured retention action is unknown
+        """
+        if settings.summary_retention_action not in RETENTION_ACTIONS:
+            raise ValueError(
+                f"Unknown summary retention action: {settings.summary_retention_action}"
+            )
+        
+        self.settings = settings
+        self.summaries_dir = summaries_dir or summary_store.SUMMARIES_DIR
+        self.archive_dir = settings.summary_archive_dir
+        self.metrics = metrics or get_metrics()
+        self._task: Optional[asyncio.Task] = None
+    
+    def compact(self) -> int:
+        """
+        Move summaries stored directly in the base directory into their shards.
+        
+        Returns:
+            int: Number of summaries moved
+        """
+        moved = 0
+        if not os.path.isdir(self.summaries_dir):
+            return moved
+        
+        with os.scandir(self.summaries_dir) as entries:
+            flat_files = [
+                entry for entry in entries
+                if entry.is_file()
+                and entry.name.endswith(".json")
+                and not entry.name.startswith("_")
+            ]
+        
+        for entry in flat_files:
+            summary_id = entry.name[: -len(".json")]
+            target = get_summary_path(summary_id, self.summaries_dir)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # os.replace keeps atime/mtime, so access history survives the move
+            os.replace(entry.path, target)
+            moved += 1
+        
+        if moved:
+            logger.info(f"Moved {moved} summaries into sharded directories")
+        
+        return moved
+    
+    def select_expired(
+        self, entries: List[Dict[str, Any]], now: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Select the summaries that violate a retention policy.
+        
+        Args:
+            entries: Summary entries with ``last_access`` and ``size``
+            now: Current timestamp
+        
+        Returns:
+            List[Dict[str, Any]]: Entries to expire, least recently accessed first
+        """
+        # Least recently accessed first
+        ordered = sorted(entries, key=lambda e: e["last_access"])
+        expired = 0
+        
+        max_age_days = self.settings.summary_max_age_days
+        if max_age_days is not None:
+            cutoff = now - max_age_days * 86400
+            while expired < len(ordered) and ordered[expired]["last_access"] < cutoff:
+                expired += 1
+        
+        max_count = self.settings.summary_max_count
+        if max_count is not None:
+            expired = max(expired, len(ordered) - max_count)
+        
+        max_total_mb = self.settings.summary_max_total_mb
+        if max_total_mb is not None:
+            max_bytes = max_total_mb * 1024 * 1024
+            total = sum(e["size"] for e in ordered[expired:])
+            while expired < len(ordered) and total > max_bytes:
+                total -= ordered[expired]["size"]
+                expired += 1
+        
+        return ordered[:expired]
+    
+    def _expire(self, entry: Dict[str, Any]) -> None:
+        """
+        Delete or archive a single summary.
+        
+        Args:
+            entry: Summary entry to expire
+        """
+        if self.settings.summary_retention_action == "archive":
+            relative = os.path.relpath(entry["path"], self.summaries_dir)
+            archive_path = os.path.join(self.archive_dir, f"{relative}.gz")
+            os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+            
+            with open(entry["path"], "rb") as src, gzip.open(archive_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        
+        os.remove(entry["path"])
+    
+    def run_once(self) -> Dict[str, int]:
+        """
+        Run one compaction and retention pass.
+        
+        Returns:
+            Dict[str, int]: Counts of moved, expired and remaining summaries
+        """
+        started = time.monotonic()
+        moved = self.compact()
+        
+        entries = []
+        for summary_file in iter_summary_files(self.summaries_dir):
+            try:
+                stat = summary_file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append({
+                "id": summary_file.name[: -len(".json")],
+                "path": summary_file.path,
+                "size": stat.st_size,
+                "last_access": max(stat.st_atime, stat.st_mtime),
+            })
+        
+        expired_ids = set()
+        for entry in self.select_expired(entries, now=time.time()):
+            try:
+                self._expire(entry)
+                expired_ids.add(entry["id"])
+            except OSError as e:
+                logger.warning(f"Failed to expire summary {entry['id']}: {str(e)}")
+        
+        if expired_ids:
+            aliases = load_aliases(self.summaries_dir)
+            remaining = {k: v for k, v in aliases.items() if v not in expired_ids}
+            if len(remaining) != len(aliases):
+                save_aliases(remaining, self.summaries_dir)
+        
+        remaining_entries = [e for e in entries if e["id"] not in expired_ids]
+        action = self.settings.summary_retention_action
+        
+        self.metrics.increment("summary_retention_runs")
+        self.metrics.increment("summary_retention_sharded", moved)
+        self.metrics.increment(f"summary_retention_{action}d", len(expired_ids))
+        self.metrics.set_gauge("summary_store_count", len(remaining_entries))
+        self.metrics.set_gauge(
+            "summary_store_bytes", sum(e["size"] for e in remaining_entries)
+        )
+        self.metrics.set_gauge(
+            "summary_retention_last_run_seconds", time.monotonic() - started
+        )
+        self.metrics.set_gauge("summary_retention_last_run_timestamp", time.time())
+        
+        if expired_ids:
+            logger.info(f"Summary retention {action}d {len(expired_ids)} summaries")
+        
+        return {
+            "sharded": moved,
+            "expired": len(expired_ids),
+            "remaining": len(remaining_entries),
+        }
+    
+    async def _run_forever(self) -> None:
+        """
+        Run retention passes at the configured interval until cancelled.
+        """
+        interval = self.settings.summary_retention_interval_seconds
+        
+        while True:
+            try:
+                # Filesystem work runs in a thread so it never blocks requests
+                await asyncio.to_thread(self.run_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.increment("summary_retention_errors")
+                logger.error(f"Summary retention pass failed: {str(e)}")
+            
+            await asyncio.sleep(interval)
+    
+    def start(self) -> None:
+        """
+        Start the background retention task.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+            logger.info("Started summary retention task")
+    
+    async def stop(self) -> None:
+        """
+        Stop the background retention task.
+        """
+        if self._task is None:
+            return
+        
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Stopped summary retention task")
@@ -0,0 +1,280 @@
+"""
+Shared scheduler for LLM calls with priority classes.
+
+Interactive and bulk summarization share one OpenAI quota. The scheduler
+bounds the number of concurrent LLM calls, enforces the request rate limit and
+hands free slots to waiting classes by weighted fair queuing, so interactive
+requests are served next while bulk work fills the remaining capacity.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+from src.utils.config import Settings, get_settings
+from src.utils.metrics import MetricsRegistry, get_metrics
+from src.utils.rate_limit import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+
+
+class _PriorityClass:
+    """
+    Queue and statistics of one priority class.
+    
+    Attributes:
+        name: Class name
+        weight: Share of capacity relative to other classes
+        waiters: Pending acquisitions with their enqueue time
+        virtual_finish: Virtual finish tag of the last dispatched request
+        running: Number of granted slots currently held
+        dispatched: Total number of granted slots
+        total_wait: Total seconds spent waiting for a slot
+        max_wait: Longest wait for a slot in seconds
+    """
+    
+    def __init__(self, name: str, weight: float):
+        """
+        Initialize a priority class.
+        
+        Args:
+            name: Class name
+            weight: Share of capacity relative to other classes
+        """
+        self.name = name
+        self.weight = weight
+        self.waiters: Deque[Tuple["asyncio.Future[None]", float]] = deque()
+        self.virtual_finish = 0.0
+        self.running = 0
+        self.dispatched = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class LLMScheduler:
+    """
+    Weighted fair scheduler for LLM calls.
+    
+    Each granted slot advances its class's virtual finish tag by ``1 / weight``
+    and the waiting class with the smallest tag is served next, so classes
+    share capacity in proportion to their weights. Bulk work may never occupy
+    the slots reserved for interactive requests.
+    
+    Attributes:
+        capacity: Maximum number of concurrent LLM calls
+        reserved_interactive: Slots bulk work may not use
+        rate_limiter: Limiter for the LLM request rate
+        metrics: Metrics registry
+    """
+    
+    def __init__(self, settings: Settings, metrics: Optional[MetricsRegistry] = None):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            settings: Application settings
+            metrics: Optional metrics registry
+        """
+        self.capacity = max(1, settings.llm_max_concurrency)
+        self.reserved_interactive = min(
+            settings.llm_interactive_reserved_slots, self.capacity - 1
+        )
+        self.rate_limiter = AsyncRateLimiter(settings.llm_requests_per_minute)
+        self.metrics = metrics or get_metrics()
+        self._classes = {
+            PRIORITY_INTERACTIVE: _PriorityClass(
+                PRIORITY_INTERACTIVE, settings.llm_interactive_weight
+            ),
+            PRIORITY_BULK: _PriorityClass(PRIORITY_BULK, settings.llm_bulk_weight),
+        }
+        self._running = 0
+        self._virtual_time = 0.0
+        self._retry_handle: Optional[asyncio.TimerHandle] = None
+        
+        self.metrics.register_provider("llm_scheduler", self.stats)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report queue depth and wait times per priority class.
+        
+        Returns:
+            Dict[str, Any]: Scheduler statistics
+        """
+        return {
+            "capacity": self.capacity,
+            "running": self._running,
+            "classes": {
+                name: {
+                    "queued": len(cls.waiters),
+                    "running": cls.running,
+                    "dispatched": cls.dispatched,
+                    "avg_wait_seconds": (
+                        cls.total_wait / cls.dispatched if cls.dispatched else 0.0
+                    ),
+                    "max_wait_seconds": cls.max_wait,
+                }
+                for name, cls in self._classes.items()
+            },
+        }
+    
+    def _get_class(self, priority: str) -> _PriorityClass:
+        """
+        Look up a priority class.
+        
+        Args:
+            priority: Priority class name
+        
+        Returns:
+            _PriorityClass: Priority class
+        
+        Raises:
+            ValueError: If the priority class is unknown
+        """
+        if priority not in self._classes:
+            raise ValueError(f"Unknown LLM priority class: {priority}")
+        
+        return self._classes[priority]
+    
+    def _eligible(self, cls: _PriorityClass) -> bool:
+        """
+        Check whether a class may be granted the next free slot.
+        
+        Args:
+            cls: Priority class
+        
+        Returns:
+            bool: True if the class has waiters and may use a free slot
+        """
+        if not cls.waiters:
+            return False
+        if cls.name == PRIORITY_BULK:
+            return cls.running < self.capacity - self.reserved_interactive
+        
+        return True
+    
+    def _dispatch(self) -> None:
+        """
+        Grant free slots to waiting requests in weighted fair order.
+        """
+        self._retry_handle = None
+        
+        while self._running < self.capacity:
+            candidates = [cls for cls in self._classes.values() if self._eligible(cls)]
+            if not candidates:
+                return
+            
+            # Classes that were idle restart from the current virtual time
+            cls = min(
+                candidates,
+                key=lambda c: max(c.virtual_finish, self._virtual_time) + 1 / c.weight,
+            )
+            
+            future, enqueued_at = cls.waiters[0]
+            if future.cancelled():
+                cls.waiters.popleft()
+                continue
+            
+            delay = self.rate_limiter.try_acquire()
+            if delay > 0:
+                # Out of rate budget; retry when the next token accrues
+                loop = asyncio.get_running_loop()
+                self._retry_handle = loop.call_later(delay, self._dispatch)
+                return
+            
+            cls.waiters.popleft()
+            start = max(cls.virtual_finish, self._virtual_time)
+            cls.virtual_finish = start + 1 / cls.weight
+            self._virtual_time = start
+            
+            wait = time.monotonic() - enqueued_at
+            cls.running += 1
+            cls.dispatched += 1
+            cls.total_wait += wait
+            cls.max_wait = max(cls.max_wait, wait)
+            self._running += 1
+            future.set_result(None)
+    
+    def _maybe_dispatch(self) -> None:
+        """
+        Dispatch now unless a rate-limit retry is already pending.
+        """
+        handle = self._retry_handle
+        if handle is not None:
+            if handle.when() > asyncio.get_running_loop().time():
+                return
+            # The retry belongs to a loop that is gone; dispatch directly
+            handle.cancel()
+        
+        self._dispatch()
+    
+    async def acquire(self, priority: str = PRIORITY_INTERACTIVE) -> None:
+        """
+        Wait for an LLM call slot.
+        
+        Args:
+            priority: Priority class name
+        
+        Raises:
+            ValueError: If the priority class is unknown
+        """
+        cls = self._get_class(priority)
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        cls.waiters.append((future, time.monotonic()))
+        self._maybe_dispatch()
+        
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just before cancellation
+                self.release(priority)
+            else:
+                for entry in cls.waiters:
+                    if entry[0] is future:
+                        cls.waiters.remove(entry)
+                        break
+            raise
+    
+    def release(self, priority: str = PRIORITY_INTERACTIVE) -> None:
+        """
+        Release an LLM call slot.
+        
+        Args:
+            priority: Priority class name
+        """
+        cls = self._get_class(priority)
+        cls.running -= 1
+        self._running -= 1
+        self._maybe_dispatch()
+    
+    @asynccontextmanager
+    async def slot(self, priority: str = PRIORITY_INTERACTIVE) -> AsyncIterator[None]:
+        """
+        Hold an LLM call slot for the duration of the context.
+        
+        Args:
+            priority: Priority class name
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+
+@lru_cache()
+def get_llm_scheduler() -> LLMScheduler:
+    """
+    Get the process-wide LLM scheduler.
+    
+    Returns:
+        LLMScheduler: LLM scheduler
+    """
+    return LLMScheduler(get_settings())
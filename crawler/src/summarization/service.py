@@ -2,13 +2,15 @@
 Service for generating and retrieving RAPTOR summaries.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
-import uuid
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from src.summarization.raptor import RAPTORProcessor
+from src.summarization.raptor import RAPTORProcessor, compute_summary_id
 from src.utils.config import Settings
 
 logger = logging.getLogger(__name__)
@@ -16,6 +18,90 @@ logger = logging.getLogger(__name__)
 # Directory for storing summaries
 SUMMARIES_DIR = "data/summaries"
 
+# Index mapping alias IDs (e.g. legacy random IDs) to canonical summary IDs
+ALIASES_FILE = "_aliases.json"
+
+
+def get_summary_path(summary_id: str, summaries_dir: Optional[str] = None) -> str:
+    """
+    Get the sharded storage path for a summary.
+    
+    Summaries are spread over two levels of hashed subdirectories
+    (``ab/cd/<id>.json``) so no single directory grows unbounded.
+    
+    Args:
+        summary_id: Summary ID
+        summaries_dir: Base directory (defaults to SUMMARIES_DIR)
+        
+    Returns:
+        str: Path of the summary file
+    """
+    base_dir = summaries_dir or SUMMARIES_DIR
+    shard = hashlib.sha1(summary_id.encode("utf-8")).hexdigest()
+    return os.path.join(base_dir, shard[:2], shard[2:4], f"{summary_id}.json")
+
+
+def iter_summary_files(summaries_dir: Optional[str] = None) -> Iterator[os.DirEntry]:
+    """
+    Iterate over all stored summary files, sharded and legacy flat ones.
+    
+    Args:
+        summaries_dir: Base directory (defaults to SUMMARIES_DIR)
+        
+    Yields:
+        os.DirEntry: Directory entry of each summary file
+    """
+    base_dir = summaries_dir or SUMMARIES_DIR
+    if not os.path.isdir(base_dir):
+        return
+    
+    stack = [base_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and not entry.name.startswith("_"):
+                    # Underscore-prefixed files are indexes, not summaries
+                    yield entry
+
+
+def load_aliases(summaries_dir: Optional[str] = None) -> Dict[str, str]:
+    """
+    Load the alias index.
+    
+    Args:
+        summaries_dir: Base directory (defaults to SUMMARIES_DIR)
+        
+    Returns:
+        Dict[str, str]: Mapping of alias IDs to canonical summary IDs
+    """
+    aliases_path = os.path.join(summaries_dir or SUMMARIES_DIR, ALIASES_FILE)
+    
+    if not os.path.exists(aliases_path):
+        return {}
+    
+    with open(aliases_path, "r") as f:
+        return json.load(f)
+
+
+def save_aliases(aliases: Dict[str, str], summaries_dir: Optional[str] = None) -> None:
+    """
+    Atomically write the alias index.
+    
+    Args:
+        aliases: Mapping of alias IDs to canonical summary IDs
+        summaries_dir: Base directory (defaults to SUMMARIES_DIR)
+    """
+    base_dir = summaries_dir or SUMMARIES_DIR
+    os.makedirs(base_dir, exist_ok=True)
+    aliases_path = os.path.join(base_dir, ALIASES_FILE)
+    tmp_path = f"{aliases_path}.tmp"
+    
+    with open(tmp_path, "w") as f:
+        json.dump(aliases, f, indent=2)
+    os.replace(tmp_path, aliases_path)
+
 
 class SummarizationService:
     """
@@ -26,48 +112,74 @@ class SummarizationService:
         raptor: RAPTOR processor instance
     """
     
-    def __init__(self, settings: Settings):
+    # Generations in progress, shared so concurrent identical requests coalesce
+    _inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+    
+    def __init__(self, settings: Settings, raptor: Optional[RAPTORProcessor] = None):
         """
         Initialize the summarization service.
         
         Args:
             settings: Application settings
+            raptor: Optional shared RAPTOR processor
         """
         self.settings = settings
-        self.raptor = RAPTORProcessor(settings)
-        
-        # Ensure summaries directory exists
-        os.makedirs(SUMMARIES_DIR, exist_ok=True)
+        self.raptor = raptor or RAPTORProcessor(settings)
     
     async def generate_summary(
         self,
         documents: List[str],
         max_tokens: int = 1000,
         hierarchy_levels: int = 3,
+        force: bool = False,
     ) -> Tuple[str, str, Dict[str, Any]]:
         """
         Generate a summary using RAPTOR.
         
+        Summaries are content-addressed: if a summary for the same documents and
+        parameters is already stored it is returned without calling the LLM,
+        unless ``force`` is set.
+        
         Args:
             documents: List of document contents
             max_tokens: Maximum tokens for the summary
             hierarchy_levels: Number of hierarchy levels
+            force: Regenerate the summary even if it is already stored
             
         Returns:
             Tuple[str, str, Dict[str, Any]]: Summary ID, summary text, and hierarchical summary
         """
         try:
-            # Generate summary using RAPTOR
-            summary_id, summary_data = await self.raptor.generate_summary(
-                documents=documents,
-                max_tokens=max_tokens,
-                hierarchy_levels=hierarchy_levels,
+            summary_id = compute_summary_id(
+                documents, max_tokens=max_tokens, hierarchy_levels=hierarchy_levels
             )
             
-            # Store the summary for later retrieval
-            self._store_summary(summary_id, summary_data)
+            if not force:
+                existing = self._load_summary(summary_id)
+                if existing is not None:
+                    logger.info(f"Reusing stored summary with ID: {summary_id}")
+                    return (
+                        summary_id,
+                        existing["summary"],
+                        existing["hierarchical_summary"],
+                    )
             
-            logger.info(f"Generated summary with ID: {summary_id}")
+            # Join an identical generation that is already running
+            inflight = self._inflight.get(summary_id)
+            while inflight is not None:
+                logger.info(f"Waiting for in-flight summary with ID: {summary_id}")
+                try:
+                    summary_data = await asyncio.shield(inflight)
+                    break
+                except asyncio.CancelledError:
+                    # Only the generating task was cancelled; take over from it
+                    if not inflight.cancelled():
+                        raise
+                    inflight = self._inflight.get(summary_id)
+            else:
+                summary_data = await self._generate_inflight(
+                    summary_id, documents, max_tokens, hierarchy_levels
+                )
             
             return (
                 summary_id,
@@ -78,12 +190,61 @@ class SummarizationService:
             logger.error(f"Failed to generate summary: {str(e)}")
             raise
     
+    async def _generate_inflight(
+        self,
+        summary_id: str,
+        documents: List[str],
+        max_tokens: int,
+        hierarchy_levels: int,
+    ) -> Dict[str, Any]:
+        """
+        Generate and store a summary, sharing the result with identical requests.
+        
+        Args:
+            summary_id: Summary ID
+            documents: List of document contents
+            max_tokens: Maximum tokens for the summary
+            hierarchy_levels: Number of hierarchy levels
+        
+        Returns:
+            Dict[str, Any]: Summary data
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+        self._inflight[summary_id] = future
+        try:
+            # Generate summary using RAPTOR
+            summary_id, summary_data = await self.raptor.generate_summary(
+                documents=documents,
+                max_tokens=max_tokens,
+                hierarchy_levels=hierarchy_levels,
+                summary_id=summary_id,
+            )
+            
+            # Store the summary for later retrieval
+            self._store_summary(summary_id, summary_data)
+            future.set_result(summary_data)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting
+            future.exception()
+            raise
+        finally:
+            # A cancelled generation must not leave its waiters blocked
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(summary_id, None)
+        
+        logger.info(f"Generated summary with ID: {summary_id}")
+        
+        return summary_data
+    
     async def get_summary(self, summary_id: str) -> Dict[str, Any]:
         """
         Retrieve a previously generated summary.
         
         Args:
-            summary_id: Summary ID
+            summary_id: Summary ID or alias
             
         Returns:
             Dict[str, Any]: Summary data
@@ -92,17 +253,12 @@ class SummarizationService:
             KeyError: If the summary is not found
         """
         try:
-            # Get the summary file path
-            summary_path = os.path.join(SUMMARIES_DIR, f"{summary_id}.json")
+            summary_data = self._load_summary(self._resolve_summary_id(summary_id))
             
             # Check if the summary exists
-            if not os.path.exists(summary_path):
+            if summary_data is None:
                 raise KeyError(f"Summary with ID {summary_id} not found")
             
-            # Load the summary
-            with open(summary_path, "r") as f:
-                summary_data = json.load(f)
-            
             logger.info(f"Retrieved summary with ID: {summary_id}")
             
             return summary_data
@@ -113,6 +269,90 @@ class SummarizationService:
             logger.error(f"Failed to retrieve summary: {str(e)}")
             raise
     
+    def _find_summary_file(self, summary_id: str) -> Optional[str]:
+        """
+        Find the file of a stored summary by its canonical ID.
+        
+        Args:
+            summary_id: Summary ID
+            
+        Returns:
+            Optional[str]: Path of the summary file, or None if it is not stored
+        """
+        summary_path = get_summary_path(summary_id)
+        if os.path.exists(summary_path):
+            return summary_path
+        
+        # Summaries written before sharding live directly in SUMMARIES_DIR
+        legacy_path = os.path.join(SUMMARIES_DIR, f"{summary_id}.json")
+        if os.path.exists(legacy_path):
+            return legacy_path
+        
+        return None
+    
+    def _load_summary(self, summary_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a stored summary by its canonical ID and record the access.
+        
+        Args:
+            summary_id: Summary ID
+            
+        Returns:
+            Optional[Dict[str, Any]]: Summary data, or None if it is not stored
+        """
+        summary_path = self._find_summary_file(summary_id)
+        if summary_path is None:
+            return None
+        
+        with open(summary_path, "r") as f:
+            summary_data = json.load(f)
+        
+        # Record the access explicitly; retention evicts by least-recent access
+        # and filesystems are commonly mounted noatime/relatime
+        try:
+            stat = os.stat(summary_path)
+            os.utime(summary_path, (time.time(), stat.st_mtime))
+        except OSError as e:
+            logger.debug(f"Could not record access to summary {summary_id}: {e}")
+        
+        return summary_data
+    
+    def _resolve_summary_id(self, summary_id: str) -> str:
+        """
+        Resolve an alias to its canonical summary ID.
+        
+        Args:
+            summary_id: Summary ID or alias
+            
+        Returns:
+            str: Canonical summary ID (the input if it is not an alias)
+        """
+        return load_aliases().get(summary_id, summary_id)
+    
+    def add_alias(self, alias_id: str, summary_id: str) -> None:
+        """
+        Make an additional ID resolve to an existing summary.
+        
+        Used to keep random IDs issued before summaries were content-addressed
+        resolving after their summaries are re-keyed.
+        
+        Args:
+            alias_id: Alias ID
+            summary_id: Canonical summary ID
+            
+        Raises:
+            KeyError: If the target summary is not found
+        """
+        summary_id = self._resolve_summary_id(summary_id)
+        if self._load_summary(summary_id) is None:
+            raise KeyError(f"Summary with ID {summary_id} not found")
+        
+        aliases = load_aliases()
+        aliases[alias_id] = summary_id
+        save_aliases(aliases)
+        
+        logger.info(f"Added alias {alias_id} for summary {summary_id}")
+    
     def _store_summary(self, summary_id: str, summary_data: Dict[str, Any]) -> None:
         """
         Store a summary for later retrieval.
@@ -123,12 +363,18 @@ class SummarizationService:
         """
         try:
             # Get the summary file path
-            summary_path = os.path.join(SUMMARIES_DIR, f"{summary_id}.json")
+            summary_path = get_summary_path(summary_id)
+            os.makedirs(os.path.dirname(summary_path), exist_ok=True)
             
             # Store the summary
             with open(summary_path, "w") as f:
                 json.dump(summary_data, f, indent=2)
             
+            # Remove a pre-sharding copy so the summary is stored only once
+            legacy_path = os.path.join(SUMMARIES_DIR, f"{summary_id}.json")
+            if os.path.exists(legacy_path):
+                os.remove(legacy_path)
+            
             logger.info(f"Stored summary with ID: {summary_id}")
         except Exception as e:
             logger.error(f"Failed to store summary: {str(e)}")
@@ -144,15 +390,13 @@ class SummarizationService:
         try:
             summaries = []
             
-            # Get all summary files
-            summary_files = [f for f in os.listdir(SUMMARIES_DIR) if f.endswith(".json")]
-            
             # Load metadata for each summary
-            for summary_file in summary_files:
-                summary_id = summary_file.replace(".json", "")
+            for summary_file in iter_summary_files():
+                summary_id = summary_file.name[: -len(".json")]
                 
                 try:
-                    summary_data = await self.get_summary(summary_id)
+                    with open(summary_file.path, "r") as f:
+                        summary_data = json.load(f)
                     
                     # Add basic metadata to the list
                     summaries.append({
@@ -182,17 +426,25 @@ class SummarizationService:
             KeyError: If the summary is not found
         """
         try:
+            canonical_id = self._resolve_summary_id(summary_id)
+            
             # Get the summary file path
-            summary_path = os.path.join(SUMMARIES_DIR, f"{summary_id}.json")
+            summary_path = self._find_summary_file(canonical_id)
             
             # Check if the summary exists
-            if not os.path.exists(summary_path):
+            if summary_path is None:
                 raise KeyError(f"Summary with ID {summary_id} not found")
             
             # Delete the summary
             os.remove(summary_path)
             
-            logger.info(f"Deleted summary with ID: {summary_id}")
+            # Drop aliases that pointed at the deleted summary
+            aliases = load_aliases()
+            remaining = {k: v for k, v in aliases.items() if v != canonical_id}
+            if len(remaining) != len(aliases):
+                save_aliases(remaining)
+            
+            logger.info(f"Deleted summary with ID: {canonical_id}")
             
             return True
         except Exception as e:
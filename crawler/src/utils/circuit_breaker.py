@@ -0,0 +1,225 @@
+"""
+Circuit breaker for calls to external services.
+
+After a number of consecutive failures or slow calls the breaker opens and
+rejects calls immediately instead of letting each one wait for a timeout.
+Once the recovery timeout has passed a single probe call is let through: if it
+succeeds the breaker closes, otherwise it opens again.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from src.utils.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised when a call is rejected because the circuit is open.
+    
+    Attributes:
+        name: Name of the breaker that rejected the call
+        retry_after: Seconds until the breaker lets a probe call through
+    """
+    
+    def __init__(self, name: str, retry_after: float):
+        """
+        Initialize the error.
+        
+        Args:
+            name: Name of the breaker that rejected the call
+            retry_after: Seconds until the breaker lets a probe call through
+        """
+        super().__init__(
+            f"{name} is unavailable (circuit open, retry in {retry_after:.0f}s)"
+        )
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+    
+    Attributes:
+        name: Breaker name, used in errors, logs and metric labels
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds the circuit stays open before a probe
+        slow_call_seconds: Calls slower than this count as failures
+        metrics: Metrics registry
+        state: Current state (closed, open or half_open)
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        slow_call_seconds: Optional[float] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize the breaker in the closed state.
+        
+        Args:
+            name: Breaker name
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a probe
+            slow_call_seconds: Calls slower than this count as failures
+                (None disables the latency check)
+            metrics: Optional metrics registry
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.metrics = metrics or get_metrics()
+        self.state = STATE_CLOSED
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+        self._times_opened = 0
+        
+        self.metrics.set_gauge("circuit_breaker_open", 0, labels={"breaker": name})
+    
+    def _transition(self, state: str) -> None:
+        """
+        Move to a new state. Must be called with the lock held.
+        
+        Args:
+            state: New state
+        """
+        if state == self.state:
+            return
+        
+        logger.warning(f"Circuit breaker {self.name}: {self.state} -> {state}")
+        self.state = state
+        if state == STATE_OPEN:
+            self._opened_at = time.monotonic()
+            self._times_opened += 1
+        
+        labels = {"breaker": self.name}
+        self.metrics.increment(
+            "circuit_breaker_transitions", labels={**labels, "state": state}
+        )
+        self.metrics.set_gauge(
+            "circuit_breaker_open", 1 if state == STATE_OPEN else 0, labels=labels
+        )
+    
+    def _retry_after(self) -> float:
+        """
+        Seconds until an open circuit lets a probe through.
+        
+        Returns:
+            float: Remaining seconds (0 when a probe is due)
+        """
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+    
+    def allow(self) -> None:
+        """
+        Check that a call may proceed.
+        
+        In the half-open state only one probe call is allowed at a time.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self.state == STATE_OPEN and self._retry_after() == 0:
+                self._transition(STATE_HALF_OPEN)
+            
+            if self.state == STATE_CLOSED:
+                return
+            if self.state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            
+            self._rejected += 1
+            retry_after = self._retry_after()
+        
+        self.metrics.increment("circuit_breaker_rejected", labels={"breaker": self.name})
+        raise CircuitOpenError(self.name, retry_after)
+    
+    def record_success(self, elapsed: float = 0.0) -> None:
+        """
+        Record a completed call.
+        
+        Args:
+            elapsed: Duration of the call in seconds
+        """
+        if self.slow_call_seconds is not None and elapsed > self.slow_call_seconds:
+            logger.warning(
+                f"Slow call through circuit breaker {self.name}: {elapsed:.2f}s"
+            )
+            self.record_failure()
+            return
+        
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            self._transition(STATE_CLOSED)
+    
+    def record_failure(self) -> None:
+        """
+        Record a failed call, opening the circuit past the threshold.
+        """
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self.state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._transition(STATE_OPEN)
+    
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a call through the breaker.
+        
+        Args:
+            fn: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+        
+        Returns:
+            T: Result of the callable
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self.allow()
+        
+        started = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        
+        self.record_success(time.monotonic() - started)
+        return result
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the breaker state.
+        
+        Returns:
+            Dict[str, Any]: State, consecutive failures and rejection counts
+        """
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "rejected": self._rejected,
+                "times_opened": self._times_opened,
+                "retry_after": self._retry_after() if self.state == STATE_OPEN else 0.0,
+            }
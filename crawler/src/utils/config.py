@@ -19,21 +19,152 @@ class Settings(BaseSettings):
         environment: Current environment (development, test, production)
         log_level: Logging level
         cors_origins: List of allowed CORS origins
+        vector_backend: Vector database backend (weaviate, or local for the
+            embedded NumPy store)
+        local_vector_store_dir: Directory of the embedded vector store
         weaviate_url: URL for Weaviate vector database
         weaviate_api_key: API key for Weaviate (if using cloud instance)
+        weaviate_pool_connections: Number of pooled Weaviate connection pools
+        weaviate_pool_maxsize: Maximum connections kept per Weaviate pool
+        weaviate_connect_timeout: Weaviate connect timeout in seconds
+        weaviate_read_timeout: Weaviate read timeout in seconds
+        weaviate_search_workers: Threads for concurrent Weaviate queries
+        weaviate_ingest_workers: Threads for concurrent Weaviate writes
+        weaviate_batch_size: Initial number of objects per Weaviate batch
+        weaviate_batch_creation_time: Target seconds per batch for dynamic sizing
+        weaviate_batch_workers: Concurrent batch requests per ingest
+        weaviate_batch_retries: Retries for objects rejected by Weaviate
+        weaviate_multi_tenancy: Whether new Documentation classes store each
+            source in its own tenant
+        weaviate_hnsw_ef: HNSW query candidate list size (-1 picks it per query
+            from the limit)
+        weaviate_hnsw_ef_construction: HNSW candidate list size when inserting
+        weaviate_hnsw_max_connections: HNSW edges per node and layer
+        weaviate_vector_cache_max_objects: Uncompressed vectors kept in memory
+        weaviate_vector_quantization: Vector compression (none, pq or bq)
+        weaviate_pq_segments: PQ segments per vector (0 lets Weaviate choose)
+        weaviate_pq_training_limit: Objects PQ is trained on; PQ is enabled
+            once the class holds this many
+        weaviate_breaker_failure_threshold: Consecutive Weaviate failures that
+            open the circuit breaker
+        weaviate_breaker_recovery_seconds: Seconds the breaker stays open before
+            probing Weaviate again
+        weaviate_breaker_slow_call_seconds: Weaviate queries slower than this
+            count as failures
+        dedup_enabled: Whether near-duplicate crawled pages are embedded once
+        dedup_max_distance: Maximum SimHash bit difference between
+            near-duplicate pages
+        crawl_manifest_enabled: Whether re-crawls only store pages that changed
+        crawl_manifest_dir: Directory of the per-source crawl manifests
+        chunking_enabled: Whether documents are split into chunks before embedding
+        chunk_size_tokens: Maximum number of tokens per chunk
+        chunk_overlap_tokens: Number of tokens shared by consecutive chunks
+        search_group_oversample: Chunks fetched per requested page when grouping
+        mmr_oversample: Candidates fetched per requested result for MMR reranking
+        search_cache_enabled: Whether search results are cached in process
+        search_cache_max_entries: Maximum number of cached searches
+        search_cache_ttl_seconds: Seconds a cached search stays valid
+        embedding_mode: Who computes vectors (weaviate, hashing or openai)
+        embedding_model: OpenAI embedding model for the openai mode
+        embedding_dimension: Vector length of client-side embeddings
+        embedding_batch_size: Texts embedded per client-side model call
+        query_vector_cache_size: Maximum number of cached query embeddings
+        hybrid_search_alpha: Default vector weight of hybrid search (0 is pure keyword)
+        search_batch_max_queries: Maximum number of queries per batch search
         openai_api_key: API key for OpenAI (used for embeddings)
         crawl4ai_api_key: API key for Crawl4AI service
         crawl4ai_base_url: Base URL for Crawl4AI API
+        summary_retention_enabled: Whether the summary retention task runs
+        summary_retention_interval_seconds: Seconds between retention passes
+        summary_max_age_days: Remove summaries not accessed for this many days
+        summary_max_count: Maximum number of stored summaries
+        summary_max_total_mb: Maximum total size of stored summaries in MB
+        summary_retention_action: What to do with expired summaries (delete, archive)
+        summary_archive_dir: Directory for archived summaries
+        summary_batch_concurrency: Concurrent summaries across all batches
+        summary_batch_max_items: Maximum document sets in one batch
+        summary_batch_ttl_seconds: How long finished batches stay queryable
+        llm_requests_per_minute: Rate limit for LLM calls (0 disables it)
+        llm_max_concurrency: Maximum concurrent LLM calls across the process
+        llm_interactive_weight: Fair-queuing weight of interactive LLM calls
+        llm_bulk_weight: Fair-queuing weight of bulk LLM calls
+        llm_interactive_reserved_slots: LLM slots bulk work may not use
+        page_summary_concurrency: Concurrent page summaries during a crawl
+        page_summary_max_tokens: Maximum tokens for each page summary
+        page_summary_hierarchy_levels: Hierarchy levels for each page summary
+        page_summary_index_nodes: Whether to index every summary tree node for
+            collapsed-tree search
     """
 
     environment: str = Field(default="development")
     log_level: int = Field(default=logging.INFO)
     cors_origins: List[AnyHttpUrl] = Field(default=["http://localhost:8000"])
+    vector_backend: str = Field(default="weaviate")
+    local_vector_store_dir: str = Field(default="data/vector_store")
     weaviate_url: str = Field(default="http://weaviate:8080")
     weaviate_api_key: Optional[str] = Field(default=None)
+    weaviate_pool_connections: int = Field(default=10)
+    weaviate_pool_maxsize: int = Field(default=50)
+    weaviate_connect_timeout: float = Field(default=5.0)
+    weaviate_read_timeout: float = Field(default=60.0)
+    weaviate_search_workers: int = Field(default=8)
+    weaviate_ingest_workers: int = Field(default=2)
+    weaviate_batch_size: int = Field(default=100)
+    weaviate_batch_creation_time: float = Field(default=10.0)
+    weaviate_batch_workers: int = Field(default=2)
+    weaviate_batch_retries: int = Field(default=3)
+    weaviate_multi_tenancy: bool = Field(default=False)
+    weaviate_hnsw_ef: int = Field(default=-1)
+    weaviate_hnsw_ef_construction: int = Field(default=128)
+    weaviate_hnsw_max_connections: int = Field(default=64)
+    weaviate_vector_cache_max_objects: int = Field(default=1000000000000)
+    weaviate_vector_quantization: str = Field(default="none")
+    weaviate_pq_segments: int = Field(default=0)
+    weaviate_pq_training_limit: int = Field(default=100000)
+    weaviate_breaker_failure_threshold: int = Field(default=5)
+    weaviate_breaker_recovery_seconds: float = Field(default=30.0)
+    weaviate_breaker_slow_call_seconds: float = Field(default=10.0)
+    dedup_enabled: bool = Field(default=True)
+    dedup_max_distance: int = Field(default=3)
+    crawl_manifest_enabled: bool = Field(default=True)
+    crawl_manifest_dir: str = Field(default="data/crawl_manifests")
+    chunking_enabled: bool = Field(default=True)
+    chunk_size_tokens: int = Field(default=256)
+    chunk_overlap_tokens: int = Field(default=32)
+    search_group_oversample: int = Field(default=3)
+    mmr_oversample: int = Field(default=4)
+    search_cache_enabled: bool = Field(default=True)
+    search_cache_max_entries: int = Field(default=1024)
+    search_cache_ttl_seconds: float = Field(default=60.0)
+    embedding_mode: str = Field(default="weaviate")
+    embedding_model: str = Field(default="text-embedding-3-small")
+    embedding_dimension: int = Field(default=384)
+    embedding_batch_size: int = Field(default=256)
+    query_vector_cache_size: int = Field(default=1024)
+    hybrid_search_alpha: float = Field(default=0.5)
+    search_batch_max_queries: int = Field(default=50)
     openai_api_key: str = Field(default="")
     crawl4ai_api_key: str = Field(default="")
     crawl4ai_base_url: str = Field(default="https://api.crawl4ai.com/v1")
+    summary_retention_enabled: bool = Field(default=True)
+    summary_retention_interval_seconds: int = Field(default=3600)
+    summary_max_age_days: Optional[int] = Field(default=90)
+    summary_max_count: Optional[int] = Field(default=10000)
+    summary_max_total_mb: Optional[int] = Field(default=1024)
+    summary_retention_action: str = Field(default="archive")
+    summary_archive_dir: str = Field(default="data/summaries_archive")
+    summary_batch_concurrency: int = Field(default=4)
+    summary_batch_max_items: int = Field(default=500)
+    summary_batch_ttl_seconds: int = Field(default=3600)
+    llm_requests_per_minute: int = Field(default=500)
+    llm_max_concurrency: int = Field(default=8)
+    llm_interactive_weight: float = Field(default=8.0)
+    llm_bulk_weight: float = Field(default=1.0)
+    llm_interactive_reserved_slots: int = Field(default=1)
+    page_summary_concurrency: int = Field(default=8)
+    page_summary_max_tokens: int = Field(default=500)
+    page_summary_hierarchy_levels: int = Field(default=1)
+    page_summary_index_nodes: bool = Field(default=True)
 
     model_config = SettingsConfigDict(
         env_file=".env", 
@@ -0,0 +1,127 @@
+"""
+In-process metrics registry for the RAPTOR Documentation Crawler.
+"""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _metric_key(name: str, labels: Optional[Dict[str, str]] = None) -> str:
+    """
+    Build the storage key for a metric and its labels.
+    
+    Args:
+        name: Metric name
+        labels: Optional metric labels
+    
+    Returns:
+        str: Metric key, e.g. ``name{key=value}``
+    """
+    if not labels:
+        return name
+    
+    label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+    return f"{name}{{{label_str}}}"
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters, gauges and metric providers.
+    
+    Providers are callables registered by long-lived components (caches,
+    schedulers, background tasks) that return their current statistics when a
+    snapshot is taken.
+    
+    Attributes:
+        counters: Monotonic counters by key
+        gauges: Point-in-time values by key
+    """
+    
+    def __init__(self) -> None:
+        """
+        Initialize an empty metrics registry.
+        """
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self._providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    def increment(
+        self, name: str, value: float = 1, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Increment a counter.
+        
+        Args:
+            name: Counter name
+            value: Amount to add
+            labels: Optional metric labels
+        """
+        key = _metric_key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def set_gauge(
+        self, name: str, value: float, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Set a gauge to a value.
+        
+        Args:
+            name: Gauge name
+            value: Current value
+            labels: Optional metric labels
+        """
+        key = _metric_key(name, labels)
+        with self._lock:
+            self.gauges[key] = value
+    
+    def register_provider(
+        self, name: str, provider: Callable[[], Dict[str, Any]]
+    ) -> None:
+        """
+        Register a callable that reports statistics at snapshot time.
+        
+        Args:
+            name: Section name in the snapshot
+            provider: Callable returning a JSON-serializable dict
+        """
+        with self._lock:
+            self._providers[name] = provider
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Take a snapshot of all metrics.
+        
+        Returns:
+            Dict[str, Any]: Counters, gauges and provider sections
+        """
+        with self._lock:
+            snapshot: Dict[str, Any] = {
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+            }
+            providers = dict(self._providers)
+        
+        for name, provider in providers.items():
+            try:
+                snapshot[name] = provider()
+            except Exception as e:
+                logger.warning(f"Metrics provider {name} failed: {str(e)}")
+        
+        return snapshot
+
+
+@lru_cache()
+def get_metrics() -> MetricsRegistry:
+    """
+    Get the process-wide metrics registry.
+    
+    Returns:
+        MetricsRegistry: Metrics registry
+    """
+    return MetricsRegistry()
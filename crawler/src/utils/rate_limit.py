@@ -0,0 +1,82 @@
+"""
+Asynchronous rate limiting utilities.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket rate limiter for coroutines.
+    
+    Waiters are served in arrival order. A limiter with a non-positive rate
+    never blocks.
+    
+    Attributes:
+        rate: Number of acquisitions allowed per period
+        period: Period in seconds
+        burst: Maximum number of tokens that can accumulate
+    """
+    
+    def __init__(self, rate: float, period: float = 60.0, burst: Optional[int] = None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Number of acquisitions allowed per period
+            period: Period in seconds
+            burst: Maximum number of tokens that can accumulate (defaults to 1)
+        """
+        self.rate = rate
+        self.period = period
+        self.burst = burst or 1
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """
+        Add the tokens accrued since the last refill.
+        """
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(
+            float(self.burst), self._tokens + elapsed * self.rate / self.period
+        )
+    
+    def try_acquire(self) -> float:
+        """
+        Consume a token if one is available, without waiting.
+        
+        Returns:
+            float: 0 if a token was consumed, otherwise seconds until one accrues
+        """
+        if self.rate <= 0:
+            return 0.0
+        
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        
+        return (1 - self._tokens) * self.period / self.rate
+    
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and consume it.
+        """
+        if self.rate <= 0:
+            return
+        
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                # Sleep exactly until the next token accrues
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
@@ -0,0 +1,122 @@
+"""Tests for the embedding endpoints."""
+
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.embedding.executor import BoundedExecutor
+from src.utils.circuit_breaker import CircuitOpenError
+
+
+def test_search_uses_shared_weaviate_client(app: FastAPI, client: TestClient) -> None:
+    """
+    Test that searches reuse the client created in the app lifespan.
+    
+    Args:
+        app: FastAPI application
+        client: Test client
+    """
+    shared_client = MagicMock()
+    shared_client.search_similar.return_value = ([], 0)
+    shared_client.search_executor = BoundedExecutor("search", 1)
+    shared_client.search_cache = None
+    app.state.weaviate_client = shared_client
+    
+    for _ in range(2):
+        response = client.post("/api/v1/embeddings/search", json={"query": "crawl"})
+        assert response.status_code == 200
+    
+    assert shared_client.search_similar.call_count == 2
+
+
+def test_search_reports_unavailable_weaviate(app: FastAPI, client: TestClient) -> None:
+    """
+    Test that an unreachable Weaviate is reported as 503.
+    
+    Args:
+        app: FastAPI application
+        client: Test client
+    """
+    app.state.weaviate_client = None
+    
+    response = client.post("/api/v1/embeddings/search", json={"query": "crawl"})
+    
+    assert response.status_code == 503
+
+
+def test_batch_search_returns_results_in_order(app: FastAPI, client: TestClient) -> None:
+    """
+    Test that the batch search endpoint answers every search in request order.
+    
+    Args:
+        app: FastAPI application
+        client: Test client
+    """
+    shared_client = MagicMock()
+    shared_client.search_many.side_effect = lambda searches: [([], i) for i, _ in enumerate(searches)]
+    shared_client.search_executor = BoundedExecutor("search", 1)
+    shared_client.search_cache = None
+    app.state.weaviate_client = shared_client
+    
+    response = client.post(
+        "/api/v1/embeddings/search/batch",
+        json={"searches": [{"query": "crawl"}, {"query": "arun", "mode": "keyword", "limit": 3}]},
+    )
+    
+    assert response.status_code == 200
+    assert [r["total"] for r in response.json()["results"]] == [0, 1]
+    shared_client.search_many.assert_called_once()
+    
+    response = client.post("/api/v1/embeddings/search/batch", json={"searches": []})
+    assert response.status_code == 400
+
+
+def test_search_reports_open_circuit_as_degraded(app: FastAPI, client: TestClient) -> None:
+    """
+    Test that searches rejected by the circuit breaker return 503 with Retry-After.
+    
+    Args:
+        app: FastAPI application
+        client: Test client
+    """
+    shared_client = MagicMock()
+    shared_client.search_similar.side_effect = CircuitOpenError("weaviate", 12.5)
+    shared_client.search_executor = BoundedExecutor("search", 1)
+    shared_client.search_cache = None
+    app.state.weaviate_client = shared_client
+    
+    response = client.post("/api/v1/embeddings/search", json={"query": "crawl"})
+    
+    assert response.status_code == 503
+    assert "degraded" in response.json()["detail"]
+    assert response.headers["Retry-After"] == "13"
+
+
+def test_delete_by_filter(app: FastAPI, client: TestClient) -> None:
+    """
+    Test that the bulk delete endpoint requires a filter and reports counts.
+    
+    Args:
+        app: FastAPI application
+        client: Test client
+    """
+    shared_client = MagicMock()
+    shared_client.delete_where.return_value = {
+        "matched": 5, "deleted": 0, "failed": 0, "dry_run": True
+    }
+    shared_client.ingest_executor = BoundedExecutor("ingest", 1)
+    app.state.weaviate_client = shared_client
+    
+    response = client.post(
+        "/api/v1/embeddings/delete", json={"source": "crawl4ai", "dry_run": True}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["matched"] == 5
+    assert shared_client.delete_where.call_args.kwargs["source"] == "crawl4ai"
+    
+    shared_client.delete_where.side_effect = ValueError("no filter")
+    response = client.post("/api/v1/embeddings/delete", json={})
+    
+    assert response.status_code == 400
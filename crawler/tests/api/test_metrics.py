@@ -0,0 +1,23 @@
+"""Tests for the metrics endpoint."""
+
+from fastapi.testclient import TestClient
+
+from src.utils.metrics import get_metrics
+
+
+def test_metrics_snapshot(client: TestClient) -> None:
+    """
+    Test that the metrics endpoint reports counters and provider sections.
+    
+    Args:
+        client: Test client
+    """
+    metrics = get_metrics()
+    metrics.increment("test_events", labels={"kind": "unit"})
+    metrics.register_provider("test_component", lambda: {"size": 3})
+    
+    response = client.get("/api/v1/metrics/")
+    
+    assert response.status_code == 200
+    assert response.json()["counters"]["test_events{kind=unit}"] >= 1
+    assert response.json()["test_component"] == {"size": 3}
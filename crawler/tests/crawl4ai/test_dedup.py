@@ -0,0 +1,53 @@
+"""
+Tests for near-duplicate page detection.
+"""
+
+from src.crawl4ai.dedup import deduplicate, hamming_distance, simhash
+
+PAGE = " ".join(f"Paragraph {i} explains how the crawler handles page {i}." for i in range(40))
+OTHER_PAGE = " ".join(f"Section {i} lists the proxy settings of browser {i}." for i in range(40))
+
+
+def page(content, url):
+    """
+    Build a crawled page document.
+    """
+    return {"content": content, "metadata": {"url": url, "source": "docs"}}
+
+
+def test_simhash_distance_reflects_similarity():
+    """
+    Test that small edits keep fingerprints close and other pages far.
+    """
+    edited = PAGE + " Print this page."
+    
+    assert hamming_distance(simhash(PAGE), simhash(PAGE)) == 0
+    assert hamming_distance(simhash(PAGE), simhash(edited)) <= 3
+    assert hamming_distance(simhash(PAGE), simhash(OTHER_PAGE)) > 10
+
+
+def test_deduplicate_keeps_the_canonical_copy():
+    """
+    Test that duplicates are dropped and recorded as aliases of the copy with
+    the cleanest URL.
+    """
+    documents = [
+        page(PAGE + " Print this page.", "https://docs/guide/?print=1"),
+        page(OTHER_PAGE, "https://docs/proxy/"),
+        page(PAGE, "https://docs/guide/"),
+        page(PAGE, "https://docs/guide/#install"),
+    ]
+    
+    kept, duplicates = deduplicate(documents, max_distance=3)
+    
+    assert duplicates == 2
+    assert [doc["metadata"]["url"] for doc in kept] == [
+        "https://docs/proxy/",
+        "https://docs/guide/",
+    ]
+    assert sorted(kept[1]["metadata"]["aliases"]) == [
+        "https://docs/guide/#install",
+        "https://docs/guide/?print=1",
+    ]
+    assert "aliases" not in kept[0]["metadata"]
+    assert "aliases" not in documents[2]["metadata"]
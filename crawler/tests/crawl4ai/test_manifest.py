@@ -0,0 +1,101 @@
+"""
+Tests for the per-source crawl manifest.
+"""
+
+from src.crawl4ai.manifest import CrawlManifest, in_crawl_scope
+
+
+def page(url, content):
+    """
+    Build a crawled page document.
+    """
+    return {"content": content, "metadata": {"url": url, "source": "docs.example.com"}}
+
+
+def test_manifest_diff_and_persistence(tmp_path):
+    """
+    Test that a saved manifest classifies re-crawled pages.
+    """
+    manifest = CrawlManifest(str(tmp_path), "docs.example.com")
+    manifest.record(page("https://a", "A"), ["id-a"], "summary-a")
+    manifest.record(page("https://b", "B"), ["id-b1", "id-b2"])
+    manifest.record(page("https://c", "C"), ["id-c"], "summary-c")
+    manifest.save()
+    
+    reloaded = CrawlManifest(str(tmp_path), "docs.example.com")
+    changes = reloaded.diff([
+        page("https://a", "A"),
+        page("https://b", "B"),
+        page("https://c", "C changed"),
+        page("https://d", "D"),
+    ])
+    
+    assert [doc["metadata"]["url"] for doc in changes["unchanged"]] == ["https://a", "https://b"]
+    assert [doc["metadata"]["url"] for doc in changes["changed"]] == ["https://c"]
+    assert [doc["metadata"]["url"] for doc in changes["new"]] == ["https://d"]
+    assert changes["removed"] == []
+    assert reloaded.vector_ids("https://b") == ["id-b1", "id-b2"]
+    
+    # Pages without a summary are redone when summaries are requested
+    changes = reloaded.diff([page("https://b", "B")], require_summary=True)
+    assert [doc["metadata"]["url"] for doc in changes["changed"]] == ["https://b"]
+    assert changes["removed"] == ["https://a", "https://c"]
+
+
+def test_only_pages_in_the_crawl_scope_are_removed(tmp_path):
+    """
+    Test that pages another crawl of the source stored are not removed.
+    """
+    manifest = CrawlManifest(str(tmp_path), "docs.example.com")
+    for url in ("https://x/guide/a", "https://x/guide/b.pdf", "https://x/api/c"):
+        manifest.record(page(url, url), [url])
+    
+    changes = manifest.diff(
+        [page("https://x/guide/a", "https://x/guide/a")],
+        in_scope=lambda url: in_crawl_scope(url, "https://x/guide/", None, ["*.pdf"]),
+    )
+    
+    assert changes["removed"] == []
+    assert in_crawl_scope("https://x/guide/b", "https://x/guide/#top")
+    assert not in_crawl_scope("https://x/guide/b", "https://x/", ["https://x/api/*"])
+
+
+def test_overlapping_crawls_keep_each_others_pages(tmp_path):
+    """
+    Test that saving a manifest merges its changes into the saved one.
+    """
+    first = CrawlManifest(str(tmp_path), "docs.example.com")
+    second = CrawlManifest(str(tmp_path), "docs.example.com")
+    first.record(page("https://x/guide/a", "A"), ["id-a"])
+    second.record(page("https://x/api/b", "B"), ["id-b"])
+    first.save()
+    second.save()
+    
+    reloaded = CrawlManifest(str(tmp_path), "docs.example.com")
+    assert sorted(reloaded.pages) == ["https://x/api/b", "https://x/guide/a"]
+    
+    second.remove("https://x/guide/a")
+    second.save()
+    assert sorted(CrawlManifest(str(tmp_path), "docs.example.com").pages) == [
+        "https://x/api/b"
+    ]
+
+
+def test_deleted_pages_are_forgotten(tmp_path):
+    """
+    Test that pages deleted outside a crawl are forgotten by prefix, version
+    and object.
+    """
+    manifest = CrawlManifest(str(tmp_path), "docs.example.com")
+    for url in ("https://x/guide/a", "https://x/guide/b", "https://x/api/c"):
+        document = page(url, url)
+        document["metadata"]["version"] = "latest"
+        manifest.record(document, [f"id:{url}"])
+    manifest.save()
+    
+    assert manifest.forget(url_prefix="https://x/guide/", version="2.0") == 0
+    assert manifest.forget(url_prefix="https://x/guide/", version="latest") == 2
+    assert manifest.forget_objects(["id:https://x/api/c", "other"]) == 1
+    manifest.save()
+    
+    assert CrawlManifest.load_all(str(tmp_path))[0].pages == {}
@@ -10,11 +10,12 @@ from src.utils.config import Settings
 
 
 @pytest.fixture
-def settings():
+def settings(tmp_path):
     """
     Create test settings.
     """
     return Settings(
+        crawl_manifest_dir=str(tmp_path / "manifests"),
         crawl4ai_base_url="https://api.crawl4ai.com",
         crawl4ai_api_key="test-api-key",
         weaviate_url="http://localhost:8080",
@@ -53,9 +54,22 @@ def mock_embedding_service():
     """
     service = AsyncMock()
     service.batch_embed_documents.return_value = [
-        ("doc-id-1", "vector-id-1"),
-        ("doc-id-2", "vector-id-2"),
+        {
+            "doc_id": "doc-id-1",
+            "vector_id": "vector-id-1",
+            "vector_ids": ["vector-id-1"],
+            "success": True,
+            "error": None,
+        },
+        {
+            "doc_id": "doc-id-2",
+            "vector_id": "vector-id-2",
+            "vector_ids": ["vector-id-2", "vector-id-3"],
+            "success": True,
+            "error": None,
+        },
     ]
+    service.existing_ids.side_effect = lambda vector_ids, source: set(vector_ids)
     return service
 
 
@@ -65,8 +79,7 @@ def mock_summarization_service():
     Create a mock summarization service.
     """
     service = AsyncMock()
-    service.generate_summary.return_value = "Test summary"
-    service.store_summary.return_value = True
+    service.generate_summary.return_value = ("summary-id", "Test summary", {})
     return service
 
 
@@ -123,7 +136,84 @@ async def test_crawl_and_store_success(
     
     # Verify summarization service was called for each document
     assert mock_summarization_service.generate_summary.call_count == 2
-    assert mock_summarization_service.store_summary.call_count == 2
+    summarized_docs = [
+        call.kwargs["documents"]
+        for call in mock_summarization_service.generate_summary.call_args_list
+    ]
+    assert sorted(summarized_docs) == [["Test content 1"], ["Test content 2"]]
+    
+    # Verify each summary was linked to all of its page's Weaviate objects at once
+    linked = sorted(
+        call.args for call in mock_embedding_service.update_documents.call_args_list
+    )
+    assert linked == [
+        (["vector-id-1"], {"summary_id": "summary-id"}, "crawl4ai.com"),
+        (["vector-id-2", "vector-id-3"], {"summary_id": "summary-id"}, "crawl4ai.com"),
+    ]
+    assert result["summary_failed_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_store_reports_summary_failures(
+    settings,
+    mock_crawl4ai_client,
+    mock_embedding_service,
+    mock_summarization_service,
+):
+    """
+    Test that failed page summaries are counted instead of hidden.
+    """
+    mock_summarization_service.generate_summary.side_effect = [
+        ("summary-id", "Test summary", {}),
+        Exception("LLM error"),
+    ]
+    settings.page_summary_concurrency = 1
+    
+    service = DocumentationCrawlerService(
+        settings=settings,
+        crawl4ai_client=mock_crawl4ai_client,
+        embedding_service=mock_embedding_service,
+        summarization_service=mock_summarization_service,
+    )
+    
+    result = await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    assert result["summarized_count"] == 1
+    assert result["summary_failed_count"] == 1
+    mock_embedding_service.update_documents.assert_called_once_with(
+        ["vector-id-1"], {"summary_id": "summary-id"}, "crawl4ai.com"
+    )
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_store_reports_embedding_failures(
+    settings,
+    mock_crawl4ai_client,
+    mock_embedding_service,
+    mock_summarization_service,
+):
+    """
+    Test that pages Weaviate rejected are counted and not summarized.
+    """
+    mock_embedding_service.batch_embed_documents.return_value[1].update(
+        success=False, error="vectorizer timeout"
+    )
+    
+    service = DocumentationCrawlerService(
+        settings=settings,
+        crawl4ai_client=mock_crawl4ai_client,
+        embedding_service=mock_embedding_service,
+        summarization_service=mock_summarization_service,
+    )
+    
+    result = await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    assert result["embedded_count"] == 1
+    assert result["embed_failed_count"] == 1
+    assert result["summarized_count"] == 1
+    mock_embedding_service.update_documents.assert_called_once_with(
+        ["vector-id-1"], {"summary_id": "summary-id"}, "crawl4ai.com"
+    )
 
 
 @pytest.mark.asyncio
@@ -160,7 +250,7 @@ async def test_crawl_and_store_no_summaries(
     
     # Verify the summarization service was not called
     mock_summarization_service.generate_summary.assert_not_called()
-    mock_summarization_service.store_summary.assert_not_called()
+    mock_embedding_service.update_documents.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -197,4 +287,228 @@ async def test_crawl_and_store_empty_results(
     # Verify embedding and summarization services were not called
     mock_embedding_service.batch_embed_documents.assert_not_called()
     mock_summarization_service.generate_summary.assert_not_called()
-    mock_summarization_service.store_summary.assert_not_called()
\ No newline at end of file
+
+@pytest.mark.asyncio
+async def test_crawl_and_store_embeds_duplicate_pages_once(
+    settings,
+    mock_crawl4ai_client,
+    mock_embedding_service,
+    mock_summarization_service,
+):
+    """
+    Test that a page served under a second URL is stored as an alias.
+    """
+    mock_crawl4ai_client.fetch_crawl_results.return_value.append({
+        "url": "https://crawl4ai.com/mkdocs/getting-started/#install",
+        "title": "Getting Started",
+        "content": "Test content 2",
+    })
+    
+    service = DocumentationCrawlerService(
+        settings=settings,
+        crawl4ai_client=mock_crawl4ai_client,
+        embedding_service=mock_embedding_service,
+        summarization_service=mock_summarization_service,
+    )
+    
+    result = await service.crawl_and_store(
+        url="https://crawl4ai.com/mkdocs/", generate_summaries=False
+    )
+    
+    assert result["duplicate_count"] == 1
+    documents = mock_embedding_service.batch_embed_documents.call_args[0][0]
+    assert len(documents) == 2
+    assert documents[1]["metadata"]["aliases"] == [
+        "https://crawl4ai.com/mkdocs/getting-started/#install"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recrawl_only_stores_what_changed(
+    settings,
+    mock_crawl4ai_client,
+    mock_embedding_service,
+    mock_summarization_service,
+):
+    """
+    Test that a re-crawl skips unchanged pages, replaces changed ones and
+    deletes pages that disappeared.
+    """
+    service = DocumentationCrawlerService(
+        settings=settings,
+        crawl4ai_client=mock_crawl4ai_client,
+        embedding_service=mock_embedding_service,
+        summarization_service=mock_summarization_service,
+    )
+    await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    result = await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    assert result["skipped_count"] == 2
+    assert result["embedded_count"] == 0
+    assert mock_embedding_service.batch_embed_documents.call_count == 1
+    
+    # The second page changes and the first one disappears
+    mock_crawl4ai_client.fetch_crawl_results.return_value = [{
+        "url": "https://crawl4ai.com/mkdocs/getting-started/",
+        "title": "Getting Started",
+        "content": "Test content 2, revised",
+    }]
+    mock_embedding_service.batch_embed_documents.return_value = [{
+        "doc_id": "doc-id-4",
+        "vector_id": "vector-id-2",
+        "vector_ids": ["vector-id-2", "vector-id-4"],
+        "success": True,
+        "error": None,
+    }]
+    
+    result = await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    assert result["updated_count"] == 1
+    assert result["deleted_count"] == 1
+    assert result["skipped_count"] == 0
+    # Stale objects of all pages go in one batch delete
+    mock_embedding_service.delete_documents.assert_called_once_with(
+        ["vector-id-1", "vector-id-3"], "crawl4ai.com"
+    )
+
+
+@pytest.mark.asyncio
+async def test_recrawl_restores_pages_missing_from_the_store(
+    settings,
+    mock_crawl4ai_client,
+    mock_embedding_service,
+    mock_summarization_service,
+):
+    """
+    Test that a re-crawl stores unchanged pages again when their objects were
+    deleted from the vector database.
+    """
+    service = DocumentationCrawlerService(
+        settings=settings,
+        crawl4ai_client=mock_crawl4ai_client,
+        embedding_service=mock_embedding_service,
+        summarization_service=mock_summarization_service,
+    )
+    await service.crawl_and_store(
+        url="https://crawl4ai.com/mkdocs/", generate_summaries=False
+    )
+    
+    # The second page's objects are gone
+    mock_embedding_service.existing_ids.side_effect = (
+        lambda vector_ids, source: set(vector_ids) - {"vector-id-3"}
+    )
+    mock_embedding_service.batch_embed_documents.return_value = [
+        mock_embedding_service.batch_embed_documents.return_value[1]
+    ]
+    
+    result = await service.crawl_and_store(
+        url="https://crawl4ai.com/mkdocs/", generate_summaries=False
+    )
+    
+    assert result["skipped_count"] == 1
+    assert result["embedded_count"] == 1
+    documents = mock_embedding_service.batch_embed_documents.call_args[0][0]
+    assert [doc["metadata"]["url"] for doc in documents] == [
+        "https://crawl4ai.com/mkdocs/getting-started/"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_summary_nodes_are_indexed_and_replaced_with_their_page(
+    settings,
+    mock_crawl4ai_client,
+    mock_embedding_service,
+    mock_summarization_service,
+):
+    """
+    Test that summary tree nodes are indexed per page and deleted with the page.
+    """
+    mock_embedding_service.index_summary.side_effect = (
+        lambda summary_id, tree, metadata: [f"node:{summary_id}:{metadata['url']}"]
+    )
+    service = DocumentationCrawlerService(
+        settings=settings,
+        crawl4ai_client=mock_crawl4ai_client,
+        embedding_service=mock_embedding_service,
+        summarization_service=mock_summarization_service,
+    )
+    await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    assert mock_embedding_service.index_summary.call_count == 2
+    
+    # The second page changes and the first one disappears
+    mock_crawl4ai_client.fetch_crawl_results.return_value = [{
+        "url": "https://crawl4ai.com/mkdocs/getting-started/",
+        "title": "Getting Started",
+        "content": "Test content 2, revised",
+    }]
+    mock_embedding_service.batch_embed_documents.return_value = [{
+        "doc_id": "doc-id-4",
+        "vector_id": "vector-id-2",
+        "vector_ids": ["vector-id-2", "vector-id-3"],
+        "success": True,
+        "error": None,
+    }]
+    mock_summarization_service.generate_summary.return_value = (
+        "summary-id-2", "Revised summary", {}
+    )
+    
+    await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    deleted = mock_embedding_service.delete_documents.call_args[0][0]
+    assert deleted == [
+        "node:summary-id:https://crawl4ai.com/mkdocs/",
+        "node:summary-id:https://crawl4ai.com/mkdocs/getting-started/",
+        "vector-id-1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_crawling_another_path_keeps_the_source_pages(
+    settings,
+    mock_crawl4ai_client,
+    mock_embedding_service,
+    mock_summarization_service,
+):
+    """
+    Test that crawling another path of a host does not delete earlier pages.
+    """
+    service = DocumentationCrawlerService(
+        settings=settings,
+        crawl4ai_client=mock_crawl4ai_client,
+        embedding_service=mock_embedding_service,
+        summarization_service=mock_summarization_service,
+    )
+    await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    mock_crawl4ai_client.fetch_crawl_results.return_value = [{
+        "url": "https://crawl4ai.com/api/",
+        "title": "API",
+        "content": "API reference",
+    }]
+    mock_embedding_service.batch_embed_documents.return_value = [{
+        "doc_id": "doc-id-4",
+        "vector_id": "vector-id-4",
+        "vector_ids": ["vector-id-4"],
+        "success": True,
+        "error": None,
+    }]
+    
+    result = await service.crawl_and_store(url="https://crawl4ai.com/api/")
+    
+    assert result["deleted_count"] == 0
+    mock_embedding_service.delete_documents.assert_not_called()
+    
+    # Re-crawling the first path still only touches its own pages
+    mock_crawl4ai_client.fetch_crawl_results.return_value = [{
+        "url": "https://crawl4ai.com/mkdocs/",
+        "title": "Crawl4AI Documentation",
+        "content": "Test content 1",
+    }]
+    
+    result = await service.crawl_and_store(url="https://crawl4ai.com/mkdocs/")
+    
+    assert result["deleted_count"] == 1
+    deleted = mock_embedding_service.delete_documents.call_args[0][0]
+    assert "vector-id-4" not in deleted
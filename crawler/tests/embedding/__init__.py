@@ -0,0 +1,3 @@
+"""
+Tests for the embedding module.
+"""
\ No newline at end of file
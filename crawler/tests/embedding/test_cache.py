@@ -0,0 +1,61 @@
+"""
+Tests for the search result cache.
+"""
+
+import time
+
+from src.embedding.cache import SearchCache, make_search_key
+
+
+def test_make_search_key_normalizes_query():
+    """
+    Test that case and whitespace differences share a cache key.
+    """
+    assert make_search_key(" Crawl\tConfig ", 5) == make_search_key("crawl config", 5)
+    assert make_search_key("crawl", 5) != make_search_key("crawl", 10)
+    assert make_search_key("crawl", 5, {"source": "a"}) != make_search_key("crawl", 5)
+
+
+def test_cache_evicts_least_recently_used():
+    """
+    Test that the least recently used entry is evicted when the cache is full.
+    """
+    cache = SearchCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1, cache.generation)
+    cache.put("b", 2, cache.generation)
+    cache.get("a")
+    cache.put("c", 3, cache.generation)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_entries_expire():
+    """
+    Test that entries are not served after their TTL.
+    """
+    cache = SearchCache(max_entries=2, ttl_seconds=0.01)
+    cache.put("a", 1, cache.generation)
+    time.sleep(0.02)
+    
+    assert cache.get("a") is None
+
+
+def test_cache_invalidation_drops_stale_results():
+    """
+    Test that writes invalidate entries and results computed before them.
+    """
+    cache = SearchCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1, cache.generation)
+    generation = cache.generation
+    
+    cache.invalidate()
+    cache.put("b", 2, generation)
+    
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["generation"] == 1
+    assert stats["hits"] == 0
+    assert stats["misses"] == 2
@@ -0,0 +1,79 @@
+"""
+Tests for the document chunker.
+"""
+
+import pytest
+
+from src.embedding.chunking import DocumentChunker, estimate_tokens, group_chunks
+from src.utils.config import Settings
+
+
+@pytest.fixture
+def chunker():
+    """
+    Create a chunker with small chunks.
+    """
+    return DocumentChunker(Settings(chunk_size_tokens=10, chunk_overlap_tokens=2))
+
+
+def test_split_long_section_with_overlap(chunker):
+    """
+    Test that a long section is split into overlapping chunks of bounded size.
+    """
+    content = " ".join(f"word{i}" for i in range(25))
+    
+    chunks = chunker.split(content)
+    
+    assert [c["chunk_index"] for c in chunks] == [0, 1, 2]
+    assert all(estimate_tokens(c["content"]) <= 10 for c in chunks)
+    assert chunks[0]["content"].split()[-2:] == chunks[1]["content"].split()[:2]
+    for chunk in chunks:
+        assert content[chunk["start_offset"]:chunk["end_offset"]] == chunk["content"]
+    assert chunks[-1]["end_offset"] == len(content)
+
+
+def test_split_breaks_at_headings(chunker):
+    """
+    Test that chunks start at headings and short sections are merged.
+    """
+    content = "# Intro\nshort text\n## Setup\nsome more\n## Usage\n" + "step " * 8
+    
+    chunks = chunker.split(content)
+    
+    assert chunks[0]["content"].startswith("# Intro")
+    assert "## Setup" in chunks[0]["content"]
+    assert chunks[1]["content"].startswith("## Usage")
+
+
+def test_chunk_documents_adds_position_metadata(chunker):
+    """
+    Test that chunk documents keep page metadata and point back to their page.
+    """
+    documents = [
+        {"content": "one two", "metadata": {"url": "https://a"}},
+        {"content": " ".join(["x"] * 15), "metadata": {"url": "https://b"}},
+    ]
+    
+    chunks = chunker.chunk_documents(documents)
+    
+    assert [c["document_index"] for c in chunks] == [0, 1, 1]
+    assert chunks[2]["metadata"]["parent_url"] == "https://b"
+    assert chunks[2]["metadata"]["url"] == "https://b"
+    assert chunks[2]["metadata"]["chunk_index"] == 1
+
+
+def test_group_chunks_by_page():
+    """
+    Test that chunk results are merged into one result per page.
+    """
+    results = [
+        {"id": "a1", "parent_url": "https://a", "chunk_index": 3, "score": 0.9},
+        {"id": "b0", "parent_url": "https://b", "chunk_index": 0, "score": 0.8},
+        {"id": "a0", "parent_url": "https://a", "chunk_index": 0, "score": 0.7},
+    ]
+    
+    pages = group_chunks(results, limit=10)
+    
+    assert [page["id"] for page in pages] == ["a1", "b0"]
+    assert [chunk["id"] for chunk in pages[0]["chunks"]] == ["a0", "a1"]
+    assert len(group_chunks(results, limit=1)) == 1
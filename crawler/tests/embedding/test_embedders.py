@@ -0,0 +1,65 @@
+"""
+Tests for the client-side embedders.
+"""
+
+import numpy as np
+import pytest
+
+from src.embedding.embedders import (
+    Embedder,
+    HashingEmbedder,
+    QueryVectorCache,
+    create_embedder,
+)
+from src.utils.config import Settings
+
+
+def test_hashing_embedder_is_deterministic():
+    """
+    Test that equal texts get equal unit vectors across batches.
+    """
+    embedder = HashingEmbedder(dimension=32, batch_size=2)
+    
+    vectors = embedder.embed(["crawl the docs", "other text", "crawl the docs", ""])
+    
+    assert vectors.shape == (4, 32)
+    assert vectors.dtype == np.float32
+    assert np.allclose(vectors[0], vectors[2])
+    assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+    assert not vectors[3].any()
+
+
+def test_query_vector_cache_skips_embedding():
+    """
+    Test that repeated queries reuse the cached vector.
+    """
+    embedder = HashingEmbedder(dimension=8, batch_size=4)
+    cache = QueryVectorCache(embedder, max_entries=1)
+    
+    first = cache.get_vector("Crawl docs")
+    second = cache.get_vector("crawl  docs")
+    cache.get_vector("other")
+    
+    assert first == second
+    assert cache.stats() == {"size": 1, "max_entries": 1, "hits": 1, "misses": 2}
+
+
+def test_create_embedder_modes():
+    """
+    Test that the embedding mode selects the embedder.
+    """
+    assert create_embedder(Settings()) is None
+    assert isinstance(create_embedder(Settings(embedding_mode="hashing")), HashingEmbedder)
+    with pytest.raises(ValueError):
+        create_embedder(Settings(embedding_mode="unknown"))
+
+
+def test_embedder_subclass_must_implement_embed_batch():
+    """
+    Test that an embedder without _embed_batch cannot be created.
+    """
+    class IncompleteEmbedder(Embedder):
+        """Embedder that forgot to implement _embed_batch."""
+    
+    with pytest.raises(TypeError):
+        IncompleteEmbedder(dimension=8, batch_size=4)
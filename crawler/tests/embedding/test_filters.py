@@ -0,0 +1,57 @@
+"""
+Tests for the where filter builder.
+"""
+
+import pytest
+
+from src.embedding.filters import build_where
+
+
+def test_single_filter_is_a_plain_condition():
+    """
+    Test that one filter needs no logical operator.
+    """
+    assert build_where({"source": "crawl4ai"}) == {
+        "path": ["source"], "operator": "Equal", "valueText": "crawl4ai"
+    }
+    assert build_where({}) is None
+
+
+def test_compound_filters_build_an_operand_tree():
+    """
+    Test that several filters are joined with And and groups nest Or.
+    """
+    where = build_where({
+        "source": "crawl4ai",
+        "version": ["0.4", "0.5"],
+        "any": [
+            {"url": {"operator": "Like", "value": "https://docs/api/*"}},
+            {"title": "Quickstart"},
+        ],
+    })
+    
+    assert where["operator"] == "And"
+    source, version, group = where["operands"]
+    assert source["valueText"] == "crawl4ai"
+    assert version == {
+        "path": ["version"], "operator": "ContainsAny", "valueTextArray": ["0.4", "0.5"]
+    }
+    assert group["operator"] == "Or"
+    assert group["operands"][0]["operator"] == "Like"
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"content": "secret"},
+        {"url": {"operator": "GreaterThan", "value": "a"}},
+        {"source": {"operator": "ContainsAny", "value": "a"}},
+        {"any": {"source": "a"}},
+    ],
+)
+def test_invalid_filters_are_rejected(filters):
+    """
+    Test that invalid filters raise instead of being dropped.
+    """
+    with pytest.raises(ValueError):
+        build_where(filters)
@@ -0,0 +1,296 @@
+"""
+Tests for the embedded vector store.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.embedding import local_store
+from src.embedding.local_store import LocalVectorStore, create_vector_client
+from src.embedding.service import EmbeddingService
+from src.utils.config import Settings
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """
+    Settings for a local store in a temporary directory.
+    """
+    return Settings(
+        vector_backend="local",
+        local_vector_store_dir=str(tmp_path / "store"),
+        embedding_mode="hashing",
+        embedding_dimension=64,
+    )
+
+
+@pytest.fixture
+def store(settings):
+    """
+    Open a local store with a few documents.
+    """
+    store = LocalVectorStore(settings)
+    store.batch_add_documents([
+        {
+            "content": "Install the crawler with pip install crawl4ai",
+            "metadata": {"title": "Installation", "url": "https://a/install", "source": "a"},
+        },
+        {
+            "content": "Configure the browser and proxy settings",
+            "metadata": {"title": "Configuration", "url": "https://a/config", "source": "a"},
+        },
+        {
+            "content": "Deploy the service with docker compose",
+            "metadata": {"title": "Deployment", "url": "https://b/deploy", "source": "b"},
+        },
+    ])
+    yield store
+    store.close()
+
+
+def test_vector_search_ranks_the_closest_document_first(store):
+    """
+    Test that exact vector search returns the best matching document first.
+    """
+    results, total = store.search_similar("pip install crawl4ai", limit=2)
+    
+    assert total == 2
+    assert results[0]["metadata"]["title"] == "Installation"
+    assert results[0]["score"] > results[1]["score"]
+    assert 0.0 <= results[1]["score"] <= 1.0
+
+
+def test_query_is_embedded_without_holding_the_store_lock(store):
+    """
+    Test that a slow query embedding does not block other readers and writers.
+    """
+    get_vector = store.query_vectors.get_vector
+    acquired = []
+    
+    def try_lock():
+        """Take and release the store lock if it is free."""
+        acquired.append(store._lock.acquire(timeout=1))
+        if acquired[-1]:
+            store._lock.release()
+    
+    def embed_query(query):
+        """Check from another thread that the store lock is free."""
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        return get_vector(query)
+    
+    store.query_vectors.get_vector = embed_query
+    results, _ = store.search_similar("pip install crawl4ai", limit=1)
+    
+    assert acquired == [True]
+    assert results[0]["metadata"]["title"] == "Installation"
+
+
+def test_vector_scan_runs_without_the_store_lock(store):
+    """
+    Test that writes proceed during a scan and rows they touch are not returned.
+    """
+    scan = store._vector_scores
+    acquired = []
+    
+    def try_lock():
+        """Take and release the store lock if it is free."""
+        acquired.append(store._lock.acquire(timeout=1))
+        if acquired[-1]:
+            store._lock.release()
+    
+    def scan_and_write(vectors, vector, limit, mask):
+        """Score the rows, then delete one while the scan is still running."""
+        scores = scan(vectors, vector, limit, mask)
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        store.delete_where(source="b")
+        return scores
+    
+    store._vector_scores = scan_and_write
+    results, _ = store.search_similar("deploy with docker", limit=3)
+    
+    assert acquired == [True]
+    assert len(results) == 2
+    assert "b" not in [result["metadata"]["source"] for result in results]
+
+
+def test_filters_and_keyword_search(store):
+    """
+    Test that filters restrict vector and keyword results.
+    """
+    results, _ = store.search_similar("install", filters={"source": "b"})
+    assert [result["metadata"]["source"] for result in results] == ["b"]
+    
+    results, _ = store.search_similar(
+        "docker", mode="keyword", filters={"url": {"operator": "Like", "value": "https://b/*"}}
+    )
+    assert [result["metadata"]["title"] for result in results] == ["Deployment"]
+    
+    results, _ = store.search_similar("docker", mode="keyword", filters={"source": "a"})
+    assert results == []
+    
+    with pytest.raises(ValueError):
+        store.search_similar("install", filters={"content": "x"})
+
+
+def test_store_persists_and_reuses_deleted_rows(settings, store):
+    """
+    Test that documents survive a reopen and deleted rows are reused.
+    """
+    result = store.delete_where(source="a")
+    assert result == {"matched": 2, "deleted": 2, "failed": 0, "dry_run": False}
+    store.close()
+    
+    reopened = LocalVectorStore(settings)
+    try:
+        assert reopened.stats()["documents"] == 1
+        assert reopened.stats()["free_rows"] == 2
+        
+        reopened.add_document("Upgrade guide", {"title": "Upgrade", "source": "c"})
+        
+        assert reopened.stats()["free_rows"] == 1
+        results, _ = reopened.search_similar("upgrade guide", limit=1)
+        assert results[0]["metadata"]["title"] == "Upgrade"
+    finally:
+        reopened.close()
+
+
+def test_store_grows_past_its_initial_capacity(settings, monkeypatch):
+    """
+    Test that the vector file is enlarged when it is full.
+    """
+    monkeypatch.setattr(local_store, "INITIAL_CAPACITY", 4)
+    store = create_vector_client(settings)
+    try:
+        results = store.batch_add_documents(
+            [{"content": f"page {i}", "metadata": {"url": f"u{i}"}} for i in range(10)]
+        )
+        
+        assert all(result["success"] for result in results)
+        assert store.stats()["capacity"] == 16
+        found, _ = store.search_similar("page 7", limit=1)
+        assert found[0]["content"] == "page 7"
+    finally:
+        store.close()
+
+
+def test_update_documents_merges_properties_in_one_call(store):
+    """
+    Test that several documents are updated together, or not at all.
+    """
+    results, _ = store.search_similar("crawler", limit=10, filters={"source": "a"})
+    ids = [result["id"] for result in results]
+    
+    assert store.update_documents(ids, {"summary_id": "summary-id"}) == 2
+    with pytest.raises(KeyError):
+        store.update_documents([ids[0], "missing"], {"summary_id": "other"})
+    
+    results, _ = store.search_similar("crawler", limit=10, filters={"source": "a"})
+    assert [result["summary_id"] for result in results] == ["summary-id"] * 2
+
+
+def test_local_backend_requires_client_side_embeddings(settings):
+    """
+    Test that the local backend refuses Weaviate-side vectorization.
+    """
+    with pytest.raises(ValueError):
+        LocalVectorStore(settings.model_copy(update={"embedding_mode": "weaviate"}))
+
+
+@pytest.mark.asyncio
+async def test_collapsed_tree_search_returns_chunks_and_summary_nodes(settings, store):
+    """
+    Test that summary nodes are only searched together with chunks on request.
+    """
+    service = EmbeddingService(settings, weaviate_client=store)
+    tree = {
+        "level": 1,
+        "content": "The crawler is installed with pip and configured per browser",
+        "children": [],
+    }
+    node_ids = await service.index_summary(
+        "summary-id", tree, {"title": "Guide", "url": "https://a/guide", "source": "a"}
+    )
+    
+    results, _ = await service.search("crawler install pip", limit=10)
+    assert node_ids[0] not in [result["id"] for result in results]
+    assert len(results) == 3
+    
+    results, _ = await service.search("crawler install pip", limit=10, collapsed_tree=True)
+    nodes = [result for result in results if result["id"] == node_ids[0]]
+    assert len(results) == 4
+    assert nodes[0]["node_type"] == "summary"
+    assert nodes[0]["summary_id"] == "summary-id"
+    assert nodes[0]["level"] == 1
+
+
+def test_summary_nodes_are_excluded_without_sql(settings, store):
+    """
+    Test that the default chunk-only filter is applied from memory.
+    """
+    (summary,) = store.batch_add_documents([{
+        "content": "Install and deploy the crawler",
+        "metadata": {"title": "Summary", "source": "a", "node_type": "summary"},
+    }])
+    statements = []
+    store._db.set_trace_callback(statements.append)
+    
+    exclude = {"node_type": {"operator": "NotEqual", "value": "summary"}}
+    results, _ = store.search_similar("install deploy crawler", limit=10, filters=exclude)
+    
+    assert summary["vector_id"] not in [result["id"] for result in results]
+    assert len(results) == 3
+    assert not any("SELECT row FROM documents WHERE" in sql for sql in statements)
+    
+    # Other filters still go to SQLite and combine with the exclusion
+    results, _ = store.search_similar(
+        "install deploy crawler", limit=10, filters={**exclude, "source": "a"}
+    )
+    assert [result["metadata"]["source"] for result in results] == ["a", "a"]
+    
+    store._db.set_trace_callback(None)
+    store.update_document(summary["vector_id"], {"node_type": None})
+    results, _ = store.search_similar("install deploy crawler", limit=10, filters=exclude)
+    assert len(results) == 4
+    store.update_document(summary["vector_id"], {"node_type": "summary"})
+    store.close()
+    
+    reopened = LocalVectorStore(settings)
+    try:
+        results, _ = reopened.search_similar("install deploy", limit=10, filters=exclude)
+        assert len(results) == 3
+    finally:
+        reopened.close()
+
+
+def test_embedding_service_creates_and_closes_the_configured_backend(settings):
+    """
+    Test that a service without an injected client follows vector_backend.
+    """
+    service = EmbeddingService(settings)
+    
+    assert isinstance(service.weaviate_client, LocalVectorStore)
+    service.close()
+    
+    shared = LocalVectorStore(settings)
+    try:
+        EmbeddingService(settings, weaviate_client=shared).close()
+        assert shared.search_similar("crawler") == ([], 0)
+    finally:
+        shared.close()
+
+
+def test_stored_vectors_are_normalized(store):
+    """
+    Test that vectors are stored unit-length whatever the embedder returns.
+    """
+    store.batch_add_documents([{"content": "scaled", "metadata": {"url": "https://c/"}}])
+    store._insert([("raw-id", {"content": "raw"}, [3.0] + [0.0] * 63)])
+    
+    norms = np.linalg.norm(store._vectors[:store._end], axis=1)
+    assert np.allclose(norms, 1.0, atol=1e-5)
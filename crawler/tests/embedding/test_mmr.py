@@ -0,0 +1,35 @@
+"""
+Tests for MMR reranking.
+"""
+
+import numpy as np
+
+from src.embedding.mmr import diversify, mmr_select
+
+
+def test_mmr_select_skips_near_duplicates():
+    """
+    Test that a near-duplicate of the best candidate is picked last.
+    """
+    vectors = np.array([[1.0, 0.0], [0.99, 0.01], [0.0, 1.0]])
+    relevance = np.array([1.0, 0.95, 0.6])
+    
+    assert mmr_select(relevance, vectors, 2, lambda_mult=0.5) == [0, 2]
+    assert mmr_select(relevance, vectors, 2, lambda_mult=1.0) == [0, 1]
+    assert mmr_select(relevance, vectors, 5, lambda_mult=0.5) == [0, 2, 1]
+
+
+def test_diversify_drops_vectors():
+    """
+    Test that reranked results keep their fields but not their vectors.
+    """
+    results = [
+        {"id": "a", "score": 0.9, "vector": [1.0, 0.0]},
+        {"id": "a-copy", "score": 0.89, "vector": [1.0, 0.0]},
+        {"id": "b", "score": 0.7, "vector": [0.0, 1.0]},
+    ]
+    
+    diverse = diversify(results, 2, lambda_mult=0.5)
+    
+    assert diverse == [{"id": "a", "score": 0.9}, {"id": "b", "score": 0.7}]
+    assert "vector" in results[0]
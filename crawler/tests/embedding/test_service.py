@@ -0,0 +1,265 @@
+"""
+Tests for the EmbeddingService.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.crawl4ai.manifest import CrawlManifest
+from src.embedding.cache import SearchCache
+from src.embedding.executor import BoundedExecutor
+from src.embedding.service import EmbeddingService, summary_node_documents
+from src.embedding.weaviate import WeaviateClient
+from src.utils.config import Settings
+
+
+@pytest.fixture
+def mock_weaviate_client():
+    """
+    Create a mock Weaviate client whose calls block like the real one.
+    """
+    client = MagicMock()
+    client.search_executor = BoundedExecutor("search", 2)
+    client.ingest_executor = BoundedExecutor("ingest", 1)
+    client.search_cache = None
+    
+    def slow_batch_add(documents):
+        """Block the calling thread like a slow vectorizer."""
+        time.sleep(0.3)
+        return [
+            {"doc_id": "doc-id", "vector_id": "vector-id", "success": True, "error": None}
+        ] * len(documents)
+    
+    client.batch_add_documents.side_effect = slow_batch_add
+    client.search_similar.return_value = ([], 0)
+    yield client
+    client.search_executor.shutdown()
+    client.ingest_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_search_is_served_during_batch_ingest(mock_weaviate_client):
+    """
+    Test that a blocking batch ingest does not block the event loop or searches.
+    """
+    service = EmbeddingService(Settings(), weaviate_client=mock_weaviate_client)
+    
+    ingest = asyncio.create_task(
+        service.batch_embed_documents([{"content": "Test content"}])
+    )
+    await asyncio.sleep(0.05)
+    
+    started = time.monotonic()
+    results, total = await service.search("crawl")
+    elapsed = time.monotonic() - started
+    
+    assert not ingest.done()
+    assert elapsed < 0.2
+    assert (results, total) == ([], 0)
+    assert [r["vector_id"] for r in await ingest] == ["vector-id"]
+
+
+@pytest.mark.asyncio
+async def test_batch_embed_documents_chunks_pages(mock_weaviate_client):
+    """
+    Test that pages are stored as chunks and results are reported per page.
+    """
+    def batch_add(documents):
+        """Report every chunk as stored except those of the failing page."""
+        return [
+            {
+                "doc_id": "chunk",
+                "vector_id": f"vector-{i}",
+                "success": doc["metadata"]["url"] != "https://fail",
+                "error": None if doc["metadata"]["url"] != "https://fail" else "rejected",
+            }
+            for i, doc in enumerate(documents)
+        ]
+    
+    mock_weaviate_client.batch_add_documents.side_effect = batch_add
+    settings = Settings(chunk_size_tokens=10, chunk_overlap_tokens=0)
+    service = EmbeddingService(settings, weaviate_client=mock_weaviate_client)
+    
+    results = await service.batch_embed_documents([
+        {"content": " ".join(["x"] * 25), "metadata": {"url": "https://long"}},
+        {"content": "short", "metadata": {"url": "https://fail"}},
+    ])
+    
+    assert results[0]["vector_ids"] == ["vector-0", "vector-1", "vector-2"]
+    assert results[0]["vector_id"] == "vector-0"
+    assert results[0]["success"] is True
+    assert results[1]["success"] is False
+    assert results[1]["error"] == "rejected"
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_cached_until_a_write(mock_weaviate_client):
+    """
+    Test that repeated searches are served from the cache until data changes.
+    """
+    mock_weaviate_client.search_cache = SearchCache(max_entries=10, ttl_seconds=60)
+    service = EmbeddingService(Settings(), weaviate_client=mock_weaviate_client)
+    
+    first = await service.search("Crawl  Config", limit=5)
+    second = await service.search("crawl config", limit=5)
+    await service.search("crawl config", limit=10)
+    
+    assert first == second
+    assert mock_weaviate_client.search_similar.call_count == 2
+    
+    mock_weaviate_client.search_cache.invalidate()
+    await service.search("crawl config", limit=5)
+    
+    assert mock_weaviate_client.search_similar.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_batch_sends_only_uncached_searches(mock_weaviate_client):
+    """
+    Test that a batch search skips cached searches and keeps request order.
+    """
+    mock_weaviate_client.search_cache = SearchCache(max_entries=10, ttl_seconds=60)
+    mock_weaviate_client.search_many.side_effect = lambda searches: [
+        ([{"id": search["query"], "score": 1.0}], 1) for search in searches
+    ]
+    service = EmbeddingService(Settings(), weaviate_client=mock_weaviate_client)
+    await service.search_batch([{"query": "cached"}])
+    
+    responses = await service.search_batch([
+        {"query": "first", "limit": 3},
+        {"query": "cached"},
+        {"query": "last", "filters": None},
+    ])
+    
+    assert [results[0]["id"] for results, _ in responses] == ["first", "cached", "last"]
+    sent = mock_weaviate_client.search_many.call_args.args[0]
+    assert [search["query"] for search in sent] == ["first", "last"]
+    
+    with pytest.raises(ValueError):
+        await service.search_batch([])
+
+
+@pytest.mark.asyncio
+async def test_search_projects_fields_and_snippets(mock_weaviate_client):
+    """
+    Test that searches fetch only the projected fields and return snippets.
+    """
+    mock_weaviate_client.search_similar.return_value = ([{
+        "id": "1",
+        "content": "the crawler follows links",
+        "metadata": {"title": "Links", "url": "https://a"},
+        "score": 0.8,
+    }], 1)
+    service = EmbeddingService(Settings(), weaviate_client=mock_weaviate_client)
+    
+    results, _ = await service.search("crawler", fields=["title"], snippet_length=100)
+    
+    kwargs = mock_weaviate_client.search_similar.call_args.kwargs
+    assert kwargs["properties"] == ["content", "title", "url"]
+    assert results[0]["content"] is None
+    assert results[0]["metadata"] == {"title": "Links"}
+    assert results[0]["snippet"]["highlights"] == [(4, 11)]
+
+
+@pytest.mark.asyncio
+async def test_search_diversifies_with_mmr(mock_weaviate_client):
+    """
+    Test that MMR over-fetches candidates with vectors and returns a diverse top-k.
+    """
+    mock_weaviate_client.search_similar.return_value = ([
+        {"id": "a", "metadata": {}, "score": 0.9, "vector": [1.0, 0.0]},
+        {"id": "a-copy", "metadata": {}, "score": 0.9, "vector": [1.0, 0.0]},
+        {"id": "b", "metadata": {}, "score": 0.6, "vector": [0.0, 1.0]},
+    ], 3)
+    service = EmbeddingService(Settings(mmr_oversample=4), weaviate_client=mock_weaviate_client)
+    
+    results, total = await service.search("crawl", limit=2, mmr_lambda=0.5)
+    
+    kwargs = mock_weaviate_client.search_similar.call_args.kwargs
+    assert kwargs["limit"] == 8
+    assert kwargs["with_vector"] is True
+    assert [result["id"] for result in results] == ["a", "b"]
+    assert total == 2
+    assert "vector" not in results[0]
+
+
+def test_summary_node_documents_link_children_to_parents():
+    """
+    Test that a summary tree is flattened into linked node documents.
+    """
+    tree = {
+        "level": 1,
+        "content": "Overview",
+        "children": [
+            {"level": 2, "topic": "Install", "content": "pip install", "children": []},
+            {"level": 2, "topic": "Empty", "content": "", "children": []},
+        ],
+    }
+    page = {"title": "Guide", "url": "https://a/guide", "source": "a", "version": "1"}
+    
+    root, child = summary_node_documents("summary-id", tree, page)
+    
+    assert root["metadata"]["node_type"] == "summary"
+    assert root["metadata"]["level"] == 1
+    assert "parent_id" not in root["metadata"]
+    assert child["metadata"]["topic"] == "Install"
+    assert child["metadata"]["summary_id"] == "summary-id"
+    assert child["metadata"]["parent_url"] == "https://a/guide"
+    assert child["metadata"]["parent_id"] == WeaviateClient._object_id(
+        root["content"], root["metadata"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_includes_summary_nodes_only_in_collapsed_tree(mock_weaviate_client):
+    """
+    Test that summary nodes are filtered out unless the search spans the tree.
+    """
+    service = EmbeddingService(Settings(), weaviate_client=mock_weaviate_client)
+    
+    await service.search("crawl", filters={"source": "a"})
+    assert mock_weaviate_client.search_similar.call_args.kwargs["filters"] == {
+        "source": "a",
+        "node_type": {"operator": "NotEqual", "value": "summary"},
+    }
+    
+    await service.search("crawl", filters={"source": "a"}, collapsed_tree=True)
+    assert mock_weaviate_client.search_similar.call_args.kwargs["filters"] == {"source": "a"}
+    
+    await service.search("crawl", filters={"node_type": "summary"})
+    assert mock_weaviate_client.search_similar.call_args.kwargs["filters"] == {
+        "node_type": "summary"
+    }
+
+
+@pytest.mark.asyncio
+async def test_deleting_documents_forgets_their_crawled_pages(
+    mock_weaviate_client, tmp_path
+):
+    """
+    Test that deleted documents are forgotten by the crawl manifests, so the
+    next crawl stores them again.
+    """
+    settings = Settings(crawl_manifest_dir=str(tmp_path))
+    manifest = CrawlManifest(settings.crawl_manifest_dir, "docs.example.com")
+    for url in ("https://x/guide/a", "https://x/api/b"):
+        document = {"content": url, "metadata": {"url": url, "version": "latest"}}
+        manifest.record(document, [f"id:{url}"])
+    manifest.save()
+    mock_weaviate_client.delete_where.return_value = {"matched": 1, "deleted": 1}
+    mock_weaviate_client.delete_document.return_value = True
+    service = EmbeddingService(settings, weaviate_client=mock_weaviate_client)
+    
+    await service.delete_by_filter(url_prefix="https://x/guide/", dry_run=True)
+    assert len(CrawlManifest(str(tmp_path), "docs.example.com").pages) == 2
+    
+    await service.delete_by_filter(url_prefix="https://x/guide/")
+    assert list(CrawlManifest(str(tmp_path), "docs.example.com").pages) == [
+        "https://x/api/b"
+    ]
+    
+    await service.delete_document("id:https://x/api/b", "docs.example.com")
+    assert CrawlManifest(str(tmp_path), "docs.example.com").pages == {}
@@ -0,0 +1,62 @@
+"""
+Tests for search result projection and snippets.
+"""
+
+from src.embedding.snippets import make_snippet, project_results, search_properties
+
+
+def test_make_snippet_picks_densest_window():
+    """
+    Test that the snippet covers the densest run of query terms.
+    """
+    content = "crawl once. " + "filler words " * 40 + "crawl depth and crawl delay settings"
+    
+    snippet = make_snippet(content, "Crawl delay", length=60)
+    
+    assert "crawl depth and crawl delay" in snippet["text"]
+    assert content[snippet["start_offset"]:snippet["end_offset"]] == snippet["text"]
+    assert len(snippet["highlights"]) == 3
+    for start, end in snippet["highlights"]:
+        assert snippet["text"][start:end].lower() in ("crawl", "delay")
+
+
+def test_make_snippet_keeps_whole_words():
+    """
+    Test that snippets never start or end inside a word.
+    """
+    content = "alpha beta gamma delta epsilon zeta eta theta"
+    
+    snippet = make_snippet(content, "delta", length=17)
+    
+    assert snippet["text"].split() == [
+        word for word in snippet["text"].split() if word in content.split()
+    ]
+    assert "delta" in snippet["text"]
+
+
+def test_search_properties_adds_required_fields():
+    """
+    Test that projections fetch the URL and, for snippets, the content.
+    """
+    assert search_properties(None, 200) is None
+    assert search_properties(["title"]) == ["title", "url"]
+    assert search_properties(["title"], 200) == ["content", "title", "url"]
+
+
+def test_project_results_drops_unrequested_fields():
+    """
+    Test that snippet mode replaces the content and metadata is filtered.
+    """
+    results = [{
+        "id": "1",
+        "content": "how to configure the crawler",
+        "metadata": {"title": "Config", "url": "https://a", "source": "docs"},
+        "score": 0.9,
+    }]
+    
+    projected = project_results(results, "crawler", fields=["title"], snippet_length=100)
+    
+    assert projected[0]["content"] is None
+    assert projected[0]["metadata"] == {"title": "Config"}
+    assert projected[0]["snippet"]["text"] == "how to configure the crawler"
+    assert results[0]["content"] == "how to configure the crawler"
@@ -0,0 +1,76 @@
+"""
+Tests for per-source tenant partitioning.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from weaviate import Tenant, TenantActivityStatus
+
+from src.embedding import tenants as tenants_module
+from src.embedding.tenants import TenantRegistry, filter_sources, tenant_name
+
+
+def test_tenant_name_is_valid_and_distinct():
+    """
+    Test that sources map to valid tenant names without collisions.
+    """
+    assert tenant_name("crawl4ai") == "crawl4ai"
+    assert tenant_name(None) == "default"
+    assert tenant_name("docs.python.org").startswith("docs-python-org-")
+    assert tenant_name("docs.python.org") != tenant_name("docs-python.org")
+
+
+def test_filter_sources():
+    """
+    Test that only source conditions restrict the searched tenants.
+    """
+    assert filter_sources({"source": "a", "version": "1"}) == ["a"]
+    assert filter_sources({"source": ["a", "b"]}) == ["a", "b"]
+    assert filter_sources({"source": {"operator": "Like", "value": "a*"}}) is None
+    assert filter_sources({"version": "1"}) is None
+
+
+def test_registry_creates_missing_tenants_once():
+    """
+    Test that tenants are created on demand and inactive ones are not searched.
+    """
+    schema = MagicMock()
+    schema.get_class_tenants.return_value = [
+        Tenant(name="old", activity_status=TenantActivityStatus.COLD)
+    ]
+    registry = TenantRegistry(schema, "Documentation")
+    
+    registry.ensure(["new", "old"])
+    registry.ensure(["new"])
+    
+    schema.add_class_tenants.assert_called_once()
+    assert [t.name for t in schema.add_class_tenants.call_args.args[1]] == ["new"]
+    assert registry.active() == ["new"]
+    
+    registry.set_active("old", True)
+    assert registry.active(["old"]) == ["old"]
+    with pytest.raises(KeyError):
+        registry.set_active("missing", False)
+
+
+def test_registry_rereads_tenants_on_a_miss(monkeypatch):
+    """
+    Test that unknown tenants are looked up again, at most once per interval.
+    """
+    schema = MagicMock()
+    schema.get_class_tenants.return_value = [Tenant(name="old")]
+    registry = TenantRegistry(schema, "Documentation")
+    schema.get_class_tenants.return_value = [Tenant(name="old"), Tenant(name="new")]
+    
+    registry.refresh(["old"])
+    registry.refresh(["new"])
+    assert schema.get_class_tenants.call_count == 1
+    
+    monkeypatch.setattr(tenants_module, "REFRESH_INTERVAL_SECONDS", 0)
+    registry.refresh(["new"])
+    assert registry.active(["new"]) == ["new"]
+    
+    # Tenants another process created are not created again
+    registry.ensure(["new"])
+    schema.add_class_tenants.assert_not_called()
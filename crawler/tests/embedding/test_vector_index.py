@@ -0,0 +1,65 @@
+"""
+Tests for the vector index configuration.
+"""
+
+import pytest
+
+from src.embedding.vector_index import (
+    estimate_index_memory,
+    index_config_changes,
+    vector_index_config,
+)
+from src.utils.config import Settings
+
+
+def test_vector_index_config_quantization():
+    """
+    Test that the configured quantization is added to the HNSW settings.
+    """
+    settings = Settings(weaviate_vector_quantization="pq", weaviate_pq_segments=96)
+    
+    assert vector_index_config(settings)["pq"] == {
+        "enabled": True,
+        "trainingLimit": 100000,
+        "segments": 96,
+    }
+    assert "pq" not in vector_index_config(settings, with_pq=False)
+    assert vector_index_config(
+        Settings(weaviate_vector_quantization="bq")
+    )["bq"] == {"enabled": True}
+    
+    with pytest.raises(ValueError):
+        vector_index_config(Settings(weaviate_vector_quantization="sq"))
+
+
+def test_index_config_changes_splits_mutable_settings():
+    """
+    Test that query-time settings and PQ are updated in place while graph
+    settings are reported as fixed.
+    """
+    settings = Settings(
+        weaviate_hnsw_ef=256,
+        weaviate_hnsw_max_connections=32,
+        weaviate_vector_quantization="pq",
+    )
+    current = vector_index_config(Settings())
+    
+    changes = index_config_changes(current, settings)
+    
+    assert set(changes["update"]) == {"ef", "pq"}
+    assert changes["fixed"] == ["maxConnections"]
+    assert index_config_changes(current, Settings()) == {"update": {}, "fixed": []}
+
+
+def test_estimate_index_memory():
+    """
+    Test that compression shrinks the vector memory but not the graph.
+    """
+    full = estimate_index_memory(1000, 384, 64)
+    pq = estimate_index_memory(1000, 384, 64, "pq", 96)
+    bq = estimate_index_memory(1000, 384, 64, "bq")
+    
+    assert full["vectors"] == 1000 * 384 * 4
+    assert pq["vectors"] == 1000 * 96
+    assert bq["vectors"] == 1000 * 48
+    assert full["graph"] == pq["graph"] == bq["graph"]
@@ -0,0 +1,586 @@
+"""
+Tests for the WeaviateClient.
+"""
+
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from weaviate import Tenant
+from weaviate.exceptions import ObjectAlreadyExistsException
+from weaviate.gql.get import GetBuilder
+
+from src.embedding import tenants as tenants_module
+from src.embedding.cache import SearchCache
+from src.embedding.embedders import HashingEmbedder, QueryVectorCache
+from src.embedding.tenants import TenantRegistry
+from src.embedding.weaviate import DOC_CLASS_NAME, WeaviateClient
+from src.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.utils.config import Settings
+from src.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def weaviate_client():
+    """
+    Create a WeaviateClient around a mock Weaviate connection.
+    """
+    client = WeaviateClient.__new__(WeaviateClient)
+    client.client = MagicMock()
+    client.search_cache = SearchCache(max_entries=10, ttl_seconds=60)
+    client.embedder = None
+    client.query_vectors = None
+    client.tenants = None
+    client.breaker = CircuitBreaker("weaviate", failure_threshold=2, metrics=MetricsRegistry())
+    return client
+
+
+def mock_existing(client, ids):
+    """
+    Make the existence query of a mock Weaviate connection return the given IDs.
+    """
+    query = client.client.query.get.return_value
+    query.with_additional.return_value = query
+    query.with_where.return_value = query
+    query.with_limit.return_value = query
+    query.do.return_value = {
+        "data": {"Get": {DOC_CLASS_NAME: [{"_additional": {"id": i}} for i in ids]}}
+    }
+    return query
+
+
+def test_add_document_is_a_single_write(weaviate_client):
+    """
+    Test that a new document is stored without a prior lookup.
+    """
+    _, weaviate_id = weaviate_client.add_document("Test content", {"url": "u"})
+    
+    weaviate_client.client.data_object.get.assert_not_called()
+    weaviate_client.client.data_object.create.assert_called_once()
+    assert weaviate_client.search_cache.generation == 1
+    assert weaviate_id == WeaviateClient._object_id("Test content", {"url": "u"})
+
+
+def test_add_document_existing_object(weaviate_client):
+    """
+    Test that adding an existing document is idempotent.
+    """
+    weaviate_client.client.data_object.create.side_effect = (
+        ObjectAlreadyExistsException("exists")
+    )
+    
+    first = weaviate_client.add_document("Test content")
+    second = weaviate_client.add_document("Test content")
+    
+    assert first[1] == second[1]
+
+
+def test_existing_ids_uses_one_query(weaviate_client):
+    """
+    Test that many IDs are checked for existence in a single query.
+    """
+    query = mock_existing(weaviate_client, ["b"])
+    
+    assert weaviate_client.existing_ids(["a", "b", "c"]) == {"b"}
+    
+    query.do.assert_called_once()
+    where = query.with_where.call_args[0][0]
+    assert where["operator"] == "Or"
+    assert len(where["operands"]) == 3
+
+
+@pytest.fixture
+def mock_batch(weaviate_client):
+    """
+    Mock the Weaviate batcher, reporting objects through the configured callback.
+    """
+    weaviate_client.settings = Settings()
+    weaviate_client._batch_lock = threading.Lock()
+    batch = MagicMock()
+    batch.rejected = {}
+    
+    def configure(**kwargs):
+        """Capture the callback and return the batch context manager."""
+        batch.callback = kwargs["callback"]
+        return batch
+    
+    def add_data_object(data_object, class_name, uuid, vector=None, tenant=None):
+        """Report the object as stored or rejected."""
+        result = {"id": uuid, "result": {}}
+        if data_object["content"] in batch.rejected:
+            result["result"]["errors"] = {
+                "error": [{"message": batch.rejected[data_object["content"]]}]
+            }
+        batch.callback([result])
+    
+    weaviate_client.client.batch.side_effect = configure
+    batch.__enter__.return_value = batch
+    batch.add_data_object.side_effect = add_data_object
+    return batch
+
+
+def test_batch_add_documents_skips_existing(weaviate_client, mock_batch):
+    """
+    Test that batch ingest only writes objects that do not exist yet.
+    """
+    documents = [{"content": "old"}, {"content": "new"}]
+    
+    mock_existing(weaviate_client, [])
+    first = weaviate_client.batch_add_documents(documents)
+    mock_existing(weaviate_client, [first[0]["vector_id"]])
+    mock_batch.add_data_object.reset_mock()
+    
+    results = weaviate_client.batch_add_documents(documents)
+    
+    assert [r["vector_id"] for r in results] == [r["vector_id"] for r in first]
+    assert all(r["success"] for r in results)
+    mock_batch.add_data_object.assert_called_once()
+    assert mock_batch.add_data_object.call_args.kwargs["data_object"]["content"] == "new"
+
+
+def test_batch_add_documents_reports_failures(weaviate_client, mock_batch):
+    """
+    Test that objects rejected by Weaviate are reported per document.
+    """
+    mock_existing(weaviate_client, [])
+    mock_batch.rejected = {"bad": "vectorizer timeout"}
+    documents = [
+        {"content": "good", "metadata": {"url": "u"}},
+        {"content": "bad"},
+    ]
+    
+    results = weaviate_client.batch_add_documents(documents)
+    
+    assert results[0]["success"] is True
+    assert results[0]["vector_id"] == WeaviateClient._object_id("good", {"url": "u"})
+    assert results[1]["success"] is False
+    assert results[1]["error"] == "vectorizer timeout"
+    kwargs = weaviate_client.client.batch.call_args.kwargs
+    assert kwargs["dynamic"] is True
+    assert kwargs["num_workers"] == Settings().weaviate_batch_workers
+
+
+def test_batch_add_documents_connection_error(weaviate_client, mock_batch):
+    """
+    Test that objects without a batch response are reported as failed.
+    """
+    mock_existing(weaviate_client, [])
+    mock_batch.__exit__.side_effect = ConnectionError("Batch was not added to weaviate.")
+    mock_batch.add_data_object.side_effect = None
+    
+    results = weaviate_client.batch_add_documents([{"content": "lost"}])
+    
+    assert results[0]["success"] is False
+    assert "not added" in results[0]["error"]
+
+
+def test_client_side_embeddings(weaviate_client, mock_batch):
+    """
+    Test that a client-side embedder supplies object and query vectors.
+    """
+    embedder = HashingEmbedder(dimension=16, batch_size=8)
+    weaviate_client.embedder = embedder
+    weaviate_client.query_vectors = QueryVectorCache(embedder, max_entries=10)
+    query = mock_existing(weaviate_client, [])
+    query.with_near_vector.return_value = query
+    
+    weaviate_client.batch_add_documents([{"content": "alpha"}, {"content": "beta"}])
+    
+    vectors = [c.kwargs["vector"] for c in mock_batch.add_data_object.call_args_list]
+    assert vectors == embedder.embed(["alpha", "beta"]).tolist()
+    
+    for _ in range(2):
+        weaviate_client.search_similar("alpha", limit=3)
+    
+    query.with_near_text.assert_not_called()
+    assert query.with_near_vector.call_args.args[0]["vector"] == vectors[0]
+    assert weaviate_client.query_vectors.stats()["hits"] == 1
+
+
+@pytest.mark.parametrize(
+    "mode, clause",
+    [
+        ("vector", "nearText:"),
+        ("keyword", "bm25:"),
+        ("hybrid", "hybrid:"),
+    ],
+)
+def test_search_modes(weaviate_client, mode, clause):
+    """
+    Test that each search mode builds its Weaviate query and reports the score.
+    """
+    weaviate_client.settings = Settings()
+    weaviate_client.client.query.get.side_effect = (
+        lambda class_name, properties: GetBuilder(class_name, properties, None)
+    )
+    
+    query = weaviate_client._build_search_query("AsyncWebCrawler.arun", 5, mode=mode)
+    
+    assert clause in query.build()
+    if mode == "hybrid":
+        assert "alpha: 0.5" in query.build()
+        assert "relativeScoreFusion" in query.build()
+    
+    results = weaviate_client._transform_results([
+        {"content": "arun", "_additional": {"id": "a", "score": "0.8", "certainty": None}}
+    ])
+    assert results[0]["score"] == 0.8
+
+
+def test_search_many_uses_one_aliased_query(weaviate_client):
+    """
+    Test that a batch of searches is one multi-Get request, answered in order.
+    """
+    weaviate_client.settings = Settings()
+    weaviate_client.client.query.get.side_effect = (
+        lambda class_name, properties: GetBuilder(class_name, properties, None)
+    )
+    weaviate_client.client.query.multi_get.return_value.do.return_value = {
+        "data": {
+            "Get": {
+                "q0": [{"content": "first", "_additional": {"id": "a", "certainty": 0.9}}],
+                "q1": [],
+            }
+        }
+    }
+    
+    responses = weaviate_client.search_many([
+        {"query": "crawl", "limit": 3},
+        {"query": "arun", "limit": 5, "mode": "keyword"},
+    ])
+    
+    weaviate_client.client.query.multi_get.assert_called_once()
+    builders = weaviate_client.client.query.multi_get.call_args.args[0]
+    assert [builder.build().split("(")[0] for builder in builders] == [
+        "{Get{q0: Documentation",
+        "{Get{q1: Documentation",
+    ]
+    assert responses[0][0][0]["id"] == "a"
+    assert responses[1] == ([], 0)
+
+
+def test_search_fails_fast_while_weaviate_is_down(weaviate_client):
+    """
+    Test that failing searches raise instead of returning placeholder results
+    and that the open circuit rejects searches without calling Weaviate.
+    """
+    weaviate_client.settings = Settings()
+    query = mock_existing(weaviate_client, [])
+    query.with_near_text.return_value = query
+    query.do.side_effect = ConnectionError("Weaviate is down")
+    
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            weaviate_client.search_similar("crawl")
+    
+    with pytest.raises(CircuitOpenError):
+        weaviate_client.search_similar("crawl")
+    results = weaviate_client.batch_add_documents([{"content": "page"}])
+    
+    assert "circuit open" in results[0]["error"]
+    assert query.do.call_count == 2
+    weaviate_client.client.batch.assert_not_called()
+
+
+def test_delete_where_repeats_batch_deletes(weaviate_client):
+    """
+    Test that a bulk delete repeats batch deletes until no full page remains.
+    """
+    aggregate = weaviate_client.client.query.aggregate.return_value
+    aggregate.with_where.return_value = aggregate
+    aggregate.with_meta_count.return_value = aggregate
+    aggregate.do.return_value = {
+        "data": {"Aggregate": {DOC_CLASS_NAME: [{"meta": {"count": 3}}]}}
+    }
+    weaviate_client.client.batch.delete_objects.side_effect = [
+        {"results": {"matches": 2, "limit": 2, "successful": 2, "failed": 0}},
+        {"results": {"matches": 1, "limit": 2, "successful": 1, "failed": 0}},
+    ]
+    
+    result = weaviate_client.delete_where(source="crawl4ai", url_prefix="https://docs/")
+    
+    assert result == {"matched": 3, "deleted": 3, "failed": 0, "dry_run": False}
+    where = weaviate_client.client.batch.delete_objects.call_args.kwargs["where"]
+    assert where["operator"] == "And"
+    assert where["operands"][1] == {
+        "path": ["url"], "operator": "Like", "valueText": "https://docs/*"
+    }
+    assert weaviate_client.search_cache.generation == 1
+    
+    with pytest.raises(ValueError):
+        weaviate_client.delete_where()
+
+
+def test_delete_documents_is_a_single_batch_delete(weaviate_client):
+    """
+    Test that several objects are deleted with one id-filtered batch delete.
+    """
+    weaviate_client.client.batch.delete_objects.return_value = {
+        "results": {"matches": 2, "limit": 10000, "successful": 2, "failed": 0}
+    }
+    
+    assert weaviate_client.delete_documents(["a", "b", "a"]) == 2
+    
+    weaviate_client.client.batch.delete_objects.assert_called_once()
+    where = weaviate_client.client.batch.delete_objects.call_args.kwargs["where"]
+    assert where["operator"] == "Or"
+    assert len(where["operands"]) == 2
+    assert weaviate_client.search_cache.generation == 1
+    
+    weaviate_client.client.batch.delete_objects.return_value = {
+        "results": {"matches": 1, "limit": 10000, "successful": 0, "failed": 1}
+    }
+    with pytest.raises(RuntimeError):
+        weaviate_client.delete_documents(["a"])
+
+
+def test_delete_where_rejects_wildcard_url_prefixes(weaviate_client):
+    """
+    Test that a URL prefix cannot widen a bulk delete with Like wildcards.
+    """
+    for url_prefix in ("https://docs/*", "https://docs/v?"):
+        with pytest.raises(ValueError):
+            weaviate_client.delete_where(url_prefix=url_prefix)
+    
+    weaviate_client.client.batch.delete_objects.assert_not_called()
+
+
+def test_delete_where_goes_through_the_circuit_breaker(weaviate_client):
+    """
+    Test that failing batch deletes are recorded by the circuit breaker.
+    """
+    aggregate = weaviate_client.client.query.aggregate.return_value
+    aggregate.with_where.return_value = aggregate
+    aggregate.with_meta_count.return_value = aggregate
+    aggregate.do.return_value = {
+        "data": {"Aggregate": {DOC_CLASS_NAME: [{"meta": {"count": 1}}]}}
+    }
+    weaviate_client.client.batch.delete_objects.side_effect = ConnectionError("down")
+    
+    with pytest.raises(ConnectionError):
+        weaviate_client.delete_where(version="1.0")
+    
+    assert weaviate_client.breaker.stats()["consecutive_failures"] == 1
+
+
+def test_delete_where_counts_failed_objects_once(weaviate_client):
+    """
+    Test that objects matched again after failing to delete are not counted twice.
+    """
+    aggregate = weaviate_client.client.query.aggregate.return_value
+    aggregate.with_where.return_value = aggregate
+    aggregate.with_meta_count.return_value = aggregate
+    aggregate.do.return_value = {
+        "data": {"Aggregate": {DOC_CLASS_NAME: [{"meta": {"count": 2}}]}}
+    }
+    weaviate_client.client.batch.delete_objects.side_effect = [
+        {"results": {"matches": 2, "limit": 2, "successful": 1, "failed": 1}},
+        {"results": {"matches": 1, "limit": 2, "successful": 0, "failed": 1}},
+    ]
+    
+    result = weaviate_client.delete_where(version="1.0")
+    
+    assert result == {"matched": 2, "deleted": 1, "failed": 1, "dry_run": False}
+
+
+def test_delete_where_dry_run_only_counts(weaviate_client):
+    """
+    Test that a dry run counts matches without deleting anything.
+    """
+    aggregate = weaviate_client.client.query.aggregate.return_value
+    aggregate.with_where.return_value = aggregate
+    aggregate.with_meta_count.return_value = aggregate
+    aggregate.do.return_value = {
+        "data": {"Aggregate": {DOC_CLASS_NAME: [{"meta": {"count": 42}}]}}
+    }
+    
+    result = weaviate_client.delete_where(version="1.0", dry_run=True)
+    
+    assert result["matched"] == 42
+    assert result["dry_run"] is True
+    weaviate_client.client.batch.delete_objects.assert_not_called()
+
+
+def test_search_applies_compound_filters(weaviate_client):
+    """
+    Test that multiple filters become one valid where clause on the query.
+    """
+    weaviate_client.settings = Settings()
+    weaviate_client.client.query.get.side_effect = (
+        lambda class_name, properties: GetBuilder(class_name, properties, None)
+    )
+    
+    query = weaviate_client._build_search_query(
+        "crawl", 5, filters={"source": "crawl4ai", "version": "latest"}
+    ).build()
+    
+    assert "where: {operator: And operands: [" in query
+    assert 'path: ["source"] operator: Equal valueText: "crawl4ai"' in query
+    
+    with pytest.raises(ValueError):
+        weaviate_client._build_search_query("crawl", 5, filters={"content": "x"})
+
+
+@pytest.fixture
+def partitioned_client(weaviate_client):
+    """
+    Partition the mock client's class by source with two existing tenants.
+    """
+    weaviate_client.settings = Settings()
+    weaviate_client.client.schema.get_class_tenants.return_value = [
+        Tenant(name="alpha"), Tenant(name="beta")
+    ]
+    weaviate_client.tenants = TenantRegistry(weaviate_client.client.schema, DOC_CLASS_NAME)
+    weaviate_client.client.query.get.side_effect = (
+        lambda class_name, properties: GetBuilder(class_name, properties, None)
+    )
+    return weaviate_client
+
+
+def test_partitioned_search_queries_selected_tenants(partitioned_client):
+    """
+    Test that a source filter limits the search to that source's tenant and
+    that results from several tenants are merged by score.
+    """
+    multi_get = partitioned_client.client.query.multi_get
+    multi_get.return_value.do.return_value = {
+        "data": {
+            "Get": {
+                "q0_0": [{"content": "a", "_additional": {"id": "a", "certainty": 0.7}}],
+                "q0_1": [{"content": "b", "_additional": {"id": "b", "certainty": 0.9}}],
+            }
+        }
+    }
+    
+    results, _ = partitioned_client.search_similar("crawl", limit=1)
+    
+    tenants = [builder.build() for builder in multi_get.call_args.args[0]]
+    assert len(tenants) == 2
+    assert [result["id"] for result in results] == ["b"]
+    
+    partitioned_client.search_similar("crawl", filters={"source": "beta"})
+    
+    builders = multi_get.call_args.args[0]
+    assert len(builders) == 1
+    assert 'tenant: "beta"' in builders[0].build()
+
+
+def test_search_finds_tenants_created_by_other_processes(partitioned_client, monkeypatch):
+    """
+    Test that a source filter naming an unknown tenant re-reads the tenants.
+    """
+    monkeypatch.setattr(tenants_module, "REFRESH_INTERVAL_SECONDS", 0)
+    partitioned_client.client.schema.get_class_tenants.return_value = [
+        Tenant(name="alpha"), Tenant(name="beta"), Tenant(name="gamma")
+    ]
+    multi_get = partitioned_client.client.query.multi_get
+    multi_get.return_value.do.return_value = {"data": {"Get": {}}}
+    
+    partitioned_client.search_similar("crawl", filters={"source": "gamma"})
+    
+    builders = multi_get.call_args.args[0]
+    assert 'tenant: "gamma"' in builders[0].build()
+
+
+def test_deleting_a_source_drops_its_tenant(partitioned_client):
+    """
+    Test that deleting a whole source removes its tenant in one call.
+    """
+    aggregate = partitioned_client.client.query.aggregate.return_value
+    aggregate.with_meta_count.return_value = aggregate
+    aggregate.with_tenant.return_value = aggregate
+    aggregate.do.return_value = {
+        "data": {"Aggregate": {DOC_CLASS_NAME: [{"meta": {"count": 7}}]}}
+    }
+    
+    result = partitioned_client.delete_where(source="alpha")
+    
+    assert result["deleted"] == 7
+    partitioned_client.client.schema.remove_class_tenants.assert_called_once_with(
+        DOC_CLASS_NAME, ["alpha"]
+    )
+    partitioned_client.client.batch.delete_objects.assert_not_called()
+    assert partitioned_client.tenants.active() == ["beta"]
+    assert result["dropped_tenant"] == "alpha"
+
+
+def test_deleting_an_inactive_source_reports_a_tenant_drop(partitioned_client):
+    """
+    Test that dropping an inactive tenant does not claim zero objects were deleted.
+    """
+    partitioned_client.tenants.set_active("beta", False)
+    
+    result = partitioned_client.delete_where(source="beta")
+    
+    assert result["dropped_tenant"] == "beta"
+    assert result["matched"] is None
+    assert result["deleted"] is None
+    partitioned_client.client.query.aggregate.assert_not_called()
+
+
+def test_delete_where_reports_skipped_inactive_tenants(partitioned_client):
+    """
+    Test that a bulk delete across sources reports the inactive tenants it skips.
+    """
+    partitioned_client.tenants.set_active("beta", False)
+    aggregate = partitioned_client.client.query.aggregate.return_value
+    aggregate.with_where.return_value = aggregate
+    aggregate.with_meta_count.return_value = aggregate
+    aggregate.with_tenant.return_value = aggregate
+    aggregate.do.return_value = {
+        "data": {"Aggregate": {DOC_CLASS_NAME: [{"meta": {"count": 1}}]}}
+    }
+    partitioned_client.client.batch.delete_objects.return_value = {
+        "results": {"matches": 1, "limit": 10, "successful": 1, "failed": 0}
+    }
+    
+    result = partitioned_client.delete_where(version="1.0")
+    
+    assert result["skipped_tenants"] == ["beta"]
+    assert result["deleted"] == 1
+    tenants = [
+        call.kwargs["tenant"]
+        for call in partitioned_client.client.batch.delete_objects.call_args_list
+    ]
+    assert tenants == ["alpha"]
+
+
+def test_product_quantization_waits_for_training_data(weaviate_client):
+    """
+    Test that PQ is only enabled once the class holds enough objects to train
+    on, while other index settings are updated right away.
+    """
+    weaviate_client.settings = Settings(
+        weaviate_hnsw_ef=200,
+        weaviate_vector_quantization="pq",
+        weaviate_pq_training_limit=10,
+    )
+    weaviate_client.client.schema.get.return_value = {
+        "vectorIndexConfig": {
+            "ef": -1,
+            "efConstruction": 128,
+            "maxConnections": 64,
+            "vectorCacheMaxObjects": 1000000000000,
+        }
+    }
+    aggregate = weaviate_client.client.query.aggregate.return_value
+    aggregate.with_meta_count.return_value = aggregate
+    aggregate.do.return_value = {
+        "data": {"Aggregate": {DOC_CLASS_NAME: [{"meta": {"count": 5}}]}}
+    }
+    
+    weaviate_client._ensure_vector_index()
+    
+    update_config = weaviate_client.client.schema.update_config
+    update_config.assert_called_once_with(
+        DOC_CLASS_NAME, {"vectorIndexConfig": {"ef": 200}}
+    )
+    
+    aggregate.do.return_value = {
+        "data": {"Aggregate": {DOC_CLASS_NAME: [{"meta": {"count": 50}}]}}
+    }
+    weaviate_client._ensure_vector_index()
+    
+    update = update_config.call_args.args[1]["vectorIndexConfig"]
+    assert update["pq"]["enabled"] is True
@@ -0,0 +1,3 @@
+"""
+Tests for the summarization module.
+"""
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Tests for the SummaryBatchManager.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.summarization.batch import SummaryBatchManager
+from src.utils.config import Settings
+from src.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def mock_summarization_service():
+    """
+    Create a mock summarization service that fails on one document set.
+    """
+    async def fake_generate_summary(documents, **kwargs):
+        await asyncio.sleep(0)
+        if documents == ["bad"]:
+            raise RuntimeError("LLM error")
+        return f"summary-{documents[0]}", "Test summary", {}
+    
+    service = MagicMock()
+    service.generate_summary = AsyncMock(side_effect=fake_generate_summary)
+    service.raptor.aclose = AsyncMock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_per_item_results(mock_summarization_service):
+    """
+    Test that a batch runs every item and streams per-item completion.
+    """
+    manager = SummaryBatchManager(
+        Settings(summary_batch_concurrency=2),
+        service=mock_summarization_service,
+        metrics=MetricsRegistry(),
+    )
+    manager.start()
+    
+    try:
+        batch = manager.submit([
+            {"documents": ["a"]},
+            {"documents": ["bad"]},
+            {"documents": ["c"]},
+        ])
+        streamed = [item async for item in batch.stream()]
+    finally:
+        await manager.stop()
+    
+    assert sorted(item["index"] for item in streamed) == [0, 1, 2]
+    result = manager.get(batch.batch_id).to_dict()
+    assert result["status"] == "completed"
+    assert result["completed"] == 2
+    assert result["failed"] == 1
+    assert result["items"][0]["summary_id"] == "summary-a"
+    assert result["items"][1]["error"] == "LLM error"
+
+
+def test_submit_rejects_oversized_batch(mock_summarization_service):
+    """
+    Test that batches above the configured maximum are rejected.
+    """
+    manager = SummaryBatchManager(
+        Settings(summary_batch_max_items=1),
+        service=mock_summarization_service,
+        metrics=MetricsRegistry(),
+    )
+    
+    with pytest.raises(ValueError):
+        manager.submit([{"documents": ["a"]}, {"documents": ["b"]}])
+    with pytest.raises(KeyError):
+        manager.get("missing")
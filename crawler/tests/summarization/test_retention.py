@@ -0,0 +1,113 @@
+"""
+Tests for the SummaryRetentionManager.
+"""
+
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from src.summarization.retention import SummaryRetentionManager
+from src.summarization.service import get_summary_path, load_aliases, save_aliases
+from src.utils.config import Settings
+from src.utils.metrics import MetricsRegistry
+
+
+def write_summary(path, summary_id, last_access, size=100):
+    """
+    Write a summary file with a given size and access time.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"id": summary_id, "summary": "x" * size}, f)
+    os.utime(path, (last_access, last_access))
+
+
+@pytest.fixture
+def summaries_dir(tmp_path):
+    """
+    Create an empty summaries directory.
+    """
+    path = tmp_path / "summaries"
+    path.mkdir()
+    return str(path)
+
+
+def make_manager(summaries_dir, tmp_path, **overrides):
+    """
+    Create a retention manager with only the given policies enabled.
+    """
+    options = {
+        "summary_max_age_days": None,
+        "summary_max_count": None,
+        "summary_max_total_mb": None,
+        "summary_retention_action": "delete",
+        "summary_archive_dir": str(tmp_path / "archive"),
+    }
+    options.update(overrides)
+    return SummaryRetentionManager(
+        Settings(**options), summaries_dir=summaries_dir, metrics=MetricsRegistry()
+    )
+
+
+def test_compact_moves_flat_files_into_shards(summaries_dir, tmp_path):
+    """
+    Test that pre-sharding summaries are moved into hashed subdirectories.
+    """
+    write_summary(os.path.join(summaries_dir, "legacy.json"), "legacy", time.time())
+    manager = make_manager(summaries_dir, tmp_path)
+    
+    result = manager.run_once()
+    
+    assert result == {"sharded": 1, "expired": 0, "remaining": 1}
+    assert os.path.exists(get_summary_path("legacy", summaries_dir))
+    assert not os.path.exists(os.path.join(summaries_dir, "legacy.json"))
+
+
+def test_count_policy_evicts_least_recently_accessed(summaries_dir, tmp_path):
+    """
+    Test that the count policy removes the least recently accessed summaries.
+    """
+    now = time.time()
+    for i, summary_id in enumerate(["old", "middle", "new"]):
+        path = get_summary_path(summary_id, summaries_dir)
+        write_summary(path, summary_id, now - 100 + i)
+    save_aliases({"alias-old": "old", "alias-new": "new"}, summaries_dir)
+    manager = make_manager(summaries_dir, tmp_path, summary_max_count=2)
+    
+    result = manager.run_once()
+    
+    assert result["expired"] == 1
+    assert not os.path.exists(get_summary_path("old", summaries_dir))
+    assert os.path.exists(get_summary_path("middle", summaries_dir))
+    assert load_aliases(summaries_dir) == {"alias-new": "new"}
+    assert manager.metrics.counters["summary_retention_deleted"] == 1
+    assert manager.metrics.gauges["summary_store_count"] == 2
+
+
+def test_age_and_size_policies_archive_summaries(summaries_dir, tmp_path):
+    """
+    Test that age and size policies archive summaries as gzip files.
+    """
+    now = time.time()
+    write_summary(get_summary_path("stale", summaries_dir), "stale", now - 10 * 86400)
+    big_path = get_summary_path("big", summaries_dir)
+    write_summary(big_path, "big", now - 60, size=2 * 1024 * 1024)
+    write_summary(get_summary_path("fresh", summaries_dir), "fresh", now)
+    manager = make_manager(
+        summaries_dir,
+        tmp_path,
+        summary_max_age_days=7,
+        summary_max_total_mb=1,
+        summary_retention_action="archive",
+    )
+    
+    result = manager.run_once()
+    
+    assert result["expired"] == 2
+    assert os.path.exists(get_summary_path("fresh", summaries_dir))
+    archived = os.path.relpath(get_summary_path("stale", summaries_dir), summaries_dir)
+    with gzip.open(os.path.join(tmp_path, "archive", f"{archived}.gz")) as f:
+        assert json.load(f)["id"] == "stale"
@@ -0,0 +1,77 @@
+"""
+Tests for the LLMScheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from src.summarization.scheduler import PRIORITY_BULK, PRIORITY_INTERACTIVE, LLMScheduler
+from src.utils.config import Settings
+from src.utils.metrics import MetricsRegistry
+
+
+def make_scheduler(**overrides):
+    """
+    Create a scheduler without rate limiting.
+    """
+    options = {"llm_requests_per_minute": 0, "llm_interactive_reserved_slots": 0}
+    options.update(overrides)
+    return LLMScheduler(Settings(**options), metrics=MetricsRegistry())
+
+
+@pytest.mark.asyncio
+async def test_interactive_gets_next_free_slot():
+    """
+    Test that a queued interactive call is served before queued bulk work.
+    """
+    scheduler = make_scheduler(llm_max_concurrency=1)
+    order = []
+    
+    async def call(priority, name):
+        """Record the order in which slots are granted."""
+        async with scheduler.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+    
+    await scheduler.acquire(PRIORITY_BULK)
+    tasks = [
+        asyncio.create_task(call(PRIORITY_BULK, "bulk-1")),
+        asyncio.create_task(call(PRIORITY_BULK, "bulk-2")),
+    ]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(call(PRIORITY_INTERACTIVE, "interactive")))
+    await asyncio.sleep(0)
+    
+    stats = scheduler.stats()["classes"]
+    assert stats[PRIORITY_BULK]["queued"] == 2
+    assert stats[PRIORITY_INTERACTIVE]["queued"] == 1
+    
+    scheduler.release(PRIORITY_BULK)
+    await asyncio.gather(*tasks)
+    
+    assert order == ["interactive", "bulk-1", "bulk-2"]
+    assert scheduler.stats()["classes"][PRIORITY_BULK]["dispatched"] == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_cannot_use_reserved_slots():
+    """
+    Test that bulk work leaves reserved slots free for interactive calls.
+    """
+    scheduler = make_scheduler(llm_max_concurrency=2, llm_interactive_reserved_slots=1)
+    
+    await scheduler.acquire(PRIORITY_BULK)
+    waiting_bulk = asyncio.create_task(scheduler.acquire(PRIORITY_BULK))
+    await asyncio.sleep(0)
+    assert not waiting_bulk.done()
+    
+    await asyncio.wait_for(scheduler.acquire(PRIORITY_INTERACTIVE), timeout=1)
+    
+    waiting_bulk.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_bulk
+    assert scheduler.stats()["classes"][PRIORITY_BULK]["queued"] == 0
+    
+    with pytest.raises(ValueError):
+        await scheduler.acquire("unknown")
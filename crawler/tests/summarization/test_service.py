@@ -0,0 +1,121 @@
+"""
+Tests for the SummarizationService.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.summarization import service as service_module
+from src.summarization.raptor import compute_summary_id
+from src.summarization.service import SummarizationService
+from src.utils.config import Settings
+
+
+@pytest.fixture
+def summaries_dir(tmp_path, monkeypatch):
+    """
+    Point summary storage at a temporary directory.
+    """
+    path = tmp_path / "summaries"
+    monkeypatch.setattr(service_module, "SUMMARIES_DIR", str(path))
+    return path
+
+
+@pytest.fixture
+def service(summaries_dir):
+    """
+    Create a summarization service with a mocked RAPTOR processor.
+    """
+    service = SummarizationService(Settings(openai_api_key="test-openai-key"))
+    
+    async def fake_generate_summary(documents, max_tokens, hierarchy_levels, summary_id):
+        return summary_id, {
+            "id": summary_id,
+            "summary": "Test summary",
+            "hierarchical_summary": {"level": 1, "content": "Test summary", "children": []},
+            "document_count": len(documents),
+        }
+    
+    service.raptor = AsyncMock()
+    service.raptor.generate_summary.side_effect = fake_generate_summary
+    return service
+
+
+def test_compute_summary_id_normalizes_whitespace():
+    """
+    Test that cosmetic whitespace differences map to the same summary ID.
+    """
+    first = compute_summary_id(["Line one\r\nLine two  \n\n\n\nEnd"])
+    second = compute_summary_id(["Line one\nLine two\n\nEnd\n"])
+    
+    assert first == second
+    assert first != compute_summary_id(["Line one\nLine two\n\nEnd"], max_tokens=500)
+    assert compute_summary_id(["ab", "c"]) != compute_summary_id(["a", "bc"])
+
+
+@pytest.mark.asyncio
+async def test_generate_summary_reuses_stored_summary(service):
+    """
+    Test that repeated requests return the stored summary without regenerating.
+    """
+    first_id, summary, _ = await service.generate_summary(documents=["Doc A", "Doc B"])
+    second_id, _, _ = await service.generate_summary(documents=["Doc A", "Doc B"])
+    
+    assert first_id == second_id
+    assert summary == "Test summary"
+    assert service.raptor.generate_summary.call_count == 1
+    
+    await service.generate_summary(documents=["Doc A", "Doc B"], force=True)
+    assert service.raptor.generate_summary.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_a_cancelled_generation(service):
+    """
+    Test that cancelling the generating task does not leave waiters blocked.
+    """
+    fake_generate_summary = service.raptor.generate_summary.side_effect
+    started = asyncio.Event()
+    
+    async def first_call_hangs(**kwargs):
+        if not started.is_set():
+            started.set()
+            await asyncio.Event().wait()
+        return await fake_generate_summary(**kwargs)
+    
+    service.raptor.generate_summary.side_effect = first_call_hangs
+    owner = asyncio.create_task(service.generate_summary(documents=["Doc A"]))
+    await started.wait()
+    waiter = asyncio.create_task(service.generate_summary(documents=["Doc A"]))
+    await asyncio.sleep(0)
+    
+    owner.cancel()
+    summary_id, summary, _ = await asyncio.wait_for(waiter, timeout=2)
+    
+    assert summary == "Test summary"
+    assert owner.cancelled()
+    assert service.raptor.generate_summary.call_count == 2
+    assert summary_id not in service._inflight
+
+
+@pytest.mark.asyncio
+async def test_aliases_resolve_to_canonical_summary(service):
+    """
+    Test that aliases resolve on retrieval and are dropped with their summary.
+    """
+    summary_id, _, _ = await service.generate_summary(documents=["Doc A"])
+    service.add_alias("legacy-id", summary_id)
+    
+    summary = await service.get_summary("legacy-id")
+    assert summary["id"] == summary_id
+    
+    summaries = await service.list_summaries()
+    assert [s["id"] for s in summaries] == [summary_id]
+    
+    await service.delete_summary("legacy-id")
+    with pytest.raises(KeyError):
+        await service.get_summary(summary_id)
+    with pytest.raises(KeyError):
+        await service.get_summary("legacy-id")
@@ -0,0 +1,95 @@
+"""
+Tests for the circuit breaker.
+"""
+
+import time
+
+import pytest
+
+from src.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.utils.metrics import MetricsRegistry
+
+
+def fail():
+    """Raise like an unreachable service."""
+    raise ConnectionError("unreachable")
+
+
+@pytest.fixture
+def breaker():
+    """
+    Create a breaker that opens after two failures and probes after 50ms.
+    """
+    return CircuitBreaker(
+        "test",
+        failure_threshold=2,
+        recovery_timeout=0.05,
+        slow_call_seconds=0.02,
+        metrics=MetricsRegistry(),
+    )
+
+
+def test_opens_after_consecutive_failures(breaker):
+    """
+    Test that the breaker opens at the threshold and then rejects calls.
+    """
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+    
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.call(lambda: "not called")
+    
+    assert error.value.retry_after > 0
+    assert breaker.stats()["state"] == "open"
+    assert breaker.stats()["rejected"] == 1
+    assert breaker.metrics.gauges["circuit_breaker_open{breaker=test}"] == 1
+
+
+def test_success_resets_failure_count(breaker):
+    """
+    Test that only consecutive failures open the breaker.
+    """
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    assert breaker.call(lambda: "ok") == "ok"
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    
+    assert breaker.state == "closed"
+
+
+def test_slow_calls_count_as_failures(breaker):
+    """
+    Test that calls slower than the latency threshold open the breaker.
+    """
+    for _ in range(2):
+        assert breaker.call(time.sleep, 0.03) is None
+    
+    assert breaker.state == "open"
+
+
+def test_probe_closes_or_reopens(breaker):
+    """
+    Test that one probe is let through after the recovery timeout.
+    """
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+    time.sleep(0.06)
+    
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    assert breaker.state == "open"
+    
+    time.sleep(0.06)
+    breaker.allow()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    breaker.record_success()
+    
+    assert breaker.state == "closed"
+    transitions = breaker.metrics.counters
+    assert transitions["circuit_breaker_transitions{breaker=test,state=open}"] == 2
+    assert transitions["circuit_breaker_transitions{breaker=test,state=closed}"] == 1
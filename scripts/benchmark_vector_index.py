@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark Weaviate vector index configurations.
+
+Loads the same synthetic vectors into a scratch class once per configuration
+(HNSW ef/maxConnections, product and binary quantization) and reports the
+estimated index memory, recall@k against exact nearest neighbours and query
+latency. The configurations are built with the crawler's own settings, so a
+winning row maps directly to WEAVIATE_* environment variables.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import weaviate
+
+# Reuse the crawler's index configuration
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "crawler"))
+
+from src.embedding.vector_index import estimate_index_memory, pq_config, vector_index_config  # noqa: E402
+from src.utils.config import Settings  # noqa: E402
+
+CLASS_NAME = "VectorIndexBenchmark"
+
+# Settings overrides per configuration
+CONFIGURATIONS = {
+    "baseline": {},
+    "ef-64": {"weaviate_hnsw_ef": 64},
+    "ef-256": {"weaviate_hnsw_ef": 256},
+    "m-32": {"weaviate_hnsw_max_connections": 32},
+    "pq": {"weaviate_vector_quantization": "pq"},
+    "bq": {"weaviate_vector_quantization": "bq"},
+}
+
+
+def make_vectors(count, dimension, clusters, rng):
+    """
+    Generate unit vectors grouped around random centers, like embeddings of
+    pages from a few documentation sites.
+    """
+    centers = rng.normal(size=(clusters, dimension))
+    labels = rng.integers(0, clusters, size=count)
+    vectors = centers[labels] + 0.5 * rng.normal(size=(count, dimension))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def exact_neighbours(data, queries, k):
+    """
+    Find the exact top-k neighbours of each query by cosine similarity.
+    """
+    similarities = queries @ data.T
+    top = np.argpartition(-similarities, k, axis=1)[:, :k]
+    return [set(row) for row in top]
+
+
+def load(client, settings, data, batch_size):
+    """
+    Recreate the scratch class with a configuration and import the vectors.
+    """
+    if client.schema.exists(CLASS_NAME):
+        client.schema.delete_class(CLASS_NAME)
+
+    client.schema.create_class({
+        "class": CLASS_NAME,
+        "vectorizer": "none",
+        "vectorIndexType": "hnsw",
+        "vectorIndexConfig": vector_index_config(settings, with_pq=False),
+        "properties": [{"name": "index", "dataType": ["int"]}],
+    })
+
+    started = time.perf_counter()
+    client.batch.configure(batch_size=batch_size)
+    with client.batch as batch:
+        for i, vector in enumerate(data):
+            batch.add_data_object({"index": i}, CLASS_NAME, vector=vector.tolist())
+
+    # Like the crawler, train PQ on the imported vectors
+    if settings.weaviate_vector_quantization == "pq":
+        client.schema.update_config(CLASS_NAME, {"vectorIndexConfig": {"pq": pq_config(settings)}})
+
+    return time.perf_counter() - started
+
+
+def measure(client, queries, truth, k):
+    """
+    Run the queries and measure recall@k and latency.
+    """
+    latencies = []
+    hits = 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        response = (
+            client.query.get(CLASS_NAME, ["index"])
+            .with_near_vector({"vector": query.tolist()})
+            .with_limit(k)
+            .do()
+        )
+        latencies.append(time.perf_counter() - started)
+
+        if "errors" in response:
+            raise RuntimeError(f"Query failed: {response['errors']}")
+        found = {obj["index"] for obj in response["data"]["Get"][CLASS_NAME]}
+        hits += len(found & expected)
+
+    latencies = np.array(latencies) * 1000
+    return {
+        "recall": hits / (k * len(queries)),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8081", help="Weaviate URL")
+    parser.add_argument("--objects", type=int, default=20000, help="Vectors to import")
+    parser.add_argument("--dimension", type=int, default=384, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per configuration")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    parser.add_argument("--batch-size", type=int, default=200, help="Objects per import batch")
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        choices=sorted(CONFIGURATIONS),
+        default=list(CONFIGURATIONS),
+        help="Configurations to benchmark",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    data = make_vectors(args.objects, args.dimension, clusters=50, rng=rng)
+    queries = make_vectors(args.queries, args.dimension, clusters=50, rng=rng)
+    truth = exact_neighbours(data, queries, args.k)
+
+    client = weaviate.Client(args.url)
+    rows = []
+    try:
+        for name in args.configs:
+            settings = Settings(
+                weaviate_pq_training_limit=min(args.objects, 100000),
+                **CONFIGURATIONS[name],
+            )
+            print(f"Benchmarking {name}...")
+            import_seconds = load(client, settings, data, args.batch_size)
+            memory = estimate_index_memory(
+                args.objects,
+                args.dimension,
+                settings.weaviate_hnsw_max_connections,
+                settings.weaviate_vector_quantization,
+                settings.weaviate_pq_segments,
+            )
+            rows.append((name, import_seconds, memory, measure(client, queries, truth, args.k)))
+    finally:
+        if client.schema.exists(CLASS_NAME):
+            client.schema.delete_class(CLASS_NAME)
+
+    print(f"\n{args.objects} vectors of dimension {args.dimension}, recall@{args.k}")
+    print(f"{'config':<10} {'import s':>9} {'vectors MB':>11} {'graph MB':>9} "
+          f"{'recall':>7} {'p50 ms':>7} {'p95 ms':>7}")
+    for name, import_seconds, memory, result in rows:
+        print(
+            f"{name:<10} {import_seconds:>9.1f} {memory['vectors'] / 2**20:>11.1f} "
+            f"{memory['graph'] / 2**20:>9.1f} {result['recall']:>7.3f} "
+            f"{result['p50_ms']:>7.2f} {result['p95_ms']:>7.2f}"
+        )
+    print("\nMemory is estimated from the index settings; graph memory is an upper bound.")
+
+
+if __name__ == "__main__":
+    main()